@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Compara os dois caminhos de leitura dos repositórios: instâncias de modelo
+do Tortoise (hydrated) e linhas .values() mapeadas direto para entidades
+(fast_reads). Lê páginas de agendamentos do banco em DATABASE_URL, sem
+alterar dados.
+
+Uso: python scripts/benchmark_read_paths.py [iterações] [page_size]
+"""
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from tortoise import Tortoise
+
+from t1_construcao.infrastructure._tortoise_config import TORTOISE_ORM
+from t1_construcao.infrastructure.repositories import AppointmentRepository
+
+
+async def benchmark_path(fast_reads: bool, iterations: int, page_size: int) -> float:
+    """Devolve o número de agendamentos lidos por segundo no caminho escolhido."""
+    AppointmentRepository.fast_reads = fast_reads
+    repository = AppointmentRepository()
+
+    # Aquecimento
+    await repository.get_all(page_size=page_size, include_total="none")
+
+    rows = 0
+    start = time.perf_counter()
+    for _ in range(iterations):
+        appointments, _, _ = await repository.get_all(
+            page_size=page_size, include_total="none"
+        )
+        rows += len(appointments)
+    elapsed = time.perf_counter() - start
+
+    return rows / elapsed
+
+
+async def main(iterations: int, page_size: int) -> None:
+    await Tortoise.init(config=TORTOISE_ORM)
+    try:
+        print(f"📚 Reading {iterations} pages of {page_size} appointments per path...")
+        results = {
+            "hydrated": await benchmark_path(False, iterations, page_size),
+            "fast_reads": await benchmark_path(True, iterations, page_size),
+        }
+    finally:
+        await Tortoise.close_connections()
+
+    if not any(results.values()):
+        print("   No appointments found, seed the database first.")
+        return
+
+    fastest = max(results, key=results.__getitem__)
+    for path, rate in sorted(results.items(), key=lambda item: -item[1]):
+        marker = " (fastest)" if path == fastest else ""
+        print(f"   {path:<12} {rate:>10,.0f} rows/s{marker}")
+
+
+if __name__ == "__main__":
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    page_size = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    asyncio.run(main(iterations, page_size))
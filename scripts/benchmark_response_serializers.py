@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Compara os dois caminhos de serialização da listagem de agendamentos numa
+página (PaginatedResponse) de 100 itens, sem banco nem HTTP:
+
+- pydantic: entidades -> AppointmentResponseDto -> validação pelo
+  response_model da rota e serialização do FastAPI -> JSONResponse
+- msgspec: entidades -> structs -> MsgspecJSONResponse
+
+Confere antes que os dois produzem exatamente o mesmo corpo.
+
+Uso: python scripts/benchmark_response_serializers.py [iterações] [itens]
+"""
+import asyncio
+import os
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+# A app só é importada para obter a rota; não é iniciada
+os.environ.setdefault("DATABASE_URL", "sqlite://:memory:")
+os.environ.setdefault("JWT_ISSUER", "https://benchmark-issuer.local")
+os.environ.setdefault("JWT_AUDIENCE", "benchmark-audience")
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute, serialize_response
+
+from t1_construcao.main import app
+from t1_construcao.application.dtos import PaginatedResponseStruct
+from t1_construcao.application.usecases.assemblers import (
+    to_appointment_dto,
+    to_appointment_struct,
+)
+from t1_construcao.domain import AppointmentEntity
+from t1_construcao.shared.msgspec_response import MsgspecJSONResponse
+
+
+def make_appointments(count: int) -> list[AppointmentEntity]:
+    now = datetime(2030, 1, 1, 8, 0, tzinfo=timezone.utc)
+    return [
+        AppointmentEntity(
+            id=f"00000000-0000-4000-8000-{i:012d}",
+            user_id="11111111-1111-4111-8111-111111111111",
+            service_id="22222222-2222-4222-8222-222222222222",
+            scheduled_at=now + timedelta(hours=i),
+            status="confirmed" if i % 3 else "pending",
+            notes="Chegar 10 minutos antes" if i % 2 else None,
+            created_at=now,
+            updated_at=now,
+        )
+        for i in range(count)
+    ]
+
+
+def page(items: list, count: int) -> dict:
+    return {
+        "items": items,
+        "total": count,
+        "page": 1,
+        "page_size": count,
+        "total_pages": 1,
+        "cursor": None,
+        "next_cursor": None,
+    }
+
+
+def list_route() -> APIRoute:
+    return next(
+        route
+        for route in app.routes
+        if isinstance(route, APIRoute)
+        and route.path == "/api/v1/appointments/"
+        and "GET" in route.methods
+    )
+
+
+async def pydantic_body(
+    route: APIRoute, appointments: list[AppointmentEntity]
+) -> bytes:
+    items = [to_appointment_dto(appointment) for appointment in appointments]
+    content = await serialize_response(
+        field=route.secure_cloned_response_field,
+        response_content=page(items, len(items)),
+        exclude_unset=route.response_model_exclude_unset,
+    )
+    return JSONResponse(content).body
+
+
+async def msgspec_body(
+    _route: APIRoute, appointments: list[AppointmentEntity]
+) -> bytes:
+    items = [to_appointment_struct(appointment) for appointment in appointments]
+    return MsgspecJSONResponse(PaginatedResponseStruct(**page(items, len(items)))).body
+
+
+async def benchmark(path, route, appointments, iterations: int) -> float:
+    """Devolve o número de respostas serializadas por segundo."""
+    await path(route, appointments)  # Aquecimento
+    start = time.perf_counter()
+    for _ in range(iterations):
+        await path(route, appointments)
+    return iterations / (time.perf_counter() - start)
+
+
+async def main(iterations: int, count: int) -> None:
+    route = list_route()
+    appointments = make_appointments(count)
+
+    if await pydantic_body(route, appointments) != await msgspec_body(
+        route, appointments
+    ):
+        raise SystemExit("The serializers produced different bodies")
+
+    print(f"📦 Serializing {iterations} pages of {count} appointments per path...")
+    results = {
+        "pydantic": await benchmark(pydantic_body, route, appointments, iterations),
+        "msgspec": await benchmark(msgspec_body, route, appointments, iterations),
+    }
+
+    slowest = min(results.values())
+    for path, rate in sorted(results.items(), key=lambda item: -item[1]):
+        print(
+            f"   {path:<10} {rate:>10,.0f} responses/s "
+            f"({1e6 / rate:>8,.1f} µs, {rate / slowest:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    count = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    asyncio.run(main(iterations, count))
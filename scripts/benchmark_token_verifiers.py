@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark dos backends de verificação de tokens.
+Gera uma chave RSA local, emite tokens RS256 e mede quantas verificações
+por segundo cada backend de t1_construcao.shared.token_verifiers consegue.
+
+Uso: python scripts/benchmark_token_verifiers.py [iterações]
+"""
+import sys
+import time
+from pathlib import Path
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jose import jwk, jwt
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from t1_construcao.shared.token_verifiers import (
+    TOKEN_VERIFIERS,
+    create_token_verifier,
+)
+
+ISSUER = "https://benchmark-issuer.local"
+AUDIENCE = "benchmark-audience"
+KID = "benchmark-kid"
+
+
+def generate_key_pair() -> tuple[bytes, dict]:
+    """Gera uma chave RSA 2048 e devolve (PEM privado, JWK público)."""
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    private_pem = private_key.private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption(),
+    )
+    public_pem = private_key.public_key().public_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PublicFormat.SubjectPublicKeyInfo,
+    )
+    public_jwk = jwk.construct(public_pem, "RS256").to_dict()
+    public_jwk["kid"] = KID
+    return private_pem, public_jwk
+
+
+def mint_tokens(private_pem: bytes, count: int) -> list[str]:
+    """Emite 'count' tokens distintos, semelhantes aos access tokens do Cognito."""
+    now = int(time.time())
+    return [
+        jwt.encode(
+            {
+                "sub": f"user-{i}",
+                "iss": ISSUER,
+                "aud": AUDIENCE,
+                "iat": now,
+                "nbf": now,
+                "exp": now + 3600,
+                "cognito:groups": ["client"],
+            },
+            private_pem,
+            algorithm="RS256",
+            headers={"kid": KID},
+        )
+        for i in range(count)
+    ]
+
+
+def benchmark_backend(backend: str, public_jwk: dict, tokens: list[str]) -> float:
+    """Devolve o número de verificações por segundo do backend."""
+    verifier = create_token_verifier(backend, ISSUER, AUDIENCE)
+    key = verifier.construct_key(public_jwk)
+
+    # Aquecimento
+    for token in tokens[:10]:
+        verifier.verify(token, key)
+
+    start = time.perf_counter()
+    for token in tokens:
+        verifier.get_unverified_header(token)
+        verifier.verify(token, key)
+    elapsed = time.perf_counter() - start
+
+    return len(tokens) / elapsed
+
+
+if __name__ == "__main__":
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+
+    print(f"🔑 Generating RSA key and minting {iterations} tokens...")
+    private_pem, public_jwk = generate_key_pair()
+    tokens = mint_tokens(private_pem, iterations)
+
+    results = {
+        backend: benchmark_backend(backend, public_jwk, tokens)
+        for backend in TOKEN_VERIFIERS
+    }
+
+    fastest = max(results, key=results.__getitem__)
+    for backend, rate in sorted(results.items(), key=lambda item: -item[1]):
+        marker = " (fastest)" if backend == fastest else ""
+        print(f"   {backend:<14} {rate:>10,.0f} verifications/s{marker}")
@@ -2,3 +2,5 @@ from .user_dtos import *
 from .service_dtos import *
 from .appointment_dtos import *
 from .pagination_dtos import *
+from .monitoring_dtos import *
+from .response_structs import *
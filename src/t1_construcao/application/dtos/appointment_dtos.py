@@ -1,4 +1,8 @@
-from pydantic import BaseModel, Field
+from typing import Literal
+from pydantic import BaseModel, Field, model_validator
+from .pagination_dtos import IncludeTotal
+from .service_dtos import ServiceResponseDto
+from .user_dtos import UserResponseDto
 from datetime import datetime
 
 
@@ -6,9 +10,18 @@ __all__ = [
     "CreateAppointmentDto",
     "UpdateAppointmentDto",
     "AppointmentResponseDto",
+    "AppointmentExpand",
+    "AppointmentExpandedResponseDto",
+    "AppointmentSparseResponseDto",
     "AppointmentListFilterDto",
     "ConfirmAppointmentDto",
     "CancelAppointmentDto",
+    "BulkCreateAppointmentsDto",
+    "BulkAppointmentResultDto",
+    "BulkCreateAppointmentsResponseDto",
+    "BulkConfirmAppointmentsDto",
+    "BulkCancelAppointmentsDto",
+    "BulkAppointmentStatusResponseDto",
 ]
 
 
@@ -42,11 +55,95 @@ class AppointmentResponseDto(BaseModel):
     updated_at: datetime
 
 
+# Related resources that appointment reads can embed with ?expand=
+AppointmentExpand = Literal["service", "user"]
+
+
+class AppointmentExpandedResponseDto(AppointmentResponseDto):
+    service: ServiceResponseDto | None = Field(
+        None, description="Serviço do agendamento, quando expand inclui 'service'"
+    )
+    user: UserResponseDto | None = Field(
+        None, description="Usuário do agendamento, quando expand inclui 'user'"
+    )
+
+
+class AppointmentSparseResponseDto(BaseModel):
+    """
+    Agendamento restrito aos campos pedidos em 'fields' (e aos recursos de
+    'expand'); os demais campos são omitidos da resposta.
+    """
+
+    id: str | None = None
+    user_id: str | None = None
+    service_id: str | None = None
+    scheduled_at: datetime | None = None
+    status: str | None = None
+    notes: str | None = None
+    created_at: datetime | None = None
+    updated_at: datetime | None = None
+    service: ServiceResponseDto | None = None
+    user: UserResponseDto | None = None
+
+
 class AppointmentListFilterDto(BaseModel):
     user_id: str | None = None
     service_id: str | None = None
     status: str | None = None
     start_date: datetime | None = None
     end_date: datetime | None = None
-    page: int = Field(1, ge=1)
-    page_size: int = Field(10, ge=1, le=100)
+    page: int = Field(default=1, ge=1)
+    page_size: int = Field(default=10, ge=1, le=100)
+    cursor: str | None = None
+    include_total: IncludeTotal = "exact"
+    expand: set[AppointmentExpand] = Field(default_factory=set)
+    fields: tuple[str, ...] | None = None
+
+
+class BulkCreateAppointmentsDto(BaseModel):
+    items: list[CreateAppointmentDto] = Field(..., min_length=1, max_length=500)
+
+
+class BulkAppointmentResultDto(BaseModel):
+    index: int = Field(..., description="Posição do item na requisição")
+    status_code: int
+    appointment: AppointmentResponseDto | None = None
+    detail: str | None = None
+
+
+class BulkCreateAppointmentsResponseDto(BaseModel):
+    created: int
+    failed: int
+    results: list[BulkAppointmentResultDto]
+
+
+class BulkConfirmAppointmentsDto(BaseModel):
+    appointment_ids: list[str] | None = Field(
+        default=None, min_length=1, max_length=1000
+    )
+    user_id: str | None = None
+    service_id: str | None = None
+    start_date: datetime | None = None
+    end_date: datetime | None = None
+
+    @model_validator(mode="after")
+    def check_selection(self):
+        """Exige ids ou ao menos um filtro, para não afetar todos os agendamentos."""
+        if self.appointment_ids is None and all(
+            value is None
+            for value in (self.user_id, self.service_id, self.start_date, self.end_date)
+        ):
+            raise ValueError("Provide appointment_ids or at least one filter")
+        return self
+
+
+class BulkCancelAppointmentsDto(BulkConfirmAppointmentsDto):
+    reason: str | None = None
+
+
+class BulkAppointmentStatusResponseDto(BaseModel):
+    updated_ids: list[str]
+    rejected_ids: list[str] = Field(
+        ...,
+        description="Ids informados que não existem ou não estão num status que permita a transição",
+    )
@@ -0,0 +1,19 @@
+from pydantic import BaseModel, Field
+
+__all__ = ["PoolStatsResponseDto"]
+
+
+class PoolStatsResponseDto(BaseModel):
+    connection: str = Field(..., description="Alias da conexão (default ou replica)")
+    min_size: int
+    max_size: int
+    size: int = Field(..., description="Conexões abertas no pool")
+    in_use: int = Field(..., description="Conexões emprestadas a queries/transações")
+    idle: int
+    waiters: int | None = Field(
+        ...,
+        description=(
+            "Tarefas à espera de uma conexão livre (melhor esforço: lido de "
+            "atributos internos do asyncpg, null quando indisponível)"
+        ),
+    )
@@ -1,11 +1,20 @@
-from typing import Generic, TypeVar, List
+from typing import Generic, Literal, TypeVar, List
 from pydantic import BaseModel, ConfigDict
 
 T = TypeVar("T")
 
+# Como o total das listagens é calculado: COUNT exato, estimativa do
+# planner do Postgres, COUNT(*) OVER () na própria consulta ou nenhum.
+IncludeTotal = Literal["exact", "estimated", "window", "none"]
+
 
 class PaginatedResponse(BaseModel, Generic[T]):
-    """Resposta paginada padrão para listagens."""
+    """
+    Resposta paginada padrão para listagens.
+    'next_cursor' é um cursor opaco para a próxima página (None na última);
+    basta repassá-lo como 'cursor' para paginar por keyset em vez de offset.
+    'total' e 'total_pages' são None quando include_total=none.
+    """
 
     model_config = ConfigDict(
         json_schema_extra={
@@ -15,15 +24,19 @@ class PaginatedResponse(BaseModel, Generic[T]):
                 "page": 1,
                 "page_size": 10,
                 "total_pages": 0,
+                "cursor": None,
+                "next_cursor": None,
             }
         }
     )
 
     items: List[T]
-    total: int
+    total: int | None
     page: int
     page_size: int
-    total_pages: int
+    total_pages: int | None
+    cursor: str | None = None
+    next_cursor: str | None = None
 
 
 # Versões específicas para melhor compatibilidade com OpenAPI
@@ -32,10 +45,12 @@ def create_paginated_response_model(item_model):
 
     class SpecificPaginatedResponse(BaseModel):
         items: List[item_model]
-        total: int
+        total: int | None
         page: int
         page_size: int
-        total_pages: int
+        total_pages: int | None
+        cursor: str | None = None
+        next_cursor: str | None = None
 
         class Config:
             json_schema_extra = {
@@ -45,6 +60,8 @@ def create_paginated_response_model(item_model):
                     "page": 1,
                     "page_size": 10,
                     "total_pages": 0,
+                    "cursor": None,
+                    "next_cursor": None,
                 }
             }
 
@@ -0,0 +1,61 @@
+from datetime import datetime
+from decimal import Decimal
+from typing import Any
+import msgspec
+
+
+__all__ = [
+    "UserResponseStruct",
+    "ServiceResponseStruct",
+    "AppointmentResponseStruct",
+    "AppointmentExpandedResponseStruct",
+    "PaginatedResponseStruct",
+]
+
+
+# Espelhos msgspec dos DTOs de resposta, codificados direto para JSON pela
+# MsgspecJSONResponse. Os campos, a ordem e a forma no JSON são os mesmos
+# dos modelos pydantic, que continuam a descrever o schema no OpenAPI.
+
+
+class UserResponseStruct(msgspec.Struct, kw_only=True):
+    id: str
+    name: str
+    role: str
+
+
+class ServiceResponseStruct(msgspec.Struct, kw_only=True):
+    id: str
+    name: str
+    description: str
+    duration_minutes: int
+    price: Decimal
+    is_active: bool
+    created_at: datetime
+    updated_at: datetime
+
+
+class AppointmentResponseStruct(msgspec.Struct, kw_only=True):
+    id: str
+    user_id: str
+    service_id: str
+    scheduled_at: datetime
+    status: str
+    notes: str | None
+    created_at: datetime
+    updated_at: datetime
+
+
+class AppointmentExpandedResponseStruct(AppointmentResponseStruct, kw_only=True):
+    service: ServiceResponseStruct | None = None
+    user: UserResponseStruct | None = None
+
+
+class PaginatedResponseStruct(msgspec.Struct, kw_only=True):
+    items: list[Any]
+    total: int | None
+    page: int
+    page_size: int
+    total_pages: int | None
+    cursor: str | None = None
+    next_cursor: str | None = None
@@ -1,4 +1,5 @@
 from pydantic import BaseModel, Field
+from .pagination_dtos import IncludeTotal
 from datetime import datetime
 from decimal import Decimal
 
@@ -40,5 +41,8 @@ class ServiceResponseDto(BaseModel):
 class ServiceListFilterDto(BaseModel):
     is_active: bool | None = None
     name: str | None = None
-    page: int = Field(1, ge=1)
-    page_size: int = Field(10, ge=1, le=100)
+    page: int = Field(default=1, ge=1)
+    page_size: int = Field(default=10, ge=1, le=100)
+    cursor: str | None = None
+    include_total: IncludeTotal = "exact"
+    rank_by_similarity: bool = False
@@ -1,4 +1,5 @@
 from pydantic import BaseModel, Field
+from .pagination_dtos import IncludeTotal
 
 
 __all__ = ["CreateUserDto", "UpdateUserDto", "UserResponseDto", "UserListFilterDto"]
@@ -23,5 +24,8 @@ class UserResponseDto(BaseModel):
 class UserListFilterDto(BaseModel):
     role: str | None = None
     name: str | None = None
-    page: int = Field(1, ge=1)
-    page_size: int = Field(10, ge=1, le=100)
+    page: int = Field(default=1, ge=1)
+    page_size: int = Field(default=10, ge=1, le=100)
+    cursor: str | None = None
+    include_total: IncludeTotal = "exact"
+    rank_by_similarity: bool = False
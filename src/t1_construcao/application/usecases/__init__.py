@@ -15,3 +15,6 @@ from .update_appointment_usecase import *
 from .delete_appointment_usecase import *
 from .confirm_appointment_usecase import *
 from .cancel_appointment_usecase import *
+from .bulk_create_appointments_usecase import *
+from .bulk_confirm_appointments_usecase import *
+from .bulk_cancel_appointments_usecase import *
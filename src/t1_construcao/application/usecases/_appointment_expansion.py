@@ -0,0 +1,129 @@
+from typing import Iterable
+from t1_construcao.domain import (
+    AppointmentEntity,
+    ServiceEntity,
+    ServiceRepository,
+    UserEntity,
+    UserRepository,
+)
+from t1_construcao.application.dtos import (
+    AppointmentExpand,
+    AppointmentExpandedResponseDto,
+    AppointmentSparseResponseDto,
+    AppointmentExpandedResponseStruct,
+)
+from .assemblers.appointment_assembler import (
+    to_appointment_expanded_dto,
+    to_appointment_expanded_struct,
+    to_appointment_sparse_dict,
+    to_appointment_sparse_dto,
+)
+
+__all__ = ["expand_appointments", "sparse_appointments"]
+
+
+async def _load_related(
+    service_ids: Iterable[str],
+    user_ids: Iterable[str],
+    expand: set[AppointmentExpand],
+    service_repository: ServiceRepository | None,
+    user_repository: UserRepository | None,
+) -> tuple[dict[str, ServiceEntity], dict[str, UserEntity]]:
+    """
+    One query per expanded relation, whatever the number of appointments.
+    The repository of each expanded relation is required.
+    """
+    services: dict[str, ServiceEntity] = {}
+    if "service" in expand:
+        if service_repository is None:
+            raise ValueError("service_repository is required to expand 'service'")
+        service_ids = list(set(service_ids))
+        if service_ids:
+            services = await service_repository.get_many(service_ids)
+    users: dict[str, UserEntity] = {}
+    if "user" in expand:
+        if user_repository is None:
+            raise ValueError("user_repository is required to expand 'user'")
+        user_ids = list(set(user_ids))
+        if user_ids:
+            users = await user_repository.get_many(user_ids)
+    return services, users
+
+
+async def expand_appointments(
+    appointments: list[AppointmentEntity],
+    expand: set[AppointmentExpand],
+    service_repository: ServiceRepository | None,
+    user_repository: UserRepository | None,
+    response_structs: bool = False,
+) -> list[AppointmentExpandedResponseDto] | list[AppointmentExpandedResponseStruct]:
+    """
+    Embed the related services and users requested in expand, as DTOs or,
+    with response_structs, as msgspec structs.
+    """
+    services, users = await _load_related(
+        (appointment.service_id for appointment in appointments),
+        (appointment.user_id for appointment in appointments),
+        expand,
+        service_repository,
+        user_repository,
+    )
+    if response_structs:
+        return [
+            to_appointment_expanded_struct(
+                appointment,
+                service_entity=services.get(appointment.service_id),
+                user_entity=users.get(appointment.user_id),
+            )
+            for appointment in appointments
+        ]
+    return [
+        to_appointment_expanded_dto(
+            appointment,
+            service_entity=services.get(appointment.service_id),
+            user_entity=users.get(appointment.user_id),
+        )
+        for appointment in appointments
+    ]
+
+
+async def sparse_appointments(
+    rows: list[dict],
+    fields: tuple[str, ...],
+    expand: set[AppointmentExpand],
+    service_repository: ServiceRepository | None,
+    user_repository: UserRepository | None,
+    response_structs: bool = False,
+) -> list[AppointmentSparseResponseDto] | list[dict]:
+    """
+    Build DTOs (or, with response_structs, dicts) holding only the given
+    fields, plus the expanded relations. Rows must also carry
+    service_id/user_id when those are expanded.
+    """
+    services, users = await _load_related(
+        (row["service_id"] for row in rows if "service" in expand),
+        (row["user_id"] for row in rows if "user" in expand),
+        expand,
+        service_repository,
+        user_repository,
+    )
+    related = [
+        (
+            services.get(row["service_id"]) if "service" in expand else None,
+            users.get(row["user_id"]) if "user" in expand else None,
+        )
+        for row in rows
+    ]
+    if response_structs:
+        return [
+            to_appointment_sparse_dict(
+                row, fields, service_entity, user_entity, expand=expand
+            )
+            for row, (service_entity, user_entity) in zip(rows, related)
+        ]
+    return [
+        to_appointment_sparse_dto(
+            row, fields, service_entity, user_entity, expand=expand
+        )
+        for row, (service_entity, user_entity) in zip(rows, related)
+    ]
@@ -1,7 +1,25 @@
-from t1_construcao.application.dtos import AppointmentResponseDto
-from t1_construcao.domain.entities import AppointmentEntity
+from typing import AbstractSet
+from t1_construcao.application.dtos import (
+    AppointmentResponseDto,
+    AppointmentExpandedResponseDto,
+    AppointmentSparseResponseDto,
+    AppointmentResponseStruct,
+    AppointmentExpandedResponseStruct,
+    BulkAppointmentStatusResponseDto,
+)
+from t1_construcao.domain.entities import AppointmentEntity, ServiceEntity, UserEntity
+from .service_assembler import to_service_dto, to_service_struct
+from .user_assembler import to_user_dto, to_user_struct
 
-__all__ = ["to_appointment_dto"]
+__all__ = [
+    "to_appointment_dto",
+    "to_appointment_expanded_dto",
+    "to_appointment_sparse_dto",
+    "to_appointment_struct",
+    "to_appointment_expanded_struct",
+    "to_appointment_sparse_dict",
+    "to_bulk_status_dto",
+]
 
 
 def to_appointment_dto(appointment_entity: AppointmentEntity) -> AppointmentResponseDto:
@@ -15,3 +33,98 @@ def to_appointment_dto(appointment_entity: AppointmentEntity) -> AppointmentResp
         created_at=appointment_entity.created_at,
         updated_at=appointment_entity.updated_at,
     )
+
+
+def to_appointment_expanded_dto(
+    appointment_entity: AppointmentEntity,
+    service_entity: ServiceEntity | None = None,
+    user_entity: UserEntity | None = None,
+) -> AppointmentExpandedResponseDto:
+    return AppointmentExpandedResponseDto(
+        **to_appointment_dto(appointment_entity).model_dump(),
+        service=to_service_dto(service_entity) if service_entity else None,
+        user=to_user_dto(user_entity) if user_entity else None,
+    )
+
+
+def to_appointment_sparse_dto(
+    row: dict,
+    fields: tuple[str, ...],
+    service_entity: ServiceEntity | None = None,
+    user_entity: UserEntity | None = None,
+    expand: AbstractSet[str] = frozenset(),
+) -> AppointmentSparseResponseDto:
+    """Only the given fields and expanded relations are set on the DTO."""
+    values = {field: row[field] for field in fields}
+    if "service" in expand:
+        values["service"] = to_service_dto(service_entity) if service_entity else None
+    if "user" in expand:
+        values["user"] = to_user_dto(user_entity) if user_entity else None
+    return AppointmentSparseResponseDto(**values)
+
+
+def to_appointment_struct(
+    appointment_entity: AppointmentEntity,
+) -> AppointmentResponseStruct:
+    return AppointmentResponseStruct(
+        id=appointment_entity.id,
+        user_id=appointment_entity.user_id,
+        service_id=appointment_entity.service_id,
+        scheduled_at=appointment_entity.scheduled_at,
+        status=appointment_entity.status,
+        notes=appointment_entity.notes,
+        created_at=appointment_entity.created_at,
+        updated_at=appointment_entity.updated_at,
+    )
+
+
+def to_appointment_expanded_struct(
+    appointment_entity: AppointmentEntity,
+    service_entity: ServiceEntity | None = None,
+    user_entity: UserEntity | None = None,
+) -> AppointmentExpandedResponseStruct:
+    return AppointmentExpandedResponseStruct(
+        id=appointment_entity.id,
+        user_id=appointment_entity.user_id,
+        service_id=appointment_entity.service_id,
+        scheduled_at=appointment_entity.scheduled_at,
+        status=appointment_entity.status,
+        notes=appointment_entity.notes,
+        created_at=appointment_entity.created_at,
+        updated_at=appointment_entity.updated_at,
+        service=to_service_struct(service_entity) if service_entity else None,
+        user=to_user_struct(user_entity) if user_entity else None,
+    )
+
+
+def to_appointment_sparse_dict(
+    row: dict,
+    fields: tuple[str, ...],
+    service_entity: ServiceEntity | None = None,
+    user_entity: UserEntity | None = None,
+    expand: AbstractSet[str] = frozenset(),
+) -> dict:
+    """msgspec counterpart of to_appointment_sparse_dto: only the set keys."""
+    values = {field: row[field] for field in fields}
+    if "service" in expand:
+        values["service"] = (
+            to_service_struct(service_entity) if service_entity else None
+        )
+    if "user" in expand:
+        values["user"] = to_user_struct(user_entity) if user_entity else None
+    return values
+
+
+def to_bulk_status_dto(
+    requested_ids: list[str] | None, updated_ids: list[str]
+) -> BulkAppointmentStatusResponseDto:
+    """Requested ids that were not updated are reported as rejected."""
+    updated = set(updated_ids)
+    return BulkAppointmentStatusResponseDto(
+        updated_ids=updated_ids,
+        rejected_ids=[
+            appointment_id
+            for appointment_id in dict.fromkeys(requested_ids or ())
+            if appointment_id not in updated
+        ],
+    )
@@ -1,7 +1,7 @@
-from t1_construcao.application.dtos import ServiceResponseDto
+from t1_construcao.application.dtos import ServiceResponseDto, ServiceResponseStruct
 from t1_construcao.domain.entities import ServiceEntity
 
-__all__ = ["to_service_dto"]
+__all__ = ["to_service_dto", "to_service_struct"]
 
 
 def to_service_dto(service_entity: ServiceEntity) -> ServiceResponseDto:
@@ -15,3 +15,16 @@ def to_service_dto(service_entity: ServiceEntity) -> ServiceResponseDto:
         created_at=service_entity.created_at,
         updated_at=service_entity.updated_at,
     )
+
+
+def to_service_struct(service_entity: ServiceEntity) -> ServiceResponseStruct:
+    return ServiceResponseStruct(
+        id=service_entity.id,
+        name=service_entity.name,
+        description=service_entity.description,
+        duration_minutes=service_entity.duration_minutes,
+        price=service_entity.price,
+        is_active=service_entity.is_active,
+        created_at=service_entity.created_at,
+        updated_at=service_entity.updated_at,
+    )
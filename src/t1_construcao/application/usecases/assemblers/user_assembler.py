@@ -1,7 +1,7 @@
-from t1_construcao.application.dtos import UserResponseDto
+from t1_construcao.application.dtos import UserResponseDto, UserResponseStruct
 from t1_construcao.domain.entities import UserEntity
 
-__all__ = ["to_user_dto"]
+__all__ = ["to_user_dto", "to_user_struct"]
 
 
 def to_user_dto(user_entity: UserEntity) -> UserResponseDto:
@@ -19,3 +19,11 @@ def to_user_dto(user_entity: UserEntity) -> UserResponseDto:
         name=user_entity.name,
         role=user_entity.role,
     )
+
+
+def to_user_struct(user_entity: UserEntity) -> UserResponseStruct:
+    return UserResponseStruct(
+        id=user_entity.id,
+        name=user_entity.name,
+        role=user_entity.role,
+    )
@@ -0,0 +1,34 @@
+from t1_construcao.domain import AppointmentRepository
+from t1_construcao.application.dtos import (
+    BulkAppointmentStatusResponseDto,
+    BulkCancelAppointmentsDto,
+)
+from .assemblers.appointment_assembler import to_bulk_status_dto
+
+__all__ = ["BulkCancelAppointmentsUsecase"]
+
+
+class BulkCancelAppointmentsUsecase:
+
+    def __init__(
+        self,
+        bulk_cancel_appointments_dto: BulkCancelAppointmentsDto,
+        appointment_repository: AppointmentRepository,
+    ):
+        self._bulk_cancel_appointments_dto = bulk_cancel_appointments_dto
+        self._appointment_repository = appointment_repository
+
+    async def execute(self) -> BulkAppointmentStatusResponseDto:
+        dto = self._bulk_cancel_appointments_dto
+        # Cancelled and completed appointments cannot be cancelled
+        updated_ids = await self._appointment_repository.transition_status(
+            from_statuses=("pending", "confirmed"),
+            to_status="cancelled",
+            appointment_ids=dto.appointment_ids,
+            user_id=dto.user_id,
+            service_id=dto.service_id,
+            start_date=dto.start_date,
+            end_date=dto.end_date,
+            note=f"[Cancellation reason: {dto.reason}]" if dto.reason else None,
+        )
+        return to_bulk_status_dto(dto.appointment_ids, updated_ids)
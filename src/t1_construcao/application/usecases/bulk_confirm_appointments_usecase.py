@@ -0,0 +1,33 @@
+from t1_construcao.domain import AppointmentRepository
+from t1_construcao.application.dtos import (
+    BulkAppointmentStatusResponseDto,
+    BulkConfirmAppointmentsDto,
+)
+from .assemblers.appointment_assembler import to_bulk_status_dto
+
+__all__ = ["BulkConfirmAppointmentsUsecase"]
+
+
+class BulkConfirmAppointmentsUsecase:
+
+    def __init__(
+        self,
+        bulk_confirm_appointments_dto: BulkConfirmAppointmentsDto,
+        appointment_repository: AppointmentRepository,
+    ):
+        self._bulk_confirm_appointments_dto = bulk_confirm_appointments_dto
+        self._appointment_repository = appointment_repository
+
+    async def execute(self) -> BulkAppointmentStatusResponseDto:
+        dto = self._bulk_confirm_appointments_dto
+        # Only pending appointments can be confirmed
+        updated_ids = await self._appointment_repository.transition_status(
+            from_statuses=("pending",),
+            to_status="confirmed",
+            appointment_ids=dto.appointment_ids,
+            user_id=dto.user_id,
+            service_id=dto.service_id,
+            start_date=dto.start_date,
+            end_date=dto.end_date,
+        )
+        return to_bulk_status_dto(dto.appointment_ids, updated_ids)
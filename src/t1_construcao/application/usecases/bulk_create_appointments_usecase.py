@@ -0,0 +1,124 @@
+from bisect import bisect_left, insort
+from datetime import datetime, timedelta
+from t1_construcao.domain import (
+    AppointmentConflictError,
+    AppointmentRepository,
+    ServiceRepository,
+)
+from t1_construcao.application.dtos import (
+    BulkAppointmentResultDto,
+    BulkCreateAppointmentsDto,
+    BulkCreateAppointmentsResponseDto,
+)
+from .assemblers.appointment_assembler import to_appointment_dto
+
+__all__ = ["BulkCreateAppointmentsUsecase"]
+
+_CONFLICT_DETAIL = "There is a scheduling conflict for this time slot"
+
+
+class BulkCreateAppointmentsUsecase:
+    """
+    Creates many appointments for one user. Items are validated with the same
+    rules as CreateAppointmentUsecase, but each failure is reported in the
+    item's result instead of failing the whole request.
+    """
+
+    def __init__(
+        self,
+        user_id: str,
+        bulk_create_appointments_dto: BulkCreateAppointmentsDto,
+        appointment_repository: AppointmentRepository,
+        service_repository: ServiceRepository,
+    ):
+        self._user_id = user_id
+        self._bulk_create_appointments_dto = bulk_create_appointments_dto
+        self._appointment_repository = appointment_repository
+        self._service_repository = service_repository
+
+    async def execute(self) -> BulkCreateAppointmentsResponseDto:
+        items = self._bulk_create_appointments_dto.items
+        results: dict[int, BulkAppointmentResultDto] = {}
+
+        def fail(index: int, status_code: int, detail: str) -> None:
+            results[index] = BulkAppointmentResultDto(
+                index=index, status_code=status_code, detail=detail
+            )
+
+        # Validate every service with a single lookup
+        services = await self._service_repository.get_many(
+            list({item.service_id for item in items})
+        )
+        now = datetime.now()
+        candidates = []
+        for index, item in enumerate(items):
+            service = services.get(item.service_id)
+            if not service:
+                fail(index, 404, "Service not found")
+            elif not service.is_active:
+                fail(index, 400, "Service is not active")
+            elif item.scheduled_at <= now:
+                fail(index, 400, "Appointment must be scheduled in the future")
+            else:
+                candidates.append((index, item, service.duration_minutes))
+
+        # Conflicts with stored appointments, in one query for the whole batch.
+        # This runs even when the repository enforces no-overlap itself: one
+        # conflicting item would otherwise abort the entire insert.
+        stored_conflicts = await self._appointment_repository.find_conflicts(
+            [
+                (item.service_id, item.scheduled_at, duration)
+                for _, item, duration in candidates
+            ]
+        )
+
+        # Conflicts within the batch: earlier items win over later ones
+        accepted = []
+        accepted_starts: dict[str, list[datetime]] = {}
+        for position, (index, item, duration) in enumerate(candidates):
+            if position in stored_conflicts:
+                fail(index, 409, _CONFLICT_DETAIL)
+                continue
+            starts = accepted_starts.setdefault(item.service_id, [])
+            if _overlaps(starts, item.scheduled_at, timedelta(minutes=duration)):
+                fail(index, 409, _CONFLICT_DETAIL)
+                continue
+            insort(starts, item.scheduled_at)
+            accepted.append((index, item))
+
+        if accepted:
+            try:
+                appointments = await self._appointment_repository.bulk_create(
+                    user_id=self._user_id,
+                    appointments=[
+                        (item.service_id, item.scheduled_at, item.notes)
+                        for _, item in accepted
+                    ],
+                )
+            except AppointmentConflictError:
+                # A concurrent booking took one of the slots; nothing was created
+                for index, _ in accepted:
+                    fail(index, 409, _CONFLICT_DETAIL)
+            else:
+                for (index, _), appointment in zip(accepted, appointments):
+                    results[index] = BulkAppointmentResultDto(
+                        index=index,
+                        status_code=201,
+                        appointment=to_appointment_dto(appointment),
+                    )
+
+        ordered = [results[index] for index in range(len(items))]
+        created = sum(1 for result in ordered if result.status_code == 201)
+        return BulkCreateAppointmentsResponseDto(
+            created=created, failed=len(ordered) - created, results=ordered
+        )
+
+
+def _overlaps(
+    starts: list[datetime], scheduled_at: datetime, duration: timedelta
+) -> bool:
+    """Whether a slot overlaps any of the sorted same-service start times."""
+    i = bisect_left(starts, scheduled_at)
+    if i < len(starts) and starts[i] < scheduled_at + duration:
+        return True
+    return i > 0 and starts[i - 1] + duration > scheduled_at
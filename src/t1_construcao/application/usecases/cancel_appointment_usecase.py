@@ -13,8 +13,11 @@ class CancelAppointmentUsecase:
         appointment_id: str,
         cancel_appointment_dto: CancelAppointmentDto,
         appointment_repository: AppointmentRepository,
+        owner_id: str | None = None,
     ):
+        """owner_id, when given, restricts the cancellation to that user's appointment."""
         self._appointment_id = appointment_id
+        self._owner_id = owner_id
         self._cancel_appointment_dto = cancel_appointment_dto
         self._appointment_repository = appointment_repository
 
@@ -22,6 +25,10 @@ class CancelAppointmentUsecase:
         appointment = await self._appointment_repository.get_by_id(self._appointment_id)
         if not appointment:
             raise HTTPException(status_code=404, detail="Appointment not found")
+        if self._owner_id is not None and appointment.user_id != self._owner_id:
+            raise HTTPException(
+                status_code=403, detail="You can only cancel your own appointments"
+            )
 
         if appointment.status == "cancelled":
             raise HTTPException(
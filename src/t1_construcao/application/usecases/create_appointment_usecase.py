@@ -1,5 +1,9 @@
 from datetime import datetime
-from t1_construcao.domain import AppointmentRepository, ServiceRepository
+from t1_construcao.domain import (
+    AppointmentConflictError,
+    AppointmentRepository,
+    ServiceRepository,
+)
 from t1_construcao.application.dtos import CreateAppointmentDto, AppointmentResponseDto
 from .assemblers.appointment_assembler import to_appointment_dto
 from fastapi import HTTPException
@@ -37,23 +41,30 @@ class CreateAppointmentUsecase:
                 status_code=400, detail="Appointment must be scheduled in the future"
             )
 
-        # Check for scheduling conflicts
-        has_conflict = await self._appointment_repository.check_conflict(
-            service_id=self._create_appointment_dto.service_id,
-            scheduled_at=self._create_appointment_dto.scheduled_at,
-            duration_minutes=service.duration_minutes,
-        )
+        # Check for scheduling conflicts, unless the repository enforces them
+        if not self._appointment_repository.enforces_no_overlap:
+            has_conflict = await self._appointment_repository.check_conflict(
+                service_id=self._create_appointment_dto.service_id,
+                scheduled_at=self._create_appointment_dto.scheduled_at,
+                duration_minutes=service.duration_minutes,
+            )
 
-        if has_conflict:
+            if has_conflict:
+                raise HTTPException(
+                    status_code=409,
+                    detail="There is a scheduling conflict for this time slot",
+                )
+
+        try:
+            appointment_entity = await self._appointment_repository.create(
+                user_id=self._user_id,
+                service_id=self._create_appointment_dto.service_id,
+                scheduled_at=self._create_appointment_dto.scheduled_at,
+                notes=self._create_appointment_dto.notes,
+            )
+        except AppointmentConflictError as e:
             raise HTTPException(
                 status_code=409,
                 detail="There is a scheduling conflict for this time slot",
-            )
-
-        appointment_entity = await self._appointment_repository.create(
-            user_id=self._user_id,
-            service_id=self._create_appointment_dto.service_id,
-            scheduled_at=self._create_appointment_dto.scheduled_at,
-            notes=self._create_appointment_dto.notes,
-        )
+            ) from e
         return to_appointment_dto(appointment_entity)
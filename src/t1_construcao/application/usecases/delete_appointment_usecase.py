@@ -1,4 +1,5 @@
 from t1_construcao.domain import AppointmentRepository
+from fastapi import HTTPException
 
 __all__ = ["DeleteAppointmentUsecase"]
 
@@ -6,10 +7,28 @@ __all__ = ["DeleteAppointmentUsecase"]
 class DeleteAppointmentUsecase:
 
     def __init__(
-        self, appointment_id: str, appointment_repository: AppointmentRepository
+        self,
+        appointment_id: str,
+        appointment_repository: AppointmentRepository,
+        owner_id: str | None = None,
     ):
+        """owner_id, when given, restricts the deletion to that user's appointment."""
         self._appointment_id = appointment_id
         self._appointment_repository = appointment_repository
+        self._owner_id = owner_id
 
     async def execute(self) -> None:
-        await self._appointment_repository.delete(self._appointment_id)
+        try:
+            await self._appointment_repository.delete(
+                self._appointment_id, user_id=self._owner_id
+            )
+        except ValueError as e:
+            # Nothing was deleted: tell a missing appointment from someone else's
+            if (
+                self._owner_id is not None
+                and await self._appointment_repository.get_by_id(self._appointment_id)
+            ):
+                raise HTTPException(
+                    status_code=403, detail="You can only delete your own appointments"
+                ) from e
+            raise HTTPException(status_code=404, detail="Appointment not found") from e
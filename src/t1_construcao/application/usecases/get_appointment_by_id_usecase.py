@@ -1,6 +1,20 @@
-from t1_construcao.domain import AppointmentRepository
-from t1_construcao.application.dtos import AppointmentResponseDto
-from .assemblers.appointment_assembler import to_appointment_dto
+from t1_construcao.domain import (
+    AppointmentRepository,
+    ServiceRepository,
+    UserRepository,
+)
+from t1_construcao.application.dtos import (
+    AppointmentExpand,
+    AppointmentResponseDto,
+    AppointmentExpandedResponseDto,
+    AppointmentResponseStruct,
+    AppointmentExpandedResponseStruct,
+)
+from .assemblers.appointment_assembler import (
+    to_appointment_dto,
+    to_appointment_struct,
+)
+from ._appointment_expansion import expand_appointments
 
 __all__ = ["GetAppointmentByIdUsecase"]
 
@@ -8,13 +22,48 @@ __all__ = ["GetAppointmentByIdUsecase"]
 class GetAppointmentByIdUsecase:
 
     def __init__(
-        self, appointment_id: str, appointment_repository: AppointmentRepository
+        self,
+        appointment_id: str,
+        appointment_repository: AppointmentRepository,
+        expand: set[AppointmentExpand] | None = None,
+        service_repository: ServiceRepository | None = None,
+        user_repository: UserRepository | None = None,
+        response_structs: bool = False,
     ):
+        """
+        The repositories of the expanded resources are required with expand.
+        With response_structs, the result is a msgspec struct instead of a DTO.
+        """
         self._appointment_id = appointment_id
         self._appointment_repository = appointment_repository
+        self._expand = expand or set()
+        self._service_repository = service_repository
+        self._user_repository = user_repository
+        self._response_structs = response_structs
 
-    async def execute(self) -> AppointmentResponseDto | None:
+    async def execute(
+        self,
+    ) -> (
+        AppointmentResponseDto
+        | AppointmentExpandedResponseDto
+        | AppointmentResponseStruct
+        | AppointmentExpandedResponseStruct
+        | None
+    ):
         appointment_entity = await self._appointment_repository.get_by_id(
             self._appointment_id
         )
-        return to_appointment_dto(appointment_entity) if appointment_entity else None
+        if not appointment_entity:
+            return None
+        if not self._expand:
+            if self._response_structs:
+                return to_appointment_struct(appointment_entity)
+            return to_appointment_dto(appointment_entity)
+        [appointment] = await expand_appointments(
+            [appointment_entity],
+            self._expand,
+            self._service_repository,
+            self._user_repository,
+            self._response_structs,
+        )
+        return appointment
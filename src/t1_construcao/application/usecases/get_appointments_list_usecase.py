@@ -1,9 +1,25 @@
-from t1_construcao.domain import AppointmentRepository
+from typing import cast
+from fastapi import HTTPException
+from t1_construcao.domain import (
+    AppointmentEntity,
+    AppointmentRepository,
+    InvalidCursorError,
+    ServiceRepository,
+    UserRepository,
+)
 from t1_construcao.application.dtos import (
     AppointmentResponseDto,
+    AppointmentExpandedResponseDto,
+    AppointmentSparseResponseDto,
     AppointmentListFilterDto,
+    AppointmentResponseStruct,
+    AppointmentExpandedResponseStruct,
+)
+from .assemblers.appointment_assembler import (
+    to_appointment_dto,
+    to_appointment_struct,
 )
-from .assemblers.appointment_assembler import to_appointment_dto
+from ._appointment_expansion import expand_appointments, sparse_appointments
 
 __all__ = ["GetAppointmentsListUsecase"]
 
@@ -14,18 +30,93 @@ class GetAppointmentsListUsecase:
         self,
         filter_dto: AppointmentListFilterDto,
         appointment_repository: AppointmentRepository,
+        service_repository: ServiceRepository | None = None,
+        user_repository: UserRepository | None = None,
+        response_structs: bool = False,
     ):
+        """
+        The repositories of the resources in filter_dto.expand are required.
+        With response_structs, items are msgspec structs (dicts with fields)
+        instead of pydantic DTOs, for MsgspecJSONResponse.
+        """
         self._filter_dto = filter_dto
         self._appointment_repository = appointment_repository
+        self._service_repository = service_repository
+        self._user_repository = user_repository
+        self._response_structs = response_structs
 
-    async def execute(self) -> tuple[list[AppointmentResponseDto], int]:
-        appointments, total_count = await self._appointment_repository.get_all(
-            user_id=self._filter_dto.user_id,
-            service_id=self._filter_dto.service_id,
-            status=self._filter_dto.status,
-            start_date=self._filter_dto.start_date,
-            end_date=self._filter_dto.end_date,
-            page=self._filter_dto.page,
-            page_size=self._filter_dto.page_size,
+    async def execute(
+        self,
+    ) -> tuple[
+        list[AppointmentResponseDto]
+        | list[AppointmentExpandedResponseDto]
+        | list[AppointmentSparseResponseDto]
+        | list[AppointmentResponseStruct]
+        | list[AppointmentExpandedResponseStruct]
+        | list[dict],
+        int | None,
+        str | None,
+    ]:
+        columns = None
+        if self._filter_dto.fields is not None:
+            # The expanded relations are looked up by their foreign keys
+            columns = (
+                *self._filter_dto.fields,
+                *(f"{relation}_id" for relation in sorted(self._filter_dto.expand)),
+            )
+            columns = tuple(dict.fromkeys(columns))
+        try:
+            appointments, total_count, next_cursor = (
+                await self._appointment_repository.get_all(
+                    user_id=self._filter_dto.user_id,
+                    service_id=self._filter_dto.service_id,
+                    status=self._filter_dto.status,
+                    start_date=self._filter_dto.start_date,
+                    end_date=self._filter_dto.end_date,
+                    page=self._filter_dto.page,
+                    page_size=self._filter_dto.page_size,
+                    cursor=self._filter_dto.cursor,
+                    include_total=self._filter_dto.include_total,
+                    fields=columns,
+                )
+            )
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=400, detail="Invalid cursor") from e
+        if self._filter_dto.fields is not None:
+            # get_all returns plain rows when columns are selected
+            return (
+                await sparse_appointments(
+                    cast(list[dict], appointments),
+                    self._filter_dto.fields,
+                    self._filter_dto.expand,
+                    self._service_repository,
+                    self._user_repository,
+                    self._response_structs,
+                ),
+                total_count,
+                next_cursor,
+            )
+        appointments = cast(list[AppointmentEntity], appointments)
+        if self._filter_dto.expand:
+            return (
+                await expand_appointments(
+                    appointments,
+                    self._filter_dto.expand,
+                    self._service_repository,
+                    self._user_repository,
+                    self._response_structs,
+                ),
+                total_count,
+                next_cursor,
+            )
+        if self._response_structs:
+            return (
+                [to_appointment_struct(apt) for apt in appointments],
+                total_count,
+                next_cursor,
+            )
+        return (
+            [to_appointment_dto(apt) for apt in appointments],
+            total_count,
+            next_cursor,
         )
-        return [to_appointment_dto(apt) for apt in appointments], total_count
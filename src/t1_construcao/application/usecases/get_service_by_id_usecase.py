@@ -1,16 +1,27 @@
 from t1_construcao.domain import ServiceRepository
-from t1_construcao.application.dtos import ServiceResponseDto
-from .assemblers.service_assembler import to_service_dto
+from t1_construcao.application.dtos import ServiceResponseDto, ServiceResponseStruct
+from .assemblers.service_assembler import to_service_dto, to_service_struct
 
 __all__ = ["GetServiceByIdUsecase"]
 
 
 class GetServiceByIdUsecase:
 
-    def __init__(self, service_id: str, service_repository: ServiceRepository):
+    def __init__(
+        self,
+        service_id: str,
+        service_repository: ServiceRepository,
+        response_structs: bool = False,
+    ):
+        """With response_structs, the result is a msgspec struct instead of a DTO."""
         self._service_id = service_id
         self._service_repository = service_repository
+        self._response_structs = response_structs
 
-    async def execute(self) -> ServiceResponseDto | None:
+    async def execute(self) -> ServiceResponseDto | ServiceResponseStruct | None:
         service_entity = await self._service_repository.get_by_id(self._service_id)
-        return to_service_dto(service_entity) if service_entity else None
+        if not service_entity:
+            return None
+        if self._response_structs:
+            return to_service_struct(service_entity)
+        return to_service_dto(service_entity)
@@ -1,6 +1,11 @@
-from t1_construcao.domain import ServiceRepository
-from t1_construcao.application.dtos import ServiceResponseDto, ServiceListFilterDto
-from .assemblers.service_assembler import to_service_dto
+from fastapi import HTTPException
+from t1_construcao.domain import InvalidCursorError, ServiceRepository
+from t1_construcao.application.dtos import (
+    ServiceResponseDto,
+    ServiceListFilterDto,
+    ServiceResponseStruct,
+)
+from .assemblers.service_assembler import to_service_dto, to_service_struct
 
 __all__ = ["GetServicesListUsecase"]
 
@@ -8,16 +13,41 @@ __all__ = ["GetServicesListUsecase"]
 class GetServicesListUsecase:
 
     def __init__(
-        self, filter_dto: ServiceListFilterDto, service_repository: ServiceRepository
+        self,
+        filter_dto: ServiceListFilterDto,
+        service_repository: ServiceRepository,
+        response_structs: bool = False,
     ):
+        """With response_structs, items are msgspec structs instead of DTOs."""
         self._filter_dto = filter_dto
         self._service_repository = service_repository
+        self._response_structs = response_structs
 
-    async def execute(self) -> tuple[list[ServiceResponseDto], int]:
-        services, total_count = await self._service_repository.get_all(
-            is_active=self._filter_dto.is_active,
-            name=self._filter_dto.name,
-            page=self._filter_dto.page,
-            page_size=self._filter_dto.page_size,
+    async def execute(
+        self,
+    ) -> tuple[
+        list[ServiceResponseDto] | list[ServiceResponseStruct], int | None, str | None
+    ]:
+        try:
+            services, total_count, next_cursor = await self._service_repository.get_all(
+                is_active=self._filter_dto.is_active,
+                name=self._filter_dto.name,
+                page=self._filter_dto.page,
+                page_size=self._filter_dto.page_size,
+                cursor=self._filter_dto.cursor,
+                include_total=self._filter_dto.include_total,
+                rank_by_similarity=self._filter_dto.rank_by_similarity,
+            )
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=400, detail="Invalid cursor") from e
+        if self._response_structs:
+            return (
+                [to_service_struct(service) for service in services],
+                total_count,
+                next_cursor,
+            )
+        return (
+            [to_service_dto(service) for service in services],
+            total_count,
+            next_cursor,
         )
-        return [to_service_dto(service) for service in services], total_count
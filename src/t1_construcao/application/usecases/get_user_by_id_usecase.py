@@ -1,5 +1,9 @@
+from t1_construcao.application.dtos.response_structs import UserResponseStruct
 from t1_construcao.application.dtos.user_dtos import UserResponseDto
-from t1_construcao.application.usecases.assemblers.user_assembler import to_user_dto
+from t1_construcao.application.usecases.assemblers.user_assembler import (
+    to_user_dto,
+    to_user_struct,
+)
 from t1_construcao.domain import UserRepository
 
 __all__ = ["GetUserByIdUsecase"]
@@ -7,10 +11,21 @@ __all__ = ["GetUserByIdUsecase"]
 
 class GetUserByIdUsecase:
 
-    def __init__(self, user_id: str, user_repository: UserRepository):
+    def __init__(
+        self,
+        user_id: str,
+        user_repository: UserRepository,
+        response_structs: bool = False,
+    ):
+        """With response_structs, the result is a msgspec struct instead of a DTO."""
         self._user_id = user_id
         self._user_repository = user_repository
+        self._response_structs = response_structs
 
-    async def execute(self) -> UserResponseDto | None:
+    async def execute(self) -> UserResponseDto | UserResponseStruct | None:
         user_entity = await self._user_repository.get_by_id(self._user_id)
-        return to_user_dto(user_entity) if user_entity else None
+        if not user_entity:
+            return None
+        if self._response_structs:
+            return to_user_struct(user_entity)
+        return to_user_dto(user_entity)
@@ -1,21 +1,45 @@
+from t1_construcao.application.dtos.response_structs import UserResponseStruct
 from t1_construcao.application.dtos.user_dtos import UserResponseDto, UserListFilterDto
-from t1_construcao.application.usecases.assemblers.user_assembler import to_user_dto
-from t1_construcao.domain import UserRepository
+from t1_construcao.application.usecases.assemblers.user_assembler import (
+    to_user_dto,
+    to_user_struct,
+)
+from t1_construcao.domain import InvalidCursorError, UserRepository
+from fastapi import HTTPException
 
 __all__ = ["GetUsersListUsecase"]
 
 
 class GetUsersListUsecase:
 
-    def __init__(self, filter_dto: UserListFilterDto, user_repository: UserRepository):
+    def __init__(
+        self,
+        filter_dto: UserListFilterDto,
+        user_repository: UserRepository,
+        response_structs: bool = False,
+    ):
+        """With response_structs, items are msgspec structs instead of DTOs."""
         self._filter_dto = filter_dto
         self._user_repository = user_repository
+        self._response_structs = response_structs
 
-    async def execute(self) -> tuple[list[UserResponseDto], int]:
-        users, total_count = await self._user_repository.get_all(
-            role=self._filter_dto.role,
-            name=self._filter_dto.name,
-            page=self._filter_dto.page,
-            page_size=self._filter_dto.page_size,
-        )
-        return [to_user_dto(user) for user in users], total_count
+    async def execute(
+        self,
+    ) -> tuple[
+        list[UserResponseDto] | list[UserResponseStruct], int | None, str | None
+    ]:
+        try:
+            users, total_count, next_cursor = await self._user_repository.get_all(
+                role=self._filter_dto.role,
+                name=self._filter_dto.name,
+                page=self._filter_dto.page,
+                page_size=self._filter_dto.page_size,
+                cursor=self._filter_dto.cursor,
+                include_total=self._filter_dto.include_total,
+                rank_by_similarity=self._filter_dto.rank_by_similarity,
+            )
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=400, detail="Invalid cursor") from e
+        if self._response_structs:
+            return [to_user_struct(user) for user in users], total_count, next_cursor
+        return [to_user_dto(user) for user in users], total_count, next_cursor
@@ -1,5 +1,9 @@
 from datetime import datetime
-from t1_construcao.domain import AppointmentRepository, ServiceRepository
+from t1_construcao.domain import (
+    AppointmentConflictError,
+    AppointmentRepository,
+    ServiceRepository,
+)
 from t1_construcao.application.dtos import UpdateAppointmentDto, AppointmentResponseDto
 from .assemblers.appointment_assembler import to_appointment_dto
 from fastapi import HTTPException
@@ -15,8 +19,11 @@ class UpdateAppointmentUsecase:
         update_appointment_dto: UpdateAppointmentDto,
         appointment_repository: AppointmentRepository,
         service_repository: ServiceRepository,
+        owner_id: str | None = None,
     ):
+        """owner_id, when given, restricts the update to that user's appointment."""
         self._appointment_id = appointment_id
+        self._owner_id = owner_id
         self._update_appointment_dto = update_appointment_dto
         self._appointment_repository = appointment_repository
         self._service_repository = service_repository
@@ -25,6 +32,10 @@ class UpdateAppointmentUsecase:
         appointment = await self._appointment_repository.get_by_id(self._appointment_id)
         if not appointment:
             raise HTTPException(status_code=404, detail="Appointment not found")
+        if self._owner_id is not None and appointment.user_id != self._owner_id:
+            raise HTTPException(
+                status_code=403, detail="You can only update your own appointments"
+            )
 
         if appointment.status in ["cancelled", "completed"]:
             raise HTTPException(
@@ -40,24 +51,33 @@ class UpdateAppointmentUsecase:
                     detail="Appointment must be scheduled in the future",
                 )
 
-            service = await self._service_repository.get_by_id(appointment.service_id)
-            if service:
-                has_conflict = await self._appointment_repository.check_conflict(
-                    service_id=appointment.service_id,
-                    scheduled_at=self._update_appointment_dto.scheduled_at,
-                    duration_minutes=service.duration_minutes,
-                    exclude_appointment_id=self._appointment_id,
+            if not self._appointment_repository.enforces_no_overlap:
+                service = await self._service_repository.get_by_id(
+                    appointment.service_id
                 )
-
-                if has_conflict:
-                    raise HTTPException(
-                        status_code=409,
-                        detail="There is a scheduling conflict for this time slot",
+                if service:
+                    has_conflict = await self._appointment_repository.check_conflict(
+                        service_id=appointment.service_id,
+                        scheduled_at=self._update_appointment_dto.scheduled_at,
+                        duration_minutes=service.duration_minutes,
+                        exclude_appointment_id=self._appointment_id,
                     )
 
-        appointment_entity = await self._appointment_repository.update(
-            appointment_id=self._appointment_id,
-            scheduled_at=self._update_appointment_dto.scheduled_at,
-            notes=self._update_appointment_dto.notes,
-        )
+                    if has_conflict:
+                        raise HTTPException(
+                            status_code=409,
+                            detail="There is a scheduling conflict for this time slot",
+                        )
+
+        try:
+            appointment_entity = await self._appointment_repository.update(
+                appointment_id=self._appointment_id,
+                scheduled_at=self._update_appointment_dto.scheduled_at,
+                notes=self._update_appointment_dto.notes,
+            )
+        except AppointmentConflictError as e:
+            raise HTTPException(
+                status_code=409,
+                detail="There is a scheduling conflict for this time slot",
+            ) from e
         return to_appointment_dto(appointment_entity)
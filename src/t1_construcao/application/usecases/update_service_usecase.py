@@ -1,6 +1,7 @@
-from t1_construcao.domain import ServiceRepository
+from t1_construcao.domain import AppointmentConflictError, ServiceRepository
 from t1_construcao.application.dtos import UpdateServiceDto, ServiceResponseDto
 from .assemblers.service_assembler import to_service_dto
+from fastapi import HTTPException
 
 __all__ = ["UpdateServiceUsecase"]
 
@@ -18,12 +19,18 @@ class UpdateServiceUsecase:
         self._service_repository = service_repository
 
     async def execute(self) -> ServiceResponseDto:
-        service_entity = await self._service_repository.update(
-            self._service_id,
-            name=self._update_service_dto.name,
-            description=self._update_service_dto.description,
-            duration_minutes=self._update_service_dto.duration_minutes,
-            price=self._update_service_dto.price,
-            is_active=self._update_service_dto.is_active,
-        )
+        try:
+            service_entity = await self._service_repository.update(
+                self._service_id,
+                name=self._update_service_dto.name,
+                description=self._update_service_dto.description,
+                duration_minutes=self._update_service_dto.duration_minutes,
+                price=self._update_service_dto.price,
+                is_active=self._update_service_dto.is_active,
+            )
+        except AppointmentConflictError as e:
+            raise HTTPException(
+                status_code=409,
+                detail="The new duration makes existing appointments overlap",
+            ) from e
         return to_service_dto(service_entity)
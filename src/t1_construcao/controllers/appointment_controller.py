@@ -1,8 +1,13 @@
-from fastapi import APIRouter, status, Depends, HTTPException, Query
+from typing import cast, get_args
+from fastapi import APIRouter, status, Depends, HTTPException, Query, Response
+import msgspec
 from starlette.status import HTTP_403_FORBIDDEN
 from datetime import datetime
 from t1_construcao.application.usecases import (
     CreateAppointmentUsecase,
+    BulkCreateAppointmentsUsecase,
+    BulkConfirmAppointmentsUsecase,
+    BulkCancelAppointmentsUsecase,
     UpdateAppointmentUsecase,
     GetAppointmentByIdUsecase,
     GetAppointmentsListUsecase,
@@ -10,40 +15,134 @@ from t1_construcao.application.usecases import (
     ConfirmAppointmentUsecase,
     CancelAppointmentUsecase,
 )
-from t1_construcao.infrastructure import AppointmentRepository, ServiceRepository
+from t1_construcao.domain import (
+    AppointmentRepository,
+    ServiceRepository,
+    UserRepository,
+)
+from t1_construcao.infrastructure import (
+    UnitOfWork,
+    get_unit_of_work,
+    read_from_primary,
+)
 from t1_construcao.application.dtos import (
     CreateAppointmentDto,
+    BulkCreateAppointmentsDto,
+    BulkCreateAppointmentsResponseDto,
+    BulkConfirmAppointmentsDto,
+    BulkCancelAppointmentsDto,
+    BulkAppointmentStatusResponseDto,
     AppointmentResponseDto,
+    AppointmentExpand,
+    AppointmentExpandedResponseDto,
+    AppointmentSparseResponseDto,
     UpdateAppointmentDto,
     AppointmentListFilterDto,
     ConfirmAppointmentDto,
     CancelAppointmentDto,
     PaginatedResponse,
+    PaginatedResponseStruct,
+    IncludeTotal,
 )
 from ..shared.auth import (
-    get_admin_user,
     get_operator_user,
     get_client_user,
     check_appointment_ownership,
-    get_current_user_payload,
+    get_current_principal,
 )
+from ..shared.msgspec_response import MSGSPEC_RESPONSES, MsgspecJSONResponse
+from ..shared.principal import Principal
 
 appointment_router = APIRouter(
     prefix="/appointments", tags=["appointments"], include_in_schema=True
 )
 
 
-def get_appointment_repository():
-    return AppointmentRepository()
+def get_appointment_repository(
+    unit_of_work: UnitOfWork = Depends(get_unit_of_work),
+) -> AppointmentRepository:
+    return unit_of_work.appointments
+
+
+def get_service_repository(
+    unit_of_work: UnitOfWork = Depends(get_unit_of_work),
+) -> ServiceRepository:
+    return unit_of_work.services
+
+
+def get_user_repository(
+    unit_of_work: UnitOfWork = Depends(get_unit_of_work),
+) -> UserRepository:
+    return unit_of_work.users
+
+
+def _parse_expand(expand: str | None) -> set[AppointmentExpand]:
+    """Converte 'service,user' no conjunto de recursos a embutir."""
+    if not expand:
+        return set()
+    values = {value.strip() for value in expand.split(",") if value.strip()}
+    allowed = get_args(AppointmentExpand)
+    invalid = sorted(values.difference(allowed))
+    if invalid:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid expand value(s): {', '.join(invalid)}. "
+            f"Expected: {', '.join(allowed)}",
+        )
+    return cast(set[AppointmentExpand], values)
+
+
+def _parse_fields(fields: str | None) -> tuple[str, ...] | None:
+    """Converte 'id,scheduled_at,status' nos campos a selecionar e a serializar."""
+    values = tuple(
+        dict.fromkeys(
+            value.strip() for value in (fields or "").split(",") if value.strip()
+        )
+    )
+    if not values:
+        return None
+    allowed = set(AppointmentResponseDto.model_fields)
+    invalid = [value for value in values if value not in allowed]
+    if invalid:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid field(s): {', '.join(invalid)}. "
+            f"Expected: {', '.join(AppointmentResponseDto.model_fields)}",
+        )
+    return values
+
+
+_EXPAND_DESCRIPTION = "Recursos relacionados a embutir, separados por vírgula: service, user. Cada um é carregado com uma única consulta para a página inteira."
+
+
+def _owner_id(principal: Principal) -> str | None:
+    """
+    Dono exigido nas mutações: None para admin e operator, o 'sub' do token
+    para client. As use cases verificam o dono no próprio fetch/DELETE.
+    """
+    if principal.is_staff:
+        return None
+    return _subject_id(principal)
 
 
-def get_service_repository():
-    return ServiceRepository()
+def _subject_id(principal: Principal) -> str:
+    """O 'sub' do token, para criar agendamentos em nome do próprio usuário."""
+    if principal.sub is None:
+        raise HTTPException(
+            status_code=HTTP_403_FORBIDDEN, detail="Token sem identificação do usuário"
+        )
+    return principal.sub
 
 
 @appointment_router.get(
     "/",
-    response_model=PaginatedResponse[AppointmentResponseDto],
+    response_model=PaginatedResponse[
+        AppointmentResponseDto
+        | AppointmentExpandedResponseDto
+        | AppointmentSparseResponseDto
+    ],
+    # Com 'fields', os campos não pedidos ficam fora dos itens
+    response_model_exclude_unset=True,
     summary="Listar agendamentos",
     description="Lista agendamentos com paginação e filtros. Admin e operator veem todos; client vê apenas os seus próprios.",
 )
@@ -55,19 +154,32 @@ async def list_appointments(
     end_date: datetime | None = Query(None),
     page: int = Query(1, ge=1),
     page_size: int = Query(10, ge=1, le=100),
-    payload: dict = Depends(get_current_user_payload),
-) -> dict:
+    cursor: str | None = Query(
+        None,
+        description="Cursor opaco ('next_cursor' da página anterior). Quando informado, 'page' é ignorado.",
+    ),
+    include_total: IncludeTotal = Query(
+        "exact",
+        description="Cálculo do total: exact, estimated (estimativa do planner), window (COUNT(*) OVER () na mesma consulta) ou none.",
+    ),
+    expand: str | None = Query(None, description=_EXPAND_DESCRIPTION),
+    fields: str | None = Query(
+        None,
+        description="Campos do agendamento a devolver, separados por vírgula (ex.: id,scheduled_at,status). Só essas colunas são lidas do banco.",
+    ),
+    principal: Principal = Depends(get_current_principal),
+    appointment_repository: AppointmentRepository = Depends(get_appointment_repository),
+    service_repository: ServiceRepository = Depends(get_service_repository),
+    user_repository: UserRepository = Depends(get_user_repository),
+) -> dict | Response:
     """
     Endpoint para listar agendamentos com paginação e filtros.
     - Admin e operator: podem ver todos
     - Client: só vê os seus próprios agendamentos
     """
-    groups = payload.get("cognito:groups", [])
-    user_sub_id = payload.get("sub")
-
     # Se for client, forçar filtro por user_id
-    if "admin" not in groups and "operator" not in groups:
-        user_id = user_sub_id
+    if not principal.is_staff:
+        user_id = principal.sub
 
     filter_dto = AppointmentListFilterDto(
         user_id=user_id,
@@ -77,17 +189,36 @@ async def list_appointments(
         end_date=end_date,
         page=page,
         page_size=page_size,
+        cursor=cursor,
+        include_total=include_total,
+        expand=_parse_expand(expand),
+        fields=_parse_fields(fields),
     )
-    use_case = GetAppointmentsListUsecase(filter_dto, AppointmentRepository())
-    appointments, total_count = await use_case.execute()
+    use_case = GetAppointmentsListUsecase(
+        filter_dto,
+        appointment_repository,
+        service_repository,
+        user_repository,
+        response_structs=MSGSPEC_RESPONSES,
+    )
+    appointments, total_count, next_cursor = await use_case.execute()
 
-    return {
+    response = {
         "items": appointments,
         "total": total_count,
         "page": page,
         "page_size": page_size,
-        "total_pages": (total_count + page_size - 1) // page_size,
+        "total_pages": (
+            (total_count + page_size - 1) // page_size
+            if total_count is not None
+            else None
+        ),
+        "cursor": cursor,
+        "next_cursor": next_cursor,
     }
+    if MSGSPEC_RESPONSES:
+        return MsgspecJSONResponse(PaginatedResponseStruct(**response))
+    return response
 
 
 @appointment_router.post(
@@ -98,23 +229,96 @@ async def list_appointments(
 )
 async def create_appointment(
     create_appointment_dto: CreateAppointmentDto,
-    payload: dict = Depends(get_client_user),
+    principal: Principal = Depends(get_client_user),
+    appointment_repository: AppointmentRepository = Depends(get_appointment_repository),
+    service_repository: ServiceRepository = Depends(get_service_repository),
 ) -> AppointmentResponseDto:
     """
     Cria um novo agendamento.
     Acesso permitido para client, operator e admin.
     O agendamento será criado para o usuário autenticado.
     """
-    user_id = payload.get("sub")
     use_case = CreateAppointmentUsecase(
-        user_id=user_id,
+        user_id=_subject_id(principal),
         create_appointment_dto=create_appointment_dto,
-        appointment_repository=AppointmentRepository(),
-        service_repository=ServiceRepository(),
+        appointment_repository=appointment_repository,
+        service_repository=service_repository,
+    )
+    return await use_case.execute()
+
+
+@appointment_router.post(
+    "/bulk",
+    response_model=BulkCreateAppointmentsResponseDto,
+    summary="Criar agendamentos em lote",
+    description="Cria vários agendamentos (até 500) para o usuário autenticado. Os serviços e os conflitos de horário, inclusive entre os próprios itens do lote, são validados de uma só vez; o resultado informa o status de cada item.",
+)
+async def bulk_create_appointments(
+    bulk_create_appointments_dto: BulkCreateAppointmentsDto,
+    principal: Principal = Depends(get_client_user),
+    appointment_repository: AppointmentRepository = Depends(get_appointment_repository),
+    service_repository: ServiceRepository = Depends(get_service_repository),
+) -> BulkCreateAppointmentsResponseDto:
+    """
+    Cria agendamentos em lote.
+    Acesso permitido para client, operator e admin.
+    Os itens válidos são inseridos numa única transação; os demais
+    aparecem no resultado com o código e o motivo da falha.
+    """
+    use_case = BulkCreateAppointmentsUsecase(
+        user_id=_subject_id(principal),
+        bulk_create_appointments_dto=bulk_create_appointments_dto,
+        appointment_repository=appointment_repository,
+        service_repository=service_repository,
     )
     return await use_case.execute()
 
 
+@appointment_router.post(
+    "/bulk/confirm",
+    response_model=BulkAppointmentStatusResponseDto,
+    summary="Confirmar agendamentos em lote",
+    description="Confirma, num único UPDATE condicional, os agendamentos pendentes indicados por 'appointment_ids' ou pelos filtros. Acesso permitido apenas para admin e operator.",
+)
+async def bulk_confirm_appointments(
+    bulk_confirm_dto: BulkConfirmAppointmentsDto,
+    _operator: Principal = Depends(get_operator_user),
+    appointment_repository: AppointmentRepository = Depends(get_appointment_repository),
+) -> BulkAppointmentStatusResponseDto:
+    """
+    Confirma agendamentos em lote.
+    Acesso permitido para admin e operator.
+    """
+    use_case = BulkConfirmAppointmentsUsecase(bulk_confirm_dto, appointment_repository)
+    return await use_case.execute()
+
+
+@appointment_router.post(
+    "/bulk/cancel",
+    response_model=BulkAppointmentStatusResponseDto,
+    summary="Cancelar agendamentos em lote",
+    description="Cancela, num único UPDATE condicional, os agendamentos pendentes ou confirmados indicados por 'appointment_ids' ou pelos filtros. Admin e operator podem cancelar qualquer agendamento; client só cancela os seus próprios.",
+)
+async def bulk_cancel_appointments(
+    bulk_cancel_dto: BulkCancelAppointmentsDto,
+    principal: Principal = Depends(get_client_user),
+    appointment_repository: AppointmentRepository = Depends(get_appointment_repository),
+) -> BulkAppointmentStatusResponseDto:
+    """
+    Cancela agendamentos em lote.
+    - Admin e operator: podem cancelar qualquer agendamento
+    - Client: só cancela os seus próprios agendamentos; ids de outros
+      usuários aparecem como rejeitados
+    """
+    # Se for client, restringir o UPDATE aos seus agendamentos
+    owner_id = _owner_id(principal)
+    if owner_id is not None:
+        bulk_cancel_dto = bulk_cancel_dto.model_copy(update={"user_id": owner_id})
+
+    use_case = BulkCancelAppointmentsUsecase(bulk_cancel_dto, appointment_repository)
+    return await use_case.execute()
+
+
 @appointment_router.put(
     "/{appointment_id}",
     response_model=AppointmentResponseDto,
@@ -124,36 +328,26 @@ async def create_appointment(
 async def update_appointment(
     appointment_id: str,
     update_appointment_dto: UpdateAppointmentDto,
-    payload: dict = Depends(check_appointment_ownership),
+    principal: Principal = Depends(check_appointment_ownership),
+    appointment_repository: AppointmentRepository = Depends(get_appointment_repository),
+    service_repository: ServiceRepository = Depends(get_service_repository),
 ) -> AppointmentResponseDto:
     """
     Atualiza um agendamento.
     - Admin e operator: podem atualizar qualquer agendamento
     - Client: só pode atualizar os seus próprios agendamentos
     """
-    groups = payload.get("cognito:groups", [])
-    user_sub_id = payload.get("sub")
-
-    # Verificar ownership se for client
-    if "admin" not in groups and "operator" not in groups:
-        appointment = await GetAppointmentByIdUsecase(
-            appointment_id, AppointmentRepository()
-        ).execute()
-        if not appointment:
-            raise HTTPException(status_code=404, detail="Appointment not found")
-        if appointment.user_id != user_sub_id:
-            raise HTTPException(
-                status_code=HTTP_403_FORBIDDEN,
-                detail="You can only update your own appointments",
-            )
-
     use_case = UpdateAppointmentUsecase(
         appointment_id=appointment_id,
         update_appointment_dto=update_appointment_dto,
-        appointment_repository=AppointmentRepository(),
-        service_repository=ServiceRepository(),
+        appointment_repository=appointment_repository,
+        service_repository=service_repository,
+        owner_id=_owner_id(principal),
     )
-    return await use_case.execute()
+    # As verificações leem a linha que vai ser escrita: no primário, sem o
+    # atraso da réplica
+    with read_from_primary():
+        return await use_case.execute()
 
 
 @appointment_router.delete(
@@ -164,65 +358,63 @@ async def update_appointment(
 )
 async def delete_appointment(
     appointment_id: str,
-    payload: dict = Depends(check_appointment_ownership),
+    principal: Principal = Depends(check_appointment_ownership),
+    appointment_repository: AppointmentRepository = Depends(get_appointment_repository),
 ) -> None:
     """
     Apaga um agendamento.
     - Admin e operator: podem apagar qualquer agendamento
     - Client: só pode apagar os seus próprios agendamentos
     """
-    groups = payload.get("cognito:groups", [])
-    user_sub_id = payload.get("sub")
-
-    # Verificar ownership se for client
-    if "admin" not in groups and "operator" not in groups:
-        appointment = await GetAppointmentByIdUsecase(
-            appointment_id, AppointmentRepository()
-        ).execute()
-        if not appointment:
-            raise HTTPException(status_code=404, detail="Appointment not found")
-        if appointment.user_id != user_sub_id:
-            raise HTTPException(
-                status_code=HTTP_403_FORBIDDEN,
-                detail="You can only delete your own appointments",
-            )
-
-    use_case = DeleteAppointmentUsecase(appointment_id, AppointmentRepository())
+    use_case = DeleteAppointmentUsecase(
+        appointment_id,
+        appointment_repository,
+        owner_id=_owner_id(principal),
+    )
     await use_case.execute()
 
 
 @appointment_router.get(
     "/{appointment_id}",
-    response_model=AppointmentResponseDto,
+    response_model=AppointmentResponseDto | AppointmentExpandedResponseDto,
     summary="Obter agendamento por ID",
     description="Obtém um agendamento pelo seu ID. Admin e operator podem ver qualquer agendamento; client só pode ver os seus próprios.",
 )
 async def get_appointment_by_id(
     appointment_id: str,
-    payload: dict = Depends(check_appointment_ownership),
-) -> AppointmentResponseDto:
+    expand: str | None = Query(None, description=_EXPAND_DESCRIPTION),
+    principal: Principal = Depends(check_appointment_ownership),
+    appointment_repository: AppointmentRepository = Depends(get_appointment_repository),
+    service_repository: ServiceRepository = Depends(get_service_repository),
+    user_repository: UserRepository = Depends(get_user_repository),
+) -> AppointmentResponseDto | AppointmentExpandedResponseDto | Response:
     """
     Obtém um agendamento pelo seu ID.
     - Admin e operator: podem ver qualquer agendamento
     - Client: só pode ver os seus próprios agendamentos
     """
-    groups = payload.get("cognito:groups", [])
-    user_sub_id = payload.get("sub")
-
-    use_case = GetAppointmentByIdUsecase(appointment_id, AppointmentRepository())
+    use_case = GetAppointmentByIdUsecase(
+        appointment_id,
+        appointment_repository,
+        expand=_parse_expand(expand),
+        service_repository=service_repository,
+        user_repository=user_repository,
+        response_structs=MSGSPEC_RESPONSES,
+    )
     appointment = await use_case.execute()
 
     if not appointment:
         raise HTTPException(status_code=404, detail="Appointment not found")
 
     # Verificar ownership se for client
-    if "admin" not in groups and "operator" not in groups:
-        if appointment.user_id != user_sub_id:
-            raise HTTPException(
-                status_code=HTTP_403_FORBIDDEN,
-                detail="You can only view your own appointments",
-            )
-
+    if not principal.is_staff and not principal.owns(appointment.user_id):
+        raise HTTPException(
+            status_code=HTTP_403_FORBIDDEN,
+            detail="You can only view your own appointments",
+        )
+
+    if isinstance(appointment, msgspec.Struct):
+        return MsgspecJSONResponse(appointment)
     return appointment
 
 
@@ -235,14 +427,16 @@ async def get_appointment_by_id(
 async def confirm_appointment(
     appointment_id: str,
     confirm_dto: ConfirmAppointmentDto,
-    payload: dict = Depends(get_operator_user),
+    _operator: Principal = Depends(get_operator_user),
+    appointment_repository: AppointmentRepository = Depends(get_appointment_repository),
 ) -> AppointmentResponseDto:
     """
     Confirma um agendamento.
     Acesso permitido para admin e operator.
     """
-    use_case = ConfirmAppointmentUsecase(appointment_id, AppointmentRepository())
-    return await use_case.execute()
+    use_case = ConfirmAppointmentUsecase(appointment_id, appointment_repository)
+    with read_from_primary():
+        return await use_case.execute()
 
 
 @appointment_router.post(
@@ -254,32 +448,19 @@ async def confirm_appointment(
 async def cancel_appointment(
     appointment_id: str,
     cancel_dto: CancelAppointmentDto,
-    payload: dict = Depends(check_appointment_ownership),
+    principal: Principal = Depends(check_appointment_ownership),
+    appointment_repository: AppointmentRepository = Depends(get_appointment_repository),
 ) -> AppointmentResponseDto:
     """
     Cancela um agendamento.
     - Admin e operator: podem cancelar qualquer agendamento
     - Client: só pode cancelar os seus próprios agendamentos
     """
-    groups = payload.get("cognito:groups", [])
-    user_sub_id = payload.get("sub")
-
-    # Verificar ownership se for client
-    if "admin" not in groups and "operator" not in groups:
-        appointment = await GetAppointmentByIdUsecase(
-            appointment_id, AppointmentRepository()
-        ).execute()
-        if not appointment:
-            raise HTTPException(status_code=404, detail="Appointment not found")
-        if appointment.user_id != user_sub_id:
-            raise HTTPException(
-                status_code=HTTP_403_FORBIDDEN,
-                detail="You can only cancel your own appointments",
-            )
-
     use_case = CancelAppointmentUsecase(
         appointment_id=appointment_id,
         cancel_appointment_dto=cancel_dto,
-        appointment_repository=AppointmentRepository(),
+        appointment_repository=appointment_repository,
+        owner_id=_owner_id(principal),
     )
-    return await use_case.execute()
+    with read_from_primary():
+        return await use_case.execute()
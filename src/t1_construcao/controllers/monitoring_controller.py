@@ -0,0 +1,26 @@
+from dataclasses import asdict
+from fastapi import APIRouter, Depends
+from t1_construcao.application.dtos import PoolStatsResponseDto
+from t1_construcao.infrastructure import get_pool_stats
+from ..shared.auth import get_admin_user
+from ..shared.principal import Principal
+
+monitoring_router = APIRouter(
+    prefix="/monitoring", tags=["monitoring"], include_in_schema=True
+)
+
+
+@monitoring_router.get(
+    "/db-pool",
+    response_model=list[PoolStatsResponseDto],
+    summary="Utilização do pool de conexões",
+    description="Mostra, por conexão, o tamanho do pool, as conexões em uso e ociosas e as tarefas à espera de uma conexão. Acesso restrito a administradores.",
+)
+async def get_db_pool_stats(
+    _admin: Principal = Depends(get_admin_user),
+) -> list[PoolStatsResponseDto]:
+    """
+    Utilização dos pools do asyncpg neste worker, para dimensionar
+    DATABASE_POOL_MAX_SIZE de acordo com o número de workers.
+    """
+    return [PoolStatsResponseDto(**asdict(stats)) for stats in get_pool_stats()]
@@ -1,4 +1,5 @@
-from fastapi import APIRouter, status, Depends, HTTPException, Query
+from fastapi import APIRouter, status, Depends, HTTPException, Query, Response
+import msgspec
 from t1_construcao.application.usecases import (
     CreateServiceUsecase,
     UpdateServiceUsecase,
@@ -6,23 +7,33 @@ from t1_construcao.application.usecases import (
     GetServicesListUsecase,
     DeleteServiceUsecase,
 )
-from t1_construcao.infrastructure import ServiceRepository
+from t1_construcao.domain import ServiceRepository
+from t1_construcao.infrastructure import UnitOfWork, get_unit_of_work
 from t1_construcao.application.dtos import (
     CreateServiceDto,
     ServiceResponseDto,
     UpdateServiceDto,
     ServiceListFilterDto,
     PaginatedResponse,
+    PaginatedResponseStruct,
+    IncludeTotal,
 )
 from ..shared.auth import get_admin_user, get_operator_user
+from ..shared.msgspec_response import (
+    MSGSPEC_RESPONSES,
+    MsgspecJSONResponse,
+)
+from ..shared.principal import Principal
 
 service_router = APIRouter(
     prefix="/services", tags=["services"], include_in_schema=True
 )
 
 
-def get_repository():
-    return ServiceRepository()
+def get_repository(
+    unit_of_work: UnitOfWork = Depends(get_unit_of_work),
+) -> ServiceRepository:
+    return unit_of_work.services
 
 
 @service_router.get(
@@ -36,25 +47,55 @@ async def list_services(
     name: str | None = Query(None),
     page: int = Query(1, ge=1),
     page_size: int = Query(10, ge=1, le=100),
-    _operator_payload: dict = Depends(get_operator_user),
-) -> dict:
+    cursor: str | None = Query(
+        None,
+        description="Cursor opaco ('next_cursor' da página anterior). Quando informado, 'page' é ignorado.",
+    ),
+    include_total: IncludeTotal = Query(
+        "exact",
+        description="Cálculo do total: exact, estimated (estimativa do planner), window (COUNT(*) OVER () na mesma consulta) ou none.",
+    ),
+    rank_by_similarity: bool = Query(
+        False,
+        description="Ordena a busca por 'name' pela similaridade (pg_trgm). Usa paginação por 'page'; ignorado sem pg_trgm.",
+    ),
+    _operator: Principal = Depends(get_operator_user),
+    repo: ServiceRepository = Depends(get_repository),
+) -> dict | Response:
     """
     Endpoint para listar serviços com paginação e filtros.
     Acesso permitido para admin e operator.
     """
     filter_dto = ServiceListFilterDto(
-        is_active=is_active, name=name, page=page, page_size=page_size
+        is_active=is_active,
+        name=name,
+        page=page,
+        page_size=page_size,
+        cursor=cursor,
+        include_total=include_total,
+        rank_by_similarity=rank_by_similarity,
+    )
+    use_case = GetServicesListUsecase(
+        filter_dto, repo, response_structs=MSGSPEC_RESPONSES
     )
-    use_case = GetServicesListUsecase(filter_dto, ServiceRepository())
-    services, total_count = await use_case.execute()
+    services, total_count, next_cursor = await use_case.execute()
 
-    return {
+    response = {
         "items": services,
         "total": total_count,
         "page": page,
         "page_size": page_size,
-        "total_pages": (total_count + page_size - 1) // page_size,
+        "total_pages": (
+            (total_count + page_size - 1) // page_size
+            if total_count is not None
+            else None
+        ),
+        "cursor": cursor,
+        "next_cursor": next_cursor,
     }
+    if MSGSPEC_RESPONSES:
+        return MsgspecJSONResponse(PaginatedResponseStruct(**response))
+    return response
 
 
 @service_router.post(
@@ -65,13 +106,14 @@ async def list_services(
 )
 async def create_service(
     create_service_dto: CreateServiceDto,
-    _admin_payload: dict = Depends(get_admin_user),
+    _admin: Principal = Depends(get_admin_user),
+    repo: ServiceRepository = Depends(get_repository),
 ) -> ServiceResponseDto:
     """
     Cria um novo serviço.
     Acesso restrito a administradores.
     """
-    use_case = CreateServiceUsecase(create_service_dto, ServiceRepository())
+    use_case = CreateServiceUsecase(create_service_dto, repo)
     return await use_case.execute()
 
 
@@ -84,13 +126,14 @@ async def create_service(
 async def update_service(
     service_id: str,
     update_service_dto: UpdateServiceDto,
-    _admin_payload: dict = Depends(get_admin_user),
+    _admin: Principal = Depends(get_admin_user),
+    repo: ServiceRepository = Depends(get_repository),
 ) -> ServiceResponseDto:
     """
     Atualiza um serviço.
     Acesso restrito a administradores.
     """
-    use_case = UpdateServiceUsecase(service_id, update_service_dto, ServiceRepository())
+    use_case = UpdateServiceUsecase(service_id, update_service_dto, repo)
     return await use_case.execute()
 
 
@@ -102,13 +145,14 @@ async def update_service(
 )
 async def delete_service(
     service_id: str,
-    _admin_payload: dict = Depends(get_admin_user),
+    _admin: Principal = Depends(get_admin_user),
+    repo: ServiceRepository = Depends(get_repository),
 ) -> None:
     """
     Apaga um serviço.
     Acesso restrito a administradores.
     """
-    use_case = DeleteServiceUsecase(service_id, ServiceRepository())
+    use_case = DeleteServiceUsecase(service_id, repo)
     await use_case.execute()
 
 
@@ -120,15 +164,20 @@ async def delete_service(
 )
 async def get_service_by_id(
     service_id: str,
-    _operator_payload: dict = Depends(get_operator_user),
-) -> ServiceResponseDto:
+    _operator: Principal = Depends(get_operator_user),
+    repo: ServiceRepository = Depends(get_repository),
+) -> ServiceResponseDto | Response:
     """
     Obtém um serviço pelo seu ID.
     Acesso permitido para admin e operator.
     """
-    use_case = GetServiceByIdUsecase(service_id, ServiceRepository())
+    use_case = GetServiceByIdUsecase(
+        service_id, repo, response_structs=MSGSPEC_RESPONSES
+    )
     service = await use_case.execute()
 
     if not service:
         raise HTTPException(status_code=404, detail="Service not found")
+    if isinstance(service, msgspec.Struct):
+        return MsgspecJSONResponse(service)
     return service
@@ -1,4 +1,5 @@
-from fastapi import APIRouter, status, Depends, HTTPException, Query
+from fastapi import APIRouter, status, Depends, HTTPException, Query, Response
+import msgspec
 from t1_construcao.application.usecases import (
     CreateUserUsecase,
     UpdateUserUsecase,
@@ -6,25 +7,35 @@ from t1_construcao.application.usecases import (
     DeleteUserUsecase,
     GetUsersListUsecase,
 )
-from t1_construcao.infrastructure import UserRepository
+from t1_construcao.domain import UserRepository
+from t1_construcao.infrastructure import UnitOfWork, get_unit_of_work
 from t1_construcao.application.dtos import (
     CreateUserDto,
     UserResponseDto,
     UpdateUserDto,
     UserListFilterDto,
     PaginatedResponse,
+    PaginatedResponseStruct,
+    IncludeTotal,
 )
 
 from ..shared.auth import (
     get_admin_user,
     check_admin_or_self,
 )
+from ..shared.msgspec_response import (
+    MSGSPEC_RESPONSES,
+    MsgspecJSONResponse,
+)
+from ..shared.principal import Principal
 
 user_router = APIRouter(prefix="/users", tags=["users"], include_in_schema=True)
 
 
-def get_repository():
-    return UserRepository()
+def get_repository(
+    unit_of_work: UnitOfWork = Depends(get_unit_of_work),
+) -> UserRepository:
+    return unit_of_work.users
 
 
 @user_router.get(
@@ -38,23 +49,53 @@ async def list_users(
     name: str | None = Query(None),
     page: int = Query(1, ge=1),
     page_size: int = Query(10, ge=1, le=100),
-    _admin_payload: dict = Depends(get_admin_user),
-) -> dict:
+    cursor: str | None = Query(
+        None,
+        description="Cursor opaco ('next_cursor' da página anterior). Quando informado, 'page' é ignorado.",
+    ),
+    include_total: IncludeTotal = Query(
+        "exact",
+        description="Cálculo do total: exact, estimated (estimativa do planner), window (COUNT(*) OVER () na mesma consulta) ou none.",
+    ),
+    rank_by_similarity: bool = Query(
+        False,
+        description="Ordena a busca por 'name' pela similaridade (pg_trgm). Usa paginação por 'page'; ignorado sem pg_trgm.",
+    ),
+    _admin: Principal = Depends(get_admin_user),
+    repo: UserRepository = Depends(get_repository),
+) -> dict | Response:
     """
     Endpoint para listar users com paginação e filtros.
     Acesso restrito a administradores.
     """
-    filter_dto = UserListFilterDto(role=role, name=name, page=page, page_size=page_size)
-    use_case = GetUsersListUsecase(filter_dto, UserRepository())
-    users, total_count = await use_case.execute()
-
-    return {
+    filter_dto = UserListFilterDto(
+        role=role,
+        name=name,
+        page=page,
+        page_size=page_size,
+        cursor=cursor,
+        include_total=include_total,
+        rank_by_similarity=rank_by_similarity,
+    )
+    use_case = GetUsersListUsecase(filter_dto, repo, response_structs=MSGSPEC_RESPONSES)
+    users, total_count, next_cursor = await use_case.execute()
+
+    response = {
         "items": users,
         "total": total_count,
         "page": page,
         "page_size": page_size,
-        "total_pages": (total_count + page_size - 1) // page_size,
+        "total_pages": (
+            (total_count + page_size - 1) // page_size
+            if total_count is not None
+            else None
+        ),
+        "cursor": cursor,
+        "next_cursor": next_cursor,
     }
+    if MSGSPEC_RESPONSES:
+        return MsgspecJSONResponse(PaginatedResponseStruct(**response))
+    return response
 
 
 @user_router.post(
@@ -65,8 +106,8 @@ async def list_users(
 )
 async def create_user(
     create_user_dto: CreateUserDto,
+    _admin: Principal = Depends(get_admin_user),
     repo: UserRepository = Depends(get_repository),
-    _admin_payload: dict = Depends(get_admin_user),
 ) -> UserResponseDto:
     """
     Cria um novo user.
@@ -85,8 +126,8 @@ async def create_user(
 async def update_user(
     user_id: str,
     update_user_dto: UpdateUserDto,
+    _principal: Principal = Depends(check_admin_or_self),
     repo: UserRepository = Depends(get_repository),
-    _auth_payload: dict = Depends(check_admin_or_self),
 ) -> UserResponseDto:
     """
     Atualiza um user.
@@ -104,8 +145,8 @@ async def update_user(
 )
 async def delete_user(
     user_id: str,
+    _admin: Principal = Depends(get_admin_user),
     repo: UserRepository = Depends(get_repository),
-    _admin_payload: dict = Depends(get_admin_user),
 ) -> None:
     """
     Apaga um user.
@@ -123,16 +164,18 @@ async def delete_user(
 )
 async def get_user_by_id(
     user_id: str,
+    _principal: Principal = Depends(check_admin_or_self),
     repo: UserRepository = Depends(get_repository),
-    _auth_payload: dict = Depends(check_admin_or_self),
-) -> UserResponseDto | None:
+) -> UserResponseDto | Response:
     """
     Obtém um user pelo seu ID.
     Acesso permitido para administradores ou para o próprio user.
     """
-    use_case = GetUserByIdUsecase(user_id, repo)
+    use_case = GetUserByIdUsecase(user_id, repo, response_structs=MSGSPEC_RESPONSES)
     user = await use_case.execute()
 
     if not user:
         raise HTTPException(status_code=404, detail="User não encontrado")
+    if isinstance(user, msgspec.Struct):
+        return MsgspecJSONResponse(user)
     return user
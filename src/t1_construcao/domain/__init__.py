@@ -1,2 +1,3 @@
 from .entities import *
+from .exceptions import *
 from .interfaces import *
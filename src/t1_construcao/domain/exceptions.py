@@ -0,0 +1,12 @@
+__all__ = ["AppointmentConflictError", "InvalidCursorError"]
+
+
+class AppointmentConflictError(Exception):
+    """
+    Raised by an AppointmentRepository when a write would make two active
+    appointments of the same service overlap.
+    """
+
+
+class InvalidCursorError(ValueError):
+    """Raised by a repository when a pagination cursor cannot be decoded."""
@@ -11,6 +11,10 @@ __all__ = ["AppointmentRepository"]
 
 @runtime_checkable
 class AppointmentRepository(Protocol):
+    enforces_no_overlap: bool
+    """True when the storage itself rejects overlapping active appointments
+    (raising AppointmentConflictError), making check_conflict redundant."""
+
     async def create(
         self,
         user_id: str,
@@ -18,7 +22,18 @@ class AppointmentRepository(Protocol):
         scheduled_at: datetime,
         notes: str | None = None,
     ) -> "AppointmentEntity":
-        """Create a new appointment."""
+        """Create a new appointment. Raises AppointmentConflictError on overlap."""
+        ...
+
+    async def bulk_create(
+        self,
+        user_id: str,
+        appointments: list[tuple[str, datetime, str | None]],
+    ) -> list["AppointmentEntity"]:
+        """
+        Create (service_id, scheduled_at, notes) appointments for one user atomically.
+        Raises AppointmentConflictError on overlap, in which case none are created.
+        """
         ...
 
     async def update(
@@ -28,15 +43,35 @@ class AppointmentRepository(Protocol):
         notes: str | None = None,
         status: str | None = None,
     ) -> "AppointmentEntity":
-        """Update an existing appointment."""
+        """Update an existing appointment. Raises AppointmentConflictError on overlap."""
+        ...
+
+    async def transition_status(
+        self,
+        from_statuses: tuple[str, ...],
+        to_status: str,
+        appointment_ids: list[str] | None = None,
+        user_id: str | None = None,
+        service_id: str | None = None,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        note: str | None = None,
+    ) -> list[str]:
+        """
+        Atomically move the matching appointments in one of from_statuses to to_status,
+        optionally appending note to their notes. Returns the ids that changed.
+        """
         ...
 
     async def get_by_id(self, appointment_id: str) -> "AppointmentEntity | None":
         """Retrieve an appointment by its ID."""
         ...
 
-    async def delete(self, appointment_id: str) -> None:
-        """Delete an appointment by its ID."""
+    async def delete(self, appointment_id: str, user_id: str | None = None) -> None:
+        """
+        Delete an appointment by its ID, only if it belongs to user_id when given.
+        Raises ValueError when no appointment was deleted.
+        """
         ...
 
     async def get_all(
@@ -48,8 +83,17 @@ class AppointmentRepository(Protocol):
         end_date: datetime | None = None,
         page: int = 1,
         page_size: int = 10,
-    ) -> tuple[list["AppointmentEntity"], int]:
-        """Retrieve all appointments with pagination and filters. Returns (appointments, total_count)."""
+        cursor: str | None = None,
+        include_total: str = "exact",
+        fields: tuple[str, ...] | None = None,
+    ) -> tuple[list["AppointmentEntity"] | list[dict], int | None, str | None]:
+        """
+        Retrieve all appointments with pagination and filters. Returns (appointments, total_count, next_cursor).
+        Pages are read by offset, or after the position encoded in cursor when given;
+        an invalid cursor raises InvalidCursorError. include_total is "exact", "estimated",
+        "window" (counted in the page query) or "none" (total_count is None).
+        With fields, only those columns are read and appointments are dicts of them.
+        """
         ...
 
     async def check_conflict(
@@ -61,3 +105,10 @@ class AppointmentRepository(Protocol):
     ) -> bool:
         """Check if there's a scheduling conflict. Returns True if conflict exists."""
         ...
+
+    async def find_conflicts(self, slots: list[tuple[str, datetime, int]]) -> set[int]:
+        """
+        Check many (service_id, scheduled_at, duration_minutes) slots at once.
+        Returns the indexes of the slots conflicting with stored appointments.
+        """
+        ...
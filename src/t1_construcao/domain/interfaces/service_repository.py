@@ -27,13 +27,20 @@ class ServiceRepository(Protocol):
         price: Decimal | None = None,
         is_active: bool | None = None,
     ) -> "ServiceEntity":
-        """Update an existing service."""
+        """
+        Update an existing service. Raises AppointmentConflictError when the
+        new duration makes its active appointments overlap.
+        """
         ...
 
     async def get_by_id(self, service_id: str) -> "ServiceEntity | None":
         """Retrieve a service by its ID."""
         ...
 
+    async def get_many(self, service_ids: list[str]) -> dict[str, "ServiceEntity"]:
+        """Retrieve several services by ID, keyed by ID. Unknown IDs are omitted."""
+        ...
+
     async def delete(self, service_id: str) -> None:
         """Delete a service by its ID."""
         ...
@@ -44,6 +51,15 @@ class ServiceRepository(Protocol):
         name: str | None = None,
         page: int = 1,
         page_size: int = 10,
-    ) -> tuple[list["ServiceEntity"], int]:
-        """Retrieve all services with pagination and filters. Returns (services, total_count)."""
+        cursor: str | None = None,
+        include_total: str = "exact",
+        rank_by_similarity: bool = False,
+    ) -> tuple[list["ServiceEntity"], int | None, str | None]:
+        """
+        Retrieve all services with pagination and filters. Returns (services, total_count, next_cursor).
+        Pages are read by offset, or after the position encoded in cursor when given;
+        an invalid cursor raises InvalidCursorError. include_total is "exact", "estimated",
+        "window" (counted in the page query) or "none" (total_count is None).
+        rank_by_similarity orders a name search by relevance when the storage supports it.
+        """
         ...
@@ -24,6 +24,10 @@ class UserRepository(Protocol):
         """Retrieve a user by their ID, returning None if not found."""
         ...
 
+    async def get_many(self, user_ids: list[str]) -> dict[str, "UserEntity"]:
+        """Retrieve several users by ID, keyed by ID. Unknown IDs are omitted."""
+        ...
+
     async def delete(self, user_id: str) -> None:
         """Delete a user by their ID."""
         ...
@@ -34,6 +38,15 @@ class UserRepository(Protocol):
         name: str | None = None,
         page: int = 1,
         page_size: int = 10,
-    ) -> tuple[list["UserEntity"], int]:
-        """Retrieve all users with pagination and filters. Returns (users, total_count)."""
+        cursor: str | None = None,
+        include_total: str = "exact",
+        rank_by_similarity: bool = False,
+    ) -> tuple[list["UserEntity"], int | None, str | None]:
+        """
+        Retrieve all users with pagination and filters. Returns (users, total_count, next_cursor).
+        Pages are read by offset, or after the position encoded in cursor when given;
+        an invalid cursor raises InvalidCursorError. include_total is "exact", "estimated",
+        "window" (counted in the page query) or "none" (total_count is None).
+        rank_by_similarity orders a name search by relevance when the storage supports it.
+        """
         ...
@@ -1,2 +1,5 @@
 from .database_starter_service import *
+from .cache_invalidation_service import *
+from .pool_stats import *
 from .repositories import *
+from .unit_of_work import *
@@ -0,0 +1,41 @@
+from tortoise.backends.base.client import BaseDBAsyncClient
+from tortoise.exceptions import IntegrityError
+from t1_construcao.shared import get_env_var
+
+__all__ = [
+    "OVERLAP_ENFORCEMENT",
+    "OVERLAP_CONSTRAINT_NAME",
+    "is_overlap_constraint_installed",
+    "is_overlap_violation",
+]
+
+# "query": conflicts are checked with check_conflict before each write.
+# "constraint": Postgres rejects overlapping active appointments through an
+# exclusion constraint and the pre-check query is skipped.
+OVERLAP_ENFORCEMENT = get_env_var("APPOINTMENT_OVERLAP_ENFORCEMENT", "query")
+if OVERLAP_ENFORCEMENT not in ("query", "constraint"):
+    raise ValueError(
+        "APPOINTMENT_OVERLAP_ENFORCEMENT must be 'query' or 'constraint', "
+        f"got '{OVERLAP_ENFORCEMENT}'."
+    )
+
+# Created, together with the time_range column and the triggers that keep it
+# in sync with scheduled_at and the service duration, by the
+# appointment_overlap_constraint migration.
+OVERLAP_CONSTRAINT_NAME = "appointments_no_overlap"
+
+
+async def is_overlap_constraint_installed(connection: BaseDBAsyncClient) -> bool:
+    """Whether the migration created the exclusion constraint (it is skipped
+    on servers without btree_gist)."""
+    if connection.capabilities.dialect != "postgres":
+        return False
+    rows = await connection.execute_query_dict(
+        "SELECT 1 FROM pg_constraint WHERE conname = $1", [OVERLAP_CONSTRAINT_NAME]
+    )
+    return bool(rows)
+
+
+def is_overlap_violation(error: IntegrityError) -> bool:
+    cause = error.args[0] if error.args else None
+    return getattr(cause, "constraint_name", None) == OVERLAP_CONSTRAINT_NAME
@@ -1,13 +1,87 @@
+from dataclasses import dataclass
+from tortoise.backends.base.config_generator import expand_db_url
 from t1_construcao.shared import get_env_var
 
-__all__ = ["TORTOISE_ORM"]
+__all__ = ["DatabaseSettings", "DATABASE_SETTINGS", "TORTOISE_ORM"]
 
-TORTOISE_ORM = {
-    "connections": {"default": get_env_var("DATABASE_URL")},
-    "apps": {
-        "models": {
-            "models": ["t1_construcao.infrastructure.models", "aerich.models"],
-            "default_connection": "default",
+
+def _optional_int(name: str) -> int | None:
+    value = get_env_var(name, "")
+    return int(value) if value else None
+
+
+def _optional_float(name: str) -> float | None:
+    value = get_env_var(name, "")
+    return float(value) if value else None
+
+
+@dataclass(frozen=True)
+class DatabaseSettings:
+    """
+    Connection settings read once from the environment. Pool options left
+    as None keep the value from the URL query string, or the asyncpg/Tortoise
+    default (minsize 1, maxsize 5, 300s inactive lifetime, 100 cached
+    statements, no command timeout).
+    """
+
+    url: str
+    replica_url: str | None = None
+    pool_min_size: int | None = None
+    pool_max_size: int | None = None
+    max_inactive_connection_lifetime: float | None = None
+    statement_cache_size: int | None = None
+    command_timeout: float | None = None
+
+    @classmethod
+    def from_env(cls) -> "DatabaseSettings":
+        return cls(
+            url=get_env_var("DATABASE_URL"),
+            # Optional read replica for list and detail queries
+            # (see repositories/_read_routing.py)
+            replica_url=get_env_var("DATABASE_REPLICA_URL", "") or None,
+            pool_min_size=_optional_int("DATABASE_POOL_MIN_SIZE"),
+            pool_max_size=_optional_int("DATABASE_POOL_MAX_SIZE"),
+            max_inactive_connection_lifetime=_optional_float(
+                "DATABASE_POOL_MAX_INACTIVE_LIFETIME_SECONDS"
+            ),
+            statement_cache_size=_optional_int("DATABASE_STATEMENT_CACHE_SIZE"),
+            command_timeout=_optional_float("DATABASE_COMMAND_TIMEOUT_SECONDS"),
+        )
+
+    def pool_options(self) -> dict[str, int | float]:
+        """Options passed to asyncpg.create_pool, under Tortoise's names."""
+        options = {
+            "minsize": self.pool_min_size,
+            "maxsize": self.pool_max_size,
+            "max_inactive_connection_lifetime": self.max_inactive_connection_lifetime,
+            "statement_cache_size": self.statement_cache_size,
+            "command_timeout": self.command_timeout,
+        }
+        return {key: value for key, value in options.items() if value is not None}
+
+    def connection_config(self, url: str) -> str | dict:
+        """Tortoise config for one connection, with the pool options applied."""
+        db_config = expand_db_url(url)
+        if db_config["engine"] != "tortoise.backends.asyncpg":
+            return url
+        db_config["credentials"].update(self.pool_options())
+        return db_config
+
+    def tortoise_config(self) -> dict:
+        connections = {"default": self.connection_config(self.url)}
+        if self.replica_url:
+            connections["replica"] = self.connection_config(self.replica_url)
+        return {
+            "connections": connections,
+            "apps": {
+                "models": {
+                    "models": ["t1_construcao.infrastructure.models", "aerich.models"],
+                    "default_connection": "default",
+                }
+            },
         }
-    },
-}
+
+
+DATABASE_SETTINGS = DatabaseSettings.from_env()
+
+TORTOISE_ORM = DATABASE_SETTINGS.tortoise_config()
@@ -0,0 +1,68 @@
+import logging
+from pypika_tortoise.terms import Function as PypikaFunction
+from tortoise.backends.base.client import BaseDBAsyncClient
+from tortoise.expressions import Function
+
+__all__ = [
+    "TRIGRAM_INDEXES",
+    "Similarity",
+    "detect_trigram_search",
+    "is_trigram_search_available",
+]
+
+logger = logging.getLogger(__name__)
+
+# name__icontains compiles to UPPER(CAST(name AS VARCHAR)) LIKE UPPER('%x%'),
+# so the indexes are built on that exact expression for the planner to use
+# them without changing the queries.
+TRIGRAM_INDEXES = {
+    "idx_users_name_trgm": "users",
+    "idx_services_name_trgm": "services",
+}
+
+# Read-only: the extension and the indexes are created by the
+# trigram_name_search migration, which skips them when pg_trgm is missing.
+_TRIGRAM_SEARCH_QUERY = """
+SELECT
+    EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm') AS installed,
+    (SELECT count(*) FROM pg_indexes WHERE indexname = ANY($1::text[])) AS indexes
+"""
+
+# Set at startup by detect_trigram_search
+_available = False
+
+
+async def detect_trigram_search(connection: BaseDBAsyncClient) -> bool:
+    """
+    Check whether pg_trgm is installed, which similarity ranking needs.
+    Without it, name searches keep working as plain ILIKE scans.
+    """
+    global _available  # pylint: disable=global-statement
+    if connection.capabilities.dialect != "postgres":
+        _available = False
+        return False
+
+    [row] = await connection.execute_query_dict(
+        _TRIGRAM_SEARCH_QUERY, [list(TRIGRAM_INDEXES)]
+    )
+    if not row["installed"]:
+        logger.warning("pg_trgm is not installed, name searches run unindexed")
+    elif row["indexes"] < len(TRIGRAM_INDEXES):
+        logger.warning("Trigram indexes are missing; run `aerich upgrade`")
+    _available = row["installed"]
+    return _available
+
+
+def is_trigram_search_available() -> bool:
+    return _available
+
+
+class _SimilarityFunction(PypikaFunction):
+    def __init__(self, term, value, **kwargs) -> None:
+        super().__init__("SIMILARITY", term, value, **kwargs)
+
+
+class Similarity(Function):
+    """pg_trgm similarity(field, text), for ranking name searches."""
+
+    database_func = _SimilarityFunction
@@ -0,0 +1,110 @@
+import asyncio
+import contextlib
+import logging
+import asyncpg
+from tortoise import connections
+from tortoise.backends.base.config_generator import expand_db_url
+from ._tortoise_config import DATABASE_SETTINGS
+from .repositories._invalidation_bus import (
+    INVALIDATION_BUS_ENABLED,
+    INVALIDATION_CHANNEL,
+    apply_payload,
+)
+from .repositories._local_caches import reset_local_caches
+
+__all__ = ["CacheInvalidationService"]
+
+logger = logging.getLogger(__name__)
+
+
+class CacheInvalidationService:
+    """
+    Listens on the invalidation channel with a dedicated connection to
+    DATABASE_URL (outside the Tortoise pool) and applies the change events published by other
+    workers to this process's caches. When the connection drops, events may
+    have been missed, so the local caches are reset before listening again.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = INVALIDATION_BUS_ENABLED,
+        database_url: str = DATABASE_SETTINGS.url,
+        retry_interval: float = 5.0,
+    ) -> None:
+        self._enabled = enabled
+        self._database_url = database_url
+        self._retry_interval = retry_interval
+        self._task: asyncio.Task | None = None
+        self._listening = asyncio.Event()
+        self._pending: set[asyncio.Task] = set()
+
+    async def startup(self) -> None:
+        """Start listening; requires the database to be initialized"""
+        if not self._enabled:
+            return
+        if connections.get("default").capabilities.dialect != "postgres":
+            logger.warning("Cache invalidation bus requires PostgreSQL; disabled")
+            return
+        self._task = asyncio.create_task(self._listen_loop())
+        await self._listening.wait()
+
+    async def shutdown(self) -> None:
+        """Stop listening"""
+        if self._task is None:
+            return
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    async def _listen_loop(self) -> None:
+        reconnecting = False
+        while True:
+            try:
+                await self._listen(reset_caches=reconnecting)
+            except (OSError, asyncpg.PostgresError) as e:
+                logger.warning("Cache invalidation listener disconnected: %s", e)
+            except Exception:  # pylint: disable=broad-except
+                # e.g. the cache reset failing on a still flaky database:
+                # keep retrying rather than stop applying invalidations
+                logger.exception("Cache invalidation listener failed")
+            # Startup waits for the first attempt, successful or not
+            self._listening.set()
+            reconnecting = True
+            await asyncio.sleep(self._retry_interval)
+
+    async def _listen(self, reset_caches: bool) -> None:
+        # Parsed like Tortoise does, which also drops its pool options
+        credentials = expand_db_url(self._database_url)["credentials"]
+        connection = await asyncpg.connect(
+            host=credentials.get("host"),
+            port=credentials.get("port"),
+            user=credentials.get("user"),
+            password=credentials.get("password"),
+            database=credentials.get("database"),
+            ssl=credentials.get("ssl"),
+        )
+        closed = asyncio.Event()
+        connection.add_termination_listener(lambda _: closed.set())
+        try:
+            await connection.add_listener(INVALIDATION_CHANNEL, self._on_notification)
+            if reset_caches:
+                await reset_local_caches()
+            self._listening.set()
+            await closed.wait()
+        finally:
+            if not connection.is_closed():
+                await connection.close()
+
+    def _on_notification(self, _connection, _pid, _channel, payload: str) -> None:
+        # Keep a reference until the task finishes, as asyncio only holds weak ones
+        task = asyncio.create_task(self._apply(payload))
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    @staticmethod
+    async def _apply(payload: str) -> None:
+        try:
+            await apply_payload(payload)
+        except Exception:  # pylint: disable=broad-except
+            logger.exception("Invalid cache invalidation event: %s", payload)
@@ -1,8 +1,19 @@
+import logging
 from tortoise import Tortoise
 from ._tortoise_config import TORTOISE_ORM
+from ._appointment_overlap import (
+    OVERLAP_ENFORCEMENT,
+    is_overlap_constraint_installed,
+)
+from ._trigram_search import detect_trigram_search
+from .repositories import AppointmentRepository
+from .repositories._appointment_interval_index import INTERVAL_INDEX_ENABLED
+from .repositories._invalidation_bus import INVALIDATION_BUS_ENABLED
 
 __all__ = ["DatabaseStarterService"]
 
+logger = logging.getLogger(__name__)
+
 
 class DatabaseStarterService:
 
@@ -13,6 +24,27 @@ class DatabaseStarterService:
         """Initialize database connection and generate schemas"""
         await Tortoise.init(config=TORTOISE_ORM)
         await Tortoise.generate_schemas()
+        await detect_trigram_search(Tortoise.get_connection("default"))
+        if OVERLAP_ENFORCEMENT == "constraint" and not (
+            await is_overlap_constraint_installed(Tortoise.get_connection("default"))
+        ):
+            # The pre-check query is skipped in this mode, so running without
+            # the constraint would let overlapping bookings through.
+            raise RuntimeError(
+                "APPOINTMENT_OVERLAP_ENFORCEMENT=constraint requires the "
+                "appointments_no_overlap constraint; run `aerich upgrade` on a "
+                "server with the btree_gist extension"
+            )
+        if INTERVAL_INDEX_ENABLED:
+            if INVALIDATION_BUS_ENABLED:
+                await AppointmentRepository().load_interval_index()
+            else:
+                # Without the bus, bookings made by other workers never reach
+                # this process's index, which would then reject free slots.
+                logger.warning(
+                    "APPOINTMENT_CONFLICT_INDEX requires CACHE_INVALIDATION_BUS; "
+                    "conflict index disabled"
+                )
 
     async def shutdown(self) -> None:
         """Close database connections"""
@@ -0,0 +1,69 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS "services" (
+    "id" UUID NOT NULL PRIMARY KEY,
+    "name" VARCHAR(255) NOT NULL,
+    "description" TEXT NOT NULL,
+    "duration_minutes" INT NOT NULL,
+    "price" DECIMAL(10,2) NOT NULL,
+    "is_active" BOOL NOT NULL DEFAULT True,
+    "created_at" TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    "updated_at" TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+CREATE TABLE IF NOT EXISTS "users" (
+    "id" UUID NOT NULL PRIMARY KEY,
+    "name" VARCHAR(255) NOT NULL,
+    "role" VARCHAR(50) NOT NULL DEFAULT 'client'
+);
+CREATE TABLE IF NOT EXISTS "appointments" (
+    "id" UUID NOT NULL PRIMARY KEY,
+    "scheduled_at" TIMESTAMPTZ NOT NULL,
+    "status" VARCHAR(50) NOT NULL DEFAULT 'pending',
+    "notes" TEXT,
+    "created_at" TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    "updated_at" TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    "service_id" UUID NOT NULL REFERENCES "services" ("id") ON DELETE CASCADE,
+    "user_id" UUID NOT NULL REFERENCES "users" ("id") ON DELETE CASCADE
+);
+CREATE TABLE IF NOT EXISTS "aerich" (
+    "id" SERIAL NOT NULL PRIMARY KEY,
+    "version" VARCHAR(255) NOT NULL,
+    "app" VARCHAR(100) NOT NULL,
+    "content" JSONB NOT NULL
+);"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        """
+
+
+MODELS_STATE = (
+    "eJztmW1v2joUx78KyismdVXL6DZdXU0KD93YCly1sDttmiITG7Ca2FnitEUT3/3azrPjcA"
+    "ejXdh4U8rxOYn9O7aP/+a74VKInODU9DyKCXMRYcZfje8GAS7i/+iaTxoG8LysURgYmDnS"
+    "H2SOsgHMAuYDWzx0DpwAcRNEge1jj2FKuJWEjiOM1OaOmCwyU0jwtxBZjC4QWyKfN3z5ys"
+    "2YQPSAguSrd2vNMXJgodcYindLu8VWnrRNp4PepfQUr5tZNnVCl2Te3ootKUndwxDDUxEj"
+    "2haIIB8wBHPDEL2MR52Yoh5zA/NDlHYVZgaI5iB0BAzj73lIbMGgId8k/rTfGFvgsSkRaL"
+    "EAzce+jkaVjVlaDfGq7jvzuvni5TM5ShqwhS8bJRFjLQMBA1Go5JqBDOwlgqGDoAVYGWmP"
+    "I2HYRXqsaqwCGMbBp8k/u4BODBnpbJYlqBOEe+c6GQz7NxNz+I/ouRsE3xwJxZz0RUtLWl"
+    "eKtRmlgfI1ES2Y9CGNfweTdw3xtfF5POqryUr9Jp8N0ScQMmoRem8BmB92Yk5M3DWXTQZY"
+    "GJTz2F0CvyKHaYSSPY7osfJleIhAkZLdk2a44MFyEFmwJf96cbYhiR/Na7k+Ls6UxIzilp"
+    "ZsWhdAEsqQhuMEPTA9xzRgJ4zx7lGTWd//NClM+ARUc2h+elaY9Ffj0dvEPQe2ezXuKEBt"
+    "H4nh77DLFCMPc48x+BjgmDirONcHsufE03LjlhN6cMfEFiOPif2liY07nyslyL/DNrK2O2"
+    "kVo/Z54vqlW+L/HrBy64Ej2BJaLuRPISYO9vNb7YlU0CjTu6Q+wgvyAa0kwwHvByA20jCL"
+    "Bc00fkxtqWXWbEH64D4VO/lpwYfHB4VYdJgzb7pmr2/olusewN1kTzpcdsV9SI9PzMEZsG"
+    "/vgQ+twmQULbRFFUvqW25yW65qAQQsJAIxENFtBa9Gg+fIV+vveGRH7X342lt+llBWa7XE"
+    "/+mU2k8ejgoirXVx8QMqjXtVyjTZVqy2+Z6VSFarNSXsUIA+tWiDIR8/76PlYhJqBfGAVB"
+    "HWhCqYcXTVWD/MvEv843nrvP2q/frFy/Zr7iL7klpebcjEYDRRMHq+tjL3kI1d4Oj5pTGq"
+    "LoqCTuPgegLcQKfX7w6G5lXz/OykJacln5Q4KszJhG2XbmNwYPEqh+80EDuUOgiQitqTj1"
+    "NAznjgY9FLC9K+6XXG46vCKu8M1GU8HXb6181zhW15Uh4vZH4L3X68kPlNEys7X5LJ1Zol"
+    "mwDqL3TKhhlHX364Rg6oOAHpfxSsX7ar5OD6MRWcvFnQyLfkxqFauwlFfxRuR+FWd53xBM"
+    "LN58e2bRAm/k/4K6Xt4Hjjq9GPlMeKUMOKYCKu1pa6mhC3bKwKIPOpTVmo1PXaqqBR8vHW"
+    "/nPloA4yvroK3PFirr13qt7FciHHWpDfnraBGLsfJsDzsx8pA9yrEqBsU7Q8JSzekYsQ39"
+    "+MRxUiPgtRQE4JH+AXiG120nBwwL7WE+sGimLUm+9C1WtP5QgoHtDZrtjuv7ys/wOSIW7d"
+)
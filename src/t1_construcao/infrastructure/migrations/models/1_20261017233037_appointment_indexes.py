@@ -0,0 +1,48 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE INDEX IF NOT EXISTS "idx_appointments_service_status_scheduled" ON "appointments" ("service_id", "status", "scheduled_at");
+        CREATE INDEX IF NOT EXISTS "idx_appointments_user_scheduled" ON "appointments" ("user_id", "scheduled_at", "id");
+        CREATE INDEX IF NOT EXISTS "idx_appointments_scheduled" ON "appointments" ("scheduled_at", "id");
+        CREATE INDEX IF NOT EXISTS "idx_appointments_active_service_scheduled" ON "appointments" ("service_id", "scheduled_at") WHERE status IN ('pending', 'confirmed');"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP INDEX IF EXISTS "idx_appointments_active_service_scheduled";
+        DROP INDEX IF EXISTS "idx_appointments_scheduled";
+        DROP INDEX IF EXISTS "idx_appointments_user_scheduled";
+        DROP INDEX IF EXISTS "idx_appointments_service_status_scheduled";"""
+
+
+MODELS_STATE = (
+    "eJztWW1v2kgQ/iuWv4RIXJRQ0lZVdZJ5yYVrgBOBa9WqsjbeBVax1669ToIi/vvtLn5d1h"
+    "QIpKbHlwTPzqxnnnnbWT/rjguRHZwZnudiQh1EqP5Be9YJcBD7oVquajrwvHSREyi4swU/"
+    "SBnFArgLqA8svukY2AFiJIgCy8cexS5hVBLaNie6FmPEZJKSQoJ/hMik7gTRKfLZwrfvjI"
+    "wJRE8o4I/P+hgjG4rfeoD8B2whE0P+3sCaIhjaCJqA6lwMPXk+CgL20iDeKbYRwyczq7fJ"
+    "9MUPyIx3TPYSls48IaSLPZlt/EH7fN0etLWAAhoGWqenVU48RCAz56SqnVguGWPfQfDkVJ"
+    "9XtZzWIXuJSmVuKNxYcbHbz9Vd0mIHr97mrXmPCfBe7LvEaWK7tdTi+3n3ptAsF/wLxQTd"
+    "jGVHo07rSnDyqL0zLdcOHZJyezM6dUnCHoYYnnEZvjZBBPmAIpjJBh7sUfLEpEXgMwL1Q5"
+    "REPEwJEI1BaPOc0j+OQ2LxVNLEm/if+p/6BlnGgpNnKOb5ymyfL6xKbRZUnb+qeW0MKm/e"
+    "ngor3YBOfLEoENHnQhBQYKYOToGU4ysPaYtBQrGD1LDKshLAMBI+i39sA3RMSJFOi1UMdQ"
+    "zhznEddrrt26HR/Ydr7gTBD1uAYgzbfKUmqDOJWlm4wWWldVF3k020z53htcYfta/9Xlt2"
+    "VsI3/MrzUQchdU3iPpoAZs2OyTFJpG7izSRT835sToFf4MNEQvIeg2hf/tKjCvyCZNAd8G"
+    "TaiEzolD1enq9w4r/GQOTH5bnkmF60UhNL8xyQxKVIgeOQ1SY1jonAVjBG1aMkUd/+MswF"
+    "fAxUpWt8Oc0F/U2/91fMngG2edNvSIBaPuLmb1Fl8pKHWWN0ZgPsE3sW+fpAak4UlitLTu"
+    "jBLR2blzw69pc6NlI+00pyR8B1T1p5qV2euH5pSfzpASuTD+nYsC5oGZH/C2L8YD++V55I"
+    "ORrL6F25PsIT8gnNBIYdpgcgFlJgFs3Fo2ib0qKWUtOE9MFjMuxkw4KZx4xCdHGYM26bRq"
+    "utq9J1B8DdpjsdLnb5OqSGj8fgHbDuH4EPzVww8hW35kqUhHd5yak5MgUQMBEQcEO42hK8"
+    "iqucDPLF1ziRZfu/wjnO3vuevcX/JSiLZ7WY//UmtRcejnJDWu3yco0pjXEVjmliLd9ts5"
+    "otIVk8rUlihwLoaw9tMGT2Mx1NB5NQORB3SBHCClEJZry4sS4fzEwl9u+P2kX9Xf39m7f1"
+    "94xF6JJQ3q3wRKc3lGD0fGVnbiELO8BW45fIyHPRQugsEi4ngCvQabWbna5xU7k4r9ZEWL"
+    "KgxIvGHAdsfek2BscX/8sgNlzXRoAU9J6snATkHRPcF3pJQ9o1eo1+/yaX5Y2OnMajbqM9"
+    "qFxI2C4H5fFC5reY248XMr+pY4XyS2Ny8cySBoD8oVcqmJH01acBskHBCUj9bbl83i4aB+"
+    "f7nODEzYJifItvHIpnNz7RHwe34+BW9jnjFQY3nx3bNoEw5n/Fr5SWjaPCV6KPlMeOUMKO"
+    "YCA2rU1VPSFaWdkVQMpTmrZQONcru4Jiko9K+8vaQRnG+OIu8MCaufLeqbiKZUSOvSBbnj"
+    "YBMWI/TAAvztdpA4yrEECxJs3yLqFRRc6D+Pdtv1cwxKciEpAjwgz8BrFFq5qNA/q9nLCu"
+    "QJFbvfouVL72lI6AfIPGZs129+1l/h/Kki8i"
+)
@@ -0,0 +1,101 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DO $$
+        BEGIN
+            IF NOT EXISTS (SELECT 1 FROM pg_available_extensions WHERE name = 'btree_gist') THEN
+                RAISE NOTICE 'btree_gist unavailable, skipping the appointment overlap constraint';
+                RETURN;
+            END IF;
+            CREATE EXTENSION IF NOT EXISTS btree_gist;
+            ALTER TABLE "appointments" ADD COLUMN IF NOT EXISTS "time_range" tstzrange;
+
+            CREATE OR REPLACE FUNCTION appointments_set_time_range() RETURNS trigger AS $fn$
+            BEGIN
+                NEW.time_range := tstzrange(
+                    NEW.scheduled_at,
+                    NEW.scheduled_at + (
+                        SELECT s.duration_minutes FROM services AS s WHERE s.id = NEW.service_id
+                    ) * INTERVAL '1 minute'
+                );
+                RETURN NEW;
+            END;
+            $fn$ LANGUAGE plpgsql;
+            DROP TRIGGER IF EXISTS "appointments_set_time_range" ON "appointments";
+            CREATE TRIGGER "appointments_set_time_range"
+                BEFORE INSERT OR UPDATE OF scheduled_at, service_id ON "appointments"
+                FOR EACH ROW EXECUTE FUNCTION appointments_set_time_range();
+
+            CREATE OR REPLACE FUNCTION services_refresh_appointment_time_ranges() RETURNS trigger AS $fn$
+            BEGIN
+                UPDATE appointments
+                SET time_range = tstzrange(
+                    scheduled_at, scheduled_at + NEW.duration_minutes * INTERVAL '1 minute'
+                )
+                WHERE service_id = NEW.id;
+                RETURN NULL;
+            END;
+            $fn$ LANGUAGE plpgsql;
+            DROP TRIGGER IF EXISTS "services_refresh_appointment_time_ranges" ON "services";
+            CREATE TRIGGER "services_refresh_appointment_time_ranges"
+                AFTER UPDATE OF duration_minutes ON "services"
+                FOR EACH ROW WHEN (OLD.duration_minutes IS DISTINCT FROM NEW.duration_minutes)
+                EXECUTE FUNCTION services_refresh_appointment_time_ranges();
+
+            UPDATE "appointments" AS a
+            SET time_range = tstzrange(
+                a.scheduled_at, a.scheduled_at + s.duration_minutes * INTERVAL '1 minute'
+            )
+            FROM "services" AS s
+            WHERE s.id = a.service_id AND a.time_range IS NULL;
+
+            IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conname = 'appointments_no_overlap') THEN
+                ALTER TABLE "appointments" ADD CONSTRAINT "appointments_no_overlap"
+                    EXCLUDE USING gist (service_id WITH =, time_range WITH &&)
+                    WHERE (status IN ('pending', 'confirmed'));
+            END IF;
+        END;
+        $$;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "appointments" DROP CONSTRAINT IF EXISTS "appointments_no_overlap";
+        DROP TRIGGER IF EXISTS "services_refresh_appointment_time_ranges" ON "services";
+        DROP FUNCTION IF EXISTS services_refresh_appointment_time_ranges();
+        DROP TRIGGER IF EXISTS "appointments_set_time_range" ON "appointments";
+        DROP FUNCTION IF EXISTS appointments_set_time_range();
+        ALTER TABLE "appointments" DROP COLUMN IF EXISTS "time_range";"""
+
+
+MODELS_STATE = (
+    "eJztWW1v2kgQ/iuWv4RIXJRQ0lZVdZJ5yYVrgBOBa9WqsjbeBVax1669ToIi/vvtLn5d1h"
+    "QIpKbHlwTPzqxnnnnbWT/rjguRHZwZnudiQh1EqP5Be9YJcBD7oVquajrwvHSREyi4swU/"
+    "SBnFArgLqA8svukY2AFiJIgCy8cexS5hVBLaNie6FmPEZJKSQoJ/hMik7gTRKfLZwrfvjI"
+    "wJRE8o4I/P+hgjG4rfeoD8B2whE0P+3sCaIhjaCJqA6lwMPXk+CgL20iDeKbYRwyczq7fJ"
+    "9MUPyIx3TPYSls48IaSLPZlt/EH7fN0etLWAAhoGWqenVU48RCAz56SqnVguGWPfQfDkVJ"
+    "9XtZzWIXuJSmVuKNxYcbHbz9Vd0mIHr97mrXmPCfBe7LvEaWK7tdTi+3n3ptAsF/wLxQTd"
+    "jGVHo07rSnDyqL0zLdcOHZJyezM6dUnCHoYYnnEZvjZBBPmAIpjJBh7sUfLEpEXgMwL1Q5"
+    "REPEwJEI1BaPOc0j+OQ2LxVNLEm/if+p/6BlnGgpNnKOb5ymyfL6xKbRZUnb+qeW0MKm/e"
+    "ngor3YBOfLEoENHnQhBQYKYOToGU4ysPaYtBQrGD1LDKshLAMBI+i39sA3RMSJFOi1UMdQ"
+    "zhznEddrrt26HR/Ydr7gTBD1uAYgzbfKUmqDOJWlm4wWWldVF3k020z53htcYfta/9Xlt2"
+    "VsI3/MrzUQchdU3iPpoAZs2OyTFJpG7izSRT835sToFf4MNEQvIeg2hf/tKjCvyCZNAd8G"
+    "TaiEzolD1enq9w4r/GQOTH5bnkmF60UhNL8xyQxKVIgeOQ1SY1jonAVjBG1aMkUd/+MswF"
+    "fAxUpWt8Oc0F/U2/91fMngG2edNvSIBaPuLmb1Fl8pKHWWN0ZgPsE3sW+fpAak4UlitLTu"
+    "jBLR2blzw69pc6NlI+00pyR8B1T1p5qV2euH5pSfzpASuTD+nYsC5oGZH/C2L8YD++V55I"
+    "ORrL6F25PsIT8gnNBIYdpgcgFlJgFs3Fo2ib0qKWUtOE9MFjMuxkw4KZx4xCdHGYM26bRq"
+    "utq9J1B8DdpjsdLnb5OqSGj8fgHbDuH4EPzVww8hW35kqUhHd5yak5MgUQMBEQcEO42hK8"
+    "iqucDPLF1ziRZfu/wjnO3vuevcX/JSiLZ7WY//UmtRcejnJDWu3yco0pjXEVjmliLd9ts5"
+    "otIVk8rUlihwLoaw9tMGT2Mx1NB5NQORB3SBHCClEJZry4sS4fzEwl9u+P2kX9Xf39m7f1"
+    "94xF6JJQ3q3wRKc3lGD0fGVnbiELO8BW45fIyHPRQugsEi4ngCvQabWbna5xU7k4r9ZEWL"
+    "KgxIvGHAdsfek2BscX/8sgNlzXRoAU9J6snATkHRPcF3pJQ9o1eo1+/yaX5Y2OnMajbqM9"
+    "qFxI2C4H5fFC5reY248XMr+pY4XyS2Ny8cySBoD8oVcqmJH01acBskHBCUj9bbl83i4aB+"
+    "f7nODEzYJifItvHIpnNz7RHwe34+BW9jnjFQY3nx3bNoEw5n/Fr5SWjaPCV6KPlMeOUMKO"
+    "YCA2rU1VPSFaWdkVQMpTmrZQONcru4Jiko9K+8vaQRnG+OIu8MCaufLeqbiKZUSOvSBbnj"
+    "YBMWI/TAAvztdpA4yrEECxJs3yLqFRRc6D+Pdtv1cwxKciEpAjwgz8BrFFq5qNA/q9nLCu"
+    "QJFbvfouVL72lI6AfIPGZs129+1l/h/Kki8i"
+)
@@ -1,4 +1,5 @@
 from tortoise import fields
+from tortoise.indexes import Index, PartialIndex
 from tortoise.models import Model
 from .user import User
 from .service import Service
@@ -21,3 +22,28 @@ class Appointment(Model):
 
     class Meta:
         table = "appointments"
+        indexes = (
+            # check_conflict: active appointments of one service by start time.
+            # The condition is rendered as "<key> = <value>", so the status
+            # test is the key: WHERE status IN (...) = true
+            PartialIndex(
+                fields=("service_id", "scheduled_at"),
+                name="idx_appointments_active_service_scheduled",
+                condition={"status IN ('pending', 'confirmed')": True},
+            ),
+            # Client list view: own appointments ordered by (scheduled_at, id)
+            Index(
+                fields=("user_id", "scheduled_at", "id"),
+                name="idx_appointments_user_scheduled",
+            ),
+            # Staff list view and keyset pagination over all appointments
+            Index(
+                fields=("scheduled_at", "id"),
+                name="idx_appointments_scheduled",
+            ),
+            # Lists filtered by service and status
+            Index(
+                fields=("service_id", "status", "scheduled_at"),
+                name="idx_appointments_service_status_scheduled",
+            ),
+        )
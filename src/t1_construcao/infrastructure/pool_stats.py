@@ -0,0 +1,56 @@
+from dataclasses import dataclass
+from tortoise import connections
+
+__all__ = ["PoolStats", "get_pool_stats"]
+
+
+@dataclass(frozen=True)
+class PoolStats:
+    connection: str
+    min_size: int
+    max_size: int
+    size: int
+    in_use: int
+    idle: int
+    # Best effort: read from asyncpg internals, None when they are not there
+    waiters: int | None
+
+
+def _waiters(pool) -> int | None:
+    # asyncpg has no public count of waiting tasks. It hands out connections
+    # through an asyncio queue, where tasks blocked in acquire() are the
+    # queue's pending getters; both attributes are private.
+    getters = getattr(getattr(pool, "_queue", None), "_getters", None)
+    if getters is None:
+        return None
+    return sum(1 for getter in getters if not getter.done())
+
+
+def get_pool_stats() -> list[PoolStats]:
+    """
+    Utilization of every asyncpg pool opened by Tortoise. Connections whose
+    pool has not been created yet, or that are not pooled (SQLite), are
+    left out.
+    """
+    stats = []
+    for alias in connections.db_config:
+        client = connections.get(alias)
+        # Inside a transaction the alias resolves to a wrapper of the client
+        client = getattr(client, "_parent", client)
+        pool = getattr(client, "_pool", None)
+        if pool is None or not hasattr(pool, "get_idle_size"):
+            continue
+        size = pool.get_size()
+        idle = pool.get_idle_size()
+        stats.append(
+            PoolStats(
+                connection=alias,
+                min_size=pool.get_min_size(),
+                max_size=pool.get_max_size(),
+                size=size,
+                in_use=size - idle,
+                idle=idle,
+                waiters=_waiters(pool),
+            )
+        )
+    return stats
@@ -1,3 +1,4 @@
 from .user_repository import *
 from .service_repository import *
 from .appointment_repository import *
+from ._read_routing import *
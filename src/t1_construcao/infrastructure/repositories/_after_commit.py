@@ -0,0 +1,42 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Iterator
+
+__all__ = ["after_commit", "deferred_until_commit"]
+
+# Callbacks waiting for the enclosing transaction of the current context to
+# commit; None outside deferred_until_commit(), where writes commit at once.
+_pending: ContextVar[list[Callable[[], None]] | None] = ContextVar(
+    "after_commit", default=None
+)
+
+
+def after_commit(callback: Callable[[], None]) -> None:
+    """
+    Run callback once the current write is durable: immediately, or when
+    the transaction opened with deferred_until_commit() commits. Used for
+    process-local state (the interval index) that must not see writes that
+    are later rolled back.
+    """
+    pending = _pending.get()
+    if pending is None:
+        callback()
+    else:
+        pending.append(callback)
+
+
+@contextmanager
+def deferred_until_commit() -> Iterator[None]:
+    """
+    Hold after_commit callbacks until the block exits. Enter it before the
+    transaction so it exits after the commit: callbacks run if the block
+    succeeds and are dropped if it raises.
+    """
+    callbacks: list[Callable[[], None]] = []
+    token = _pending.set(callbacks)
+    try:
+        yield
+    finally:
+        _pending.reset(token)
+    for callback in callbacks:
+        callback()
@@ -0,0 +1,121 @@
+from bisect import bisect_left, insort
+from datetime import datetime, timedelta
+from typing import Iterable
+from t1_construcao.shared import get_env_var
+from ..models import Appointment
+
+__all__ = [
+    "INTERVAL_INDEX_ENABLED",
+    "AppointmentIntervalIndex",
+]
+
+INTERVAL_INDEX_ENABLED = (
+    get_env_var("APPOINTMENT_CONFLICT_INDEX", "false").lower() == "true"
+)
+
+_scheduled_at_field = Appointment._meta.fields_map["scheduled_at"]
+
+
+def _normalize(scheduled_at: datetime) -> datetime:
+    """Make datetimes comparable the same way the ORM stores them."""
+    return _scheduled_at_field.to_python_value(scheduled_at)
+
+
+class AppointmentIntervalIndex:
+    """
+    In-memory index of active (pending/confirmed) appointments per service.
+
+    Start times are kept in a sorted array per service. Every appointment of
+    a service lasts the service's current duration, so end times are sorted
+    in the same order and an overlap check only has to inspect the last
+    appointment starting before the candidate slot ends: a binary search.
+
+    The index is local to the process and only ever used to reject
+    conflicts early; the database remains the authority for accepting them.
+    """
+
+    ACTIVE_STATUSES = frozenset({"pending", "confirmed"})
+
+    def __init__(self) -> None:
+        self._starts: dict[str, list[tuple[datetime, str]]] = {}
+        self._appointments: dict[str, tuple[str, datetime]] = {}
+        self._durations: dict[str, int] = {}
+        self.loaded = False
+
+    def load(
+        self,
+        appointments: Iterable[tuple[str, str, datetime]],
+        service_durations: dict[str, int],
+    ) -> None:
+        """Replace the index content with (id, service_id, scheduled_at) rows."""
+        self._starts = {}
+        self._appointments = {}
+        self._durations = dict(service_durations)
+        for appointment_id, service_id, scheduled_at in appointments:
+            self._add(appointment_id, service_id, _normalize(scheduled_at))
+        for starts in self._starts.values():
+            starts.sort()
+        self.loaded = True
+
+    def set_service_duration(self, service_id: str, duration_minutes: int) -> None:
+        self._durations[service_id] = duration_minutes
+
+    def remove_service(self, service_id: str) -> None:
+        self._durations.pop(service_id, None)
+        for _, appointment_id in self._starts.pop(service_id, []):
+            self._appointments.pop(appointment_id, None)
+
+    def upsert(
+        self,
+        appointment_id: str,
+        service_id: str,
+        scheduled_at: datetime,
+        status: str,
+    ) -> None:
+        self.remove(appointment_id)
+        if status in self.ACTIVE_STATUSES:
+            scheduled_at = _normalize(scheduled_at)
+            self._appointments[appointment_id] = (service_id, scheduled_at)
+            insort(
+                self._starts.setdefault(service_id, []), (scheduled_at, appointment_id)
+            )
+
+    def remove(self, appointment_id: str) -> None:
+        entry = self._appointments.pop(appointment_id, None)
+        if entry is None:
+            return
+        service_id, scheduled_at = entry
+        starts = self._starts[service_id]
+        del starts[bisect_left(starts, (scheduled_at, appointment_id))]
+
+    def has_conflict(
+        self,
+        service_id: str,
+        scheduled_at: datetime,
+        duration_minutes: int,
+        exclude_appointment_id: str | None = None,
+    ) -> bool:
+        starts = self._starts.get(service_id)
+        service_duration = self._durations.get(service_id)
+        if not starts or service_duration is None:
+            return False
+
+        if duration_minutes <= 0:
+            duration_minutes = service_duration
+        start_time = _normalize(scheduled_at)
+        end_time = start_time + timedelta(minutes=duration_minutes)
+
+        # Last appointment starting before the new slot ends
+        i = bisect_left(starts, (end_time,)) - 1
+        while i >= 0:
+            apt_start, appointment_id = starts[i]
+            if appointment_id != exclude_appointment_id:
+                return apt_start + timedelta(minutes=service_duration) > start_time
+            i -= 1
+        return False
+
+    def _add(
+        self, appointment_id: str, service_id: str, scheduled_at: datetime
+    ) -> None:
+        self._appointments[appointment_id] = (service_id, scheduled_at)
+        self._starts.setdefault(service_id, []).append((scheduled_at, appointment_id))
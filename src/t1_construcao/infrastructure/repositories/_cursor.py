@@ -0,0 +1,32 @@
+import base64
+import binascii
+import json
+from typing import Any, Callable
+from t1_construcao.domain import InvalidCursorError
+
+__all__ = ["encode_cursor", "decode_cursor"]
+
+
+def encode_cursor(*values: str) -> str:
+    """Encode the sort key of the last row of a page as an opaque cursor."""
+    raw = json.dumps(list(values), separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str, *parsers: Callable[[str], Any]) -> list[Any]:
+    """
+    Decode a cursor produced by encode_cursor, converting each key value
+    with the matching parser (e.g. UUID, datetime.fromisoformat).
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+        if (
+            not isinstance(values, list)
+            or len(values) != len(parsers)
+            or not all(isinstance(value, str) for value in values)
+        ):
+            raise ValueError("Unexpected cursor content")
+        return [parse(value) for parse, value in zip(parsers, values)]
+    except (binascii.Error, ValueError) as e:
+        raise InvalidCursorError("Invalid cursor") from e
@@ -0,0 +1,16 @@
+from t1_construcao.shared import get_env_var
+
+__all__ = ["fast_reads_enabled"]
+
+# Repositories whose reads skip model instantiation and build entities from
+# plain rows: a comma-separated list of "appointments", "services", "users",
+# or "all". Each repository copies its flag to a 'fast_reads' attribute.
+_FAST_READS = {
+    name.strip()
+    for name in get_env_var("REPOSITORY_FAST_READS", "").split(",")
+    if name.strip()
+}
+
+
+def fast_reads_enabled(repository: str) -> bool:
+    return "all" in _FAST_READS or repository in _FAST_READS
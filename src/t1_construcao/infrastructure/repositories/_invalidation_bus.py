@@ -0,0 +1,101 @@
+import json
+import logging
+import uuid
+from datetime import datetime
+from typing import Any
+from tortoise import connections
+from t1_construcao.shared import get_env_var
+from ._local_caches import appointment_interval_index, service_cache
+
+__all__ = [
+    "INVALIDATION_BUS_ENABLED",
+    "INVALIDATION_CHANNEL",
+    "publish",
+    "apply_payload",
+]
+
+logger = logging.getLogger(__name__)
+
+INVALIDATION_BUS_ENABLED = (
+    get_env_var("CACHE_INVALIDATION_BUS", "false").lower() == "true"
+)
+INVALIDATION_CHANNEL = "t1_cache_invalidation"
+
+# Identifies this process, so it skips the events it published itself:
+# its own caches were already updated by the write that emitted them.
+PROCESS_ID = uuid.uuid4().hex
+
+# NOTIFY payloads must stay under 8000 bytes
+_MAX_PAYLOAD_BYTES = 7500
+
+
+def _payloads(events: list[dict[str, Any]]) -> list[str]:
+    """Pack events into as few NOTIFY payloads as the size limit allows."""
+    payloads = []
+    batch: list[str] = []
+    size = 0
+    for event in events:
+        encoded = json.dumps(event, separators=(",", ":"), default=str)
+        if batch and size + len(encoded) + 1 > _MAX_PAYLOAD_BYTES:
+            payloads.append(f'{{"origin":"{PROCESS_ID}","events":[{",".join(batch)}]}}')
+            batch, size = [], 0
+        batch.append(encoded)
+        size += len(encoded) + 1
+    if batch:
+        payloads.append(f'{{"origin":"{PROCESS_ID}","events":[{",".join(batch)}]}}')
+    return payloads
+
+
+async def publish(*events: dict[str, Any]) -> None:
+    """
+    Announce repository writes to the other workers with NOTIFY. Each event
+    has an "entity" ("services" or "appointments"), an "op" ("upsert",
+    "delete" or, for appointments, "status"), an "id" and the fields the
+    local caches need. Does nothing unless CACHE_INVALIDATION_BUS is enabled.
+    """
+    if not INVALIDATION_BUS_ENABLED or not events:
+        return
+    connection = connections.get("default")
+    for payload in _payloads(list(events)):
+        await connection.execute_query(
+            "SELECT pg_notify($1, $2)", [INVALIDATION_CHANNEL, payload]
+        )
+
+
+async def apply_payload(payload: str) -> None:
+    """Apply the events of a NOTIFY payload published by another process."""
+    message = json.loads(payload)
+    if message.get("origin") == PROCESS_ID:
+        return
+    for event in message["events"]:
+        if event["entity"] == "services":
+            await _apply_service_event(event)
+        elif event["entity"] == "appointments":
+            _apply_appointment_event(event)
+
+
+async def _apply_service_event(event: dict[str, Any]) -> None:
+    await service_cache.invalidate(event["id"])
+    if event["op"] == "delete":
+        appointment_interval_index.remove_service(event["id"])
+    else:
+        appointment_interval_index.set_service_duration(
+            event["id"], event["duration_minutes"]
+        )
+
+
+def _apply_appointment_event(event: dict[str, Any]) -> None:
+    if not appointment_interval_index.loaded:
+        return
+    if event["op"] == "delete":
+        appointment_interval_index.remove(event["id"])
+    elif event["op"] == "status":
+        if event["status"] not in appointment_interval_index.ACTIVE_STATUSES:
+            appointment_interval_index.remove(event["id"])
+    else:
+        appointment_interval_index.upsert(
+            event["id"],
+            event["service_id"],
+            datetime.fromisoformat(event["scheduled_at"]),
+            event["status"],
+        )
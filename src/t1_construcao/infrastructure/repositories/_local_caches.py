@@ -0,0 +1,52 @@
+from t1_construcao.shared import get_env_var
+from ._appointment_interval_index import AppointmentIntervalIndex
+from ._service_cache import ServiceCache, create_cache_backend
+from ..models import Appointment, Service
+
+__all__ = [
+    "service_cache",
+    "appointment_interval_index",
+    "load_interval_index",
+    "reset_local_caches",
+]
+
+# A per-process cache only learns about other workers' writes through the
+# invalidation bus (or its TTL), so it is on by default only with the bus.
+_DEFAULT_CACHE_BACKEND = (
+    "memory"
+    if get_env_var("CACHE_INVALIDATION_BUS", "false").lower() == "true"
+    else "none"
+)
+
+service_cache = ServiceCache(
+    create_cache_backend(
+        get_env_var("SERVICE_CACHE_BACKEND", _DEFAULT_CACHE_BACKEND).lower(),
+        max_size=int(get_env_var("SERVICE_CACHE_MAX_SIZE", "1024")),
+        url=get_env_var("SERVICE_CACHE_URL", "") or None,
+    ),
+    ttl=float(get_env_var("SERVICE_CACHE_TTL_SECONDS", "60")),
+)
+
+appointment_interval_index = AppointmentIntervalIndex()
+
+
+async def load_interval_index() -> None:
+    """Fill the in-memory interval index with every active appointment."""
+    appointments = await Appointment.filter(
+        status__in=list(appointment_interval_index.ACTIVE_STATUSES)
+    ).values_list("id", "service_id", "scheduled_at")
+    durations = await Service.all().values_list("id", "duration_minutes")
+    appointment_interval_index.load(
+        (
+            (str(appointment_id), str(service_id), scheduled_at)
+            for appointment_id, service_id, scheduled_at in appointments
+        ),
+        {str(service_id): duration for service_id, duration in durations},
+    )
+
+
+async def reset_local_caches() -> None:
+    """Drop every cached entry, e.g. after missing events while disconnected."""
+    await service_cache.clear()
+    if appointment_interval_index.loaded:
+        await load_interval_index()
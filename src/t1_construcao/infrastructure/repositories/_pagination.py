@@ -0,0 +1,119 @@
+import json
+from typing import Any, TypeVar
+from tortoise import connections
+from tortoise.expressions import Q, RawSQL
+from tortoise.models import Model
+from tortoise.queryset import QuerySet
+
+__all__ = ["TOTAL_MODES", "paginate", "paginate_values", "estimate_count"]
+
+MODEL = TypeVar("MODEL", bound=Model)
+
+# exact: COUNT(*) query before the page (default)
+# estimated: row estimate from the Postgres planner, no scan
+# window: COUNT(*) OVER () on the page query itself, a single round trip
+# none: no total at all, for infinite scroll
+TOTAL_MODES = ("exact", "estimated", "window", "none")
+
+_WINDOW_TOTAL = "window_total"
+
+
+async def estimate_count(query: QuerySet) -> int:
+    """
+    Row count estimated by the Postgres planner for the filtered query,
+    read from EXPLAIN without executing it, on the query's own connection.
+    Other databases get an exact count.
+    """
+    connection = query._db or connections.get("default")
+    if connection.capabilities.dialect != "postgres":
+        return await query.count()
+
+    rows = await connection.execute_query_dict(
+        "EXPLAIN (FORMAT JSON) " + query.all().sql(params_inline=True)
+    )
+    plan = rows[0]["QUERY PLAN"]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+async def paginate(
+    query: QuerySet[MODEL],
+    order_by: tuple[str, ...],
+    page: int,
+    page_size: int,
+    after: Q | None = None,
+    include_total: str = "exact",
+) -> tuple[list[MODEL], int | None, bool]:
+    """
+    Read one page of 'query', by OFFSET or after the keyset filter 'after',
+    and its total according to include_total. Returns (rows, total, has_next)
+    with the rows as model instances.
+
+    In window mode with a keyset filter the window would only see the rows
+    after the cursor, so the total falls back to an exact count.
+    """
+    return await _paginate(query, order_by, page, page_size, after, include_total)
+
+
+async def paginate_values(
+    query: QuerySet,
+    order_by: tuple[str, ...],
+    page: int,
+    page_size: int,
+    fields: tuple[str, ...],
+    after: Q | None = None,
+    include_total: str = "exact",
+) -> tuple[list[dict], int | None, bool]:
+    """Like paginate, but reads the rows as dicts of the given fields."""
+    return await _paginate(
+        query, order_by, page, page_size, after, include_total, values=fields
+    )
+
+
+async def _paginate(
+    query: QuerySet,
+    order_by: tuple[str, ...],
+    page: int,
+    page_size: int,
+    after: Q | None,
+    include_total: str,
+    values: tuple[str, ...] | None = None,
+) -> tuple[list[Any], int | None, bool]:
+    if include_total not in TOTAL_MODES:
+        raise ValueError(
+            f"include_total must be one of: {', '.join(TOTAL_MODES)}, "
+            f"got '{include_total}'."
+        )
+
+    total = None
+    use_window = include_total == "window" and after is None
+    if include_total == "exact" or (include_total == "window" and not use_window):
+        total = await query.count()
+    elif include_total == "estimated":
+        total = await estimate_count(query)
+
+    if after is not None:
+        page_query = query.filter(after)
+    else:
+        page_query = query.offset((page - 1) * page_size)
+    if use_window:
+        page_query = page_query.annotate(**{_WINDOW_TOTAL: RawSQL("COUNT(*) OVER ()")})
+
+    # One extra row tells whether there is a next page
+    page_query = page_query.limit(page_size + 1).order_by(*order_by)
+    if values is not None:
+        fields = (*values, _WINDOW_TOTAL) if use_window else values
+        rows = await page_query.values(*fields)
+    else:
+        rows = await page_query
+
+    if use_window:
+        if rows:
+            first = rows[0]
+            total = first[_WINDOW_TOTAL] if values else getattr(first, _WINDOW_TOTAL)
+        else:
+            # Past the last row the window has nothing to report on
+            total = 0 if page == 1 else await query.count()
+
+    return rows[:page_size], total, len(rows) > page_size
@@ -0,0 +1,43 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+from tortoise import connections
+from tortoise.backends.base.client import BaseDBAsyncClient
+
+__all__ = [
+    "REPLICA_CONNECTION",
+    "read_connection",
+    "mark_write",
+    "read_from_primary",
+]
+
+REPLICA_CONNECTION = "replica"
+
+# Set once the current request (asyncio task context) has written through a
+# repository, so its following reads see that write instead of replica lag.
+_read_primary: ContextVar[bool] = ContextVar("read_primary", default=False)
+
+
+def read_connection() -> BaseDBAsyncClient:
+    """
+    Connection for list/detail reads: the replica when one is configured
+    and the current context has not written yet, otherwise the primary.
+    """
+    if not _read_primary.get() and REPLICA_CONNECTION in connections.db_config:
+        return connections.get(REPLICA_CONNECTION)
+    return connections.get("default")
+
+
+def mark_write() -> None:
+    """Route the rest of the current request's reads to the primary."""
+    _read_primary.set(True)
+
+
+@contextmanager
+def read_from_primary() -> Iterator[None]:
+    """Read from the primary inside the block, whether or not a write happened."""
+    token = _read_primary.set(True)
+    try:
+        yield
+    finally:
+        _read_primary.reset(token)
@@ -0,0 +1,161 @@
+import time
+from collections import OrderedDict
+from typing import Any, Protocol
+import msgspec
+from t1_construcao.domain import ServiceEntity
+
+__all__ = [
+    "CacheBackend",
+    "InMemoryCacheBackend",
+    "RedisCacheBackend",
+    "CACHE_BACKENDS",
+    "create_cache_backend",
+    "ServiceCache",
+]
+
+
+class CacheBackend(Protocol):
+    """Key/value store used by ServiceCache. Values expire after ttl seconds."""
+
+    async def get(self, key: str) -> ServiceEntity | None: ...
+
+    async def set(self, key: str, value: ServiceEntity, ttl: float) -> None: ...
+
+    async def delete(self, key: str) -> None: ...
+
+    async def clear(self) -> None: ...
+
+
+class InMemoryCacheBackend:
+    """
+    Process-local LRU cache. Holds at most max_size entries, evicting the
+    least recently used one first; expired entries are dropped on read.
+    Cached entities are shared between callers and must not be mutated.
+    """
+
+    def __init__(self, max_size: int = 1024) -> None:
+        self._max_size = max_size
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    async def get(self, key: str) -> Any | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: Any, ttl: float) -> None:
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    async def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    async def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class RedisCacheBackend:
+    """
+    Shared cache on a Redis-compatible server, so every worker sees the same
+    entries. client is any object with the async get/set(ex=)/delete/scan_iter
+    subset of redis.asyncio.Redis; entities are stored as JSON. Size bounds
+    are left to the server's maxmemory eviction policy.
+    """
+
+    def __init__(self, client: Any, key_prefix: str = "t1:services:") -> None:
+        self._client = client
+        self._key_prefix = key_prefix
+
+    @classmethod
+    def from_url(cls, url: str) -> "RedisCacheBackend":
+        try:
+            from redis.asyncio import Redis
+        except ImportError as e:
+            raise ValueError(
+                "The 'redis' cache backend requires the 'redis' package; "
+                "install the project with the 'redis' extra"
+            ) from e
+        return cls(Redis.from_url(url))
+
+    async def get(self, key: str) -> ServiceEntity | None:
+        data = await self._client.get(self._key_prefix + key)
+        if data is None:
+            return None
+        return msgspec.json.decode(data, type=ServiceEntity)
+
+    async def set(self, key: str, value: ServiceEntity, ttl: float) -> None:
+        await self._client.set(
+            self._key_prefix + key,
+            msgspec.json.encode(value),
+            ex=max(1, round(ttl)),
+        )
+
+    async def delete(self, key: str) -> None:
+        await self._client.delete(self._key_prefix + key)
+
+    async def clear(self) -> None:
+        async for key in self._client.scan_iter(match=self._key_prefix + "*"):
+            await self._client.delete(key)
+
+
+CACHE_BACKENDS = ("memory", "redis", "none")
+
+
+def create_cache_backend(
+    backend: str, max_size: int = 1024, url: str | None = None
+) -> CacheBackend | None:
+    if backend == "memory":
+        return InMemoryCacheBackend(max_size)
+    if backend == "redis":
+        if not url:
+            raise ValueError("The 'redis' cache backend requires a URL")
+        return RedisCacheBackend.from_url(url)
+    if backend == "none":
+        return None
+    raise ValueError(
+        f"Unknown cache backend '{backend}'. "
+        f"Expected one of: {', '.join(CACHE_BACKENDS)}"
+    )
+
+
+class ServiceCache:
+    """
+    Read-through cache of services by id. ServiceRepository fills it on
+    get_by_id misses and refreshes or drops entries on its own writes; the
+    TTL bounds how long writes made elsewhere stay invisible.
+    """
+
+    def __init__(self, backend: CacheBackend | None, ttl: float = 60.0) -> None:
+        self.backend = backend
+        self.ttl = ttl
+
+    @property
+    def enabled(self) -> bool:
+        return self.backend is not None
+
+    async def get(self, service_id: str) -> ServiceEntity | None:
+        if self.backend is None:
+            return None
+        return await self.backend.get(service_id)
+
+    async def set(self, service: ServiceEntity) -> None:
+        if self.backend is not None:
+            await self.backend.set(service.id, service, self.ttl)
+
+    async def invalidate(self, service_id: str) -> None:
+        if self.backend is not None:
+            await self.backend.delete(service_id)
+
+    async def clear(self) -> None:
+        if self.backend is not None:
+            await self.backend.clear()
@@ -0,0 +1,61 @@
+from typing import Any, TypeVar, cast
+from pypika_tortoise.dialects import PostgreSQLQueryBuilder
+from pypika_tortoise.terms import Field
+from tortoise.models import Model
+from tortoise.queryset import QuerySet
+
+__all__ = ["update_returning", "update_returning_values"]
+
+MODEL = TypeVar("MODEL", bound=Model)
+
+# Tortoise has no public UPDATE ... RETURNING nor a way to get the parameters
+# of a built query, so this module relies on UpdateQuery internals
+# (_choose_db_if_not_chosen, _make_query, query, _db) and Model._init_from_db.
+# They were checked against tortoise-orm 0.25 and the dependency is pinned to
+# that minor series in pyproject.toml; recheck them before widening the range.
+
+
+async def _execute_update_returning(
+    queryset: QuerySet[MODEL], columns: tuple[str, ...], **update_kwargs: Any
+) -> list[dict]:
+    update_query = queryset.update(**update_kwargs)
+    update_query._choose_db_if_not_chosen(True)
+    update_query._make_query()
+
+    basetable = queryset.model._meta.basetable
+    returned = [Field(column, table=basetable) for column in columns] or [
+        basetable.star
+    ]
+    # The generic QueryBuilder type has no returning(); the Postgres and
+    # SQLite builders both do
+    query = cast(PostgreSQLQueryBuilder, update_query.query).returning(*returned)
+    # execute_query drops the rows of UPDATE statements on asyncpg
+    return await update_query._db.execute_query_dict(*query.get_parameterized_sql())
+
+
+async def update_returning(
+    queryset: QuerySet[MODEL], **update_kwargs: Any
+) -> MODEL | None:
+    """
+    Run queryset.update(**update_kwargs) as a single UPDATE ... RETURNING
+    statement and return the first updated row as a model instance, or None
+    when no row matched.
+
+    Tortoise's UpdateQuery only reports the affected row count, so the
+    statement is built by it and RETURNING is appended to the query before
+    it is executed.
+    """
+    rows = await _execute_update_returning(queryset, (), **update_kwargs)
+    if not rows:
+        return None
+    return queryset.model._init_from_db(**rows[0])
+
+
+async def update_returning_values(
+    queryset: QuerySet[MODEL], *columns: str, **update_kwargs: Any
+) -> list[dict]:
+    """
+    Like update_returning, but for any number of rows: returns the given
+    columns of every updated row as dicts.
+    """
+    return await _execute_update_returning(queryset, columns, **update_kwargs)
@@ -1,14 +1,77 @@
-from datetime import datetime, timedelta
-from t1_construcao.domain import AppointmentEntity, AppointmentRepository
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+from tortoise import connections
+from tortoise.expressions import Case, F, Q, When
+from tortoise.exceptions import IntegrityError
+from tortoise.functions import Concat
+from tortoise.transactions import in_transaction
+from t1_construcao.domain import (
+    AppointmentConflictError,
+    AppointmentEntity,
+    AppointmentRepository,
+)
 from ._repository_meta import RepositoryMeta
-from ..models import Appointment, Service
-from .mappers import appointment_model_to_entity
+from ._update_returning import update_returning, update_returning_values
+from ._after_commit import after_commit
+from ._cursor import decode_cursor, encode_cursor
+from ._fast_reads import fast_reads_enabled
+from ._invalidation_bus import publish
+from ._local_caches import appointment_interval_index, load_interval_index
+from ._pagination import paginate, paginate_values
+from ._read_routing import mark_write, read_connection
+from .._appointment_overlap import OVERLAP_ENFORCEMENT, is_overlap_violation
+from ..models import Appointment
+from .mappers import (
+    APPOINTMENT_FIELDS,
+    appointment_model_to_entity,
+    appointment_row_to_dict,
+    appointment_row_to_entity,
+)
 
 __all__ = ["AppointmentRepository"]
 
+_CONFLICT_QUERY = """
+SELECT EXISTS (
+    SELECT 1
+    FROM appointments AS a
+    JOIN services AS s ON s.id = a.service_id
+    WHERE a.service_id = $1::uuid
+      AND a.status IN ('pending', 'confirmed')
+      AND ($4::uuid IS NULL OR a.id <> $4::uuid)
+      AND a.scheduled_at < $2::timestamptz
+          + CASE WHEN $3::int > 0 THEN $3::int ELSE s.duration_minutes END
+          * INTERVAL '1 minute'
+      AND a.scheduled_at + s.duration_minutes * INTERVAL '1 minute'
+          > $2::timestamptz
+) AS has_conflict
+"""
+
+# Batch version of _CONFLICT_QUERY: the candidate slots are passed as
+# parallel arrays and the (1-based) positions of those overlapping an
+# active appointment are returned.
+_BATCH_CONFLICT_QUERY = """
+SELECT c.position
+FROM unnest($1::uuid[], $2::timestamptz[], $3::int[])
+    WITH ORDINALITY AS c(service_id, scheduled_at, duration_minutes, position)
+WHERE EXISTS (
+    SELECT 1
+    FROM appointments AS a
+    JOIN services AS s ON s.id = a.service_id
+    WHERE a.service_id = c.service_id
+      AND a.status IN ('pending', 'confirmed')
+      AND a.scheduled_at < c.scheduled_at + c.duration_minutes * INTERVAL '1 minute'
+      AND a.scheduled_at + s.duration_minutes * INTERVAL '1 minute'
+          > c.scheduled_at
+)
+"""
+
 
 class AppointmentRepository(metaclass=RepositoryMeta):
 
+    fast_reads = fast_reads_enabled("appointments")
+    enforces_no_overlap = OVERLAP_ENFORCEMENT == "constraint"
+
     async def create(
         self,
         user_id: str,
@@ -16,14 +79,57 @@ class AppointmentRepository(metaclass=RepositoryMeta):
         scheduled_at: datetime,
         notes: str | None = None,
     ) -> AppointmentEntity:
-        appointment = await Appointment.create(
-            user_id=user_id,
-            service_id=service_id,
-            scheduled_at=scheduled_at,
-            notes=notes,
-            status="pending",
-        )
-        return appointment_model_to_entity(appointment)
+        mark_write()
+        try:
+            appointment = await Appointment.create(
+                user_id=user_id,
+                service_id=service_id,
+                scheduled_at=scheduled_at,
+                notes=notes,
+                status="pending",
+            )
+        except IntegrityError as e:
+            if is_overlap_violation(e):
+                raise AppointmentConflictError("Appointment overlaps") from e
+            raise
+        appointment_entity = appointment_model_to_entity(appointment)
+        after_commit(lambda: _index_upsert(appointment_entity))
+        await publish(_appointment_event(appointment_entity))
+        return appointment_entity
+
+    async def bulk_create(
+        self,
+        user_id: str,
+        appointments: list[tuple[str, datetime, str | None]],
+    ) -> list[AppointmentEntity]:
+        """
+        Insert (service_id, scheduled_at, notes) appointments for one user
+        with a single bulk INSERT in a transaction: all or none are created.
+        """
+        mark_write()
+        models = [
+            Appointment(
+                user_id=user_id,
+                service_id=service_id,
+                scheduled_at=scheduled_at,
+                notes=notes,
+                status="pending",
+            )
+            for service_id, scheduled_at, notes in appointments
+        ]
+        try:
+            async with in_transaction():
+                await Appointment.bulk_create(models)
+        except IntegrityError as e:
+            if is_overlap_violation(e):
+                raise AppointmentConflictError("Appointment overlaps") from e
+            raise
+
+        entities = [appointment_model_to_entity(model) for model in models]
+        for entity in entities:
+            after_commit(lambda entity=entity: _index_upsert(entity))
+        await publish(*(_appointment_event(entity) for entity in entities))
+        return entities
 
     async def update(
         self,
@@ -32,6 +138,7 @@ class AppointmentRepository(metaclass=RepositoryMeta):
         notes: str | None = None,
         status: str | None = None,
     ) -> AppointmentEntity:
+        mark_write()
         update_data = {}
         if scheduled_at is not None:
             update_data["scheduled_at"] = scheduled_at
@@ -40,24 +147,124 @@ class AppointmentRepository(metaclass=RepositoryMeta):
         if status is not None:
             update_data["status"] = status
 
-        if update_data:
-            updated = await Appointment.filter(id=appointment_id).update(**update_data)
-            if not updated:
+        if not update_data:
+            appointment_entity = await self.get_by_id(appointment_id)
+            if appointment_entity is None:
                 raise ValueError("Appointment not found")
+            return appointment_entity
 
-        appointment_entity = await self.get_by_id(appointment_id)
-        if appointment_entity is None:
+        try:
+            appointment = await update_returning(
+                Appointment.filter(id=appointment_id), **update_data
+            )
+        except IntegrityError as e:
+            if is_overlap_violation(e):
+                raise AppointmentConflictError("Appointment overlaps") from e
+            raise
+        if appointment is None:
             raise ValueError("Appointment not found")
+
+        appointment_entity = appointment_model_to_entity(appointment)
+        after_commit(lambda: _index_upsert(appointment_entity))
+        await publish(_appointment_event(appointment_entity))
         return appointment_entity
 
+    async def transition_status(
+        self,
+        from_statuses: tuple[str, ...],
+        to_status: str,
+        appointment_ids: list[str] | None = None,
+        user_id: str | None = None,
+        service_id: str | None = None,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        note: str | None = None,
+    ) -> list[str]:
+        """
+        Move every matching appointment currently in one of from_statuses to
+        to_status with a single conditional UPDATE, returning the ids of the
+        rows that changed. Rows in any other status are left untouched, so a
+        concurrent transition can never be overwritten. When note is given it
+        is appended to each appointment's notes on its own line.
+        """
+        mark_write()
+        query = Appointment.filter(status__in=from_statuses)
+        if appointment_ids is not None:
+            ids = []
+            for appointment_id in appointment_ids:
+                try:
+                    ids.append(UUID(appointment_id))
+                except ValueError:
+                    continue
+            if not ids:
+                return []
+            query = query.filter(id__in=ids)
+        if user_id is not None:
+            query = query.filter(user_id=user_id)
+        if service_id is not None:
+            query = query.filter(service_id=service_id)
+        if start_date is not None:
+            query = query.filter(scheduled_at__gte=start_date)
+        if end_date is not None:
+            query = query.filter(scheduled_at__lte=end_date)
+
+        update_data: dict[str, Any] = {"status": to_status}
+        if note:
+            update_data["notes"] = Case(
+                When(Q(notes__isnull=True) | Q(notes=""), then=note),
+                default=Concat(F("notes"), f"\n{note}"),
+            )
+
+        rows = await update_returning_values(query, "id", **update_data)
+        changed_ids = [str(row["id"]) for row in rows]
+        if to_status not in appointment_interval_index.ACTIVE_STATUSES:
+            for appointment_id in changed_ids:
+                after_commit(
+                    lambda appointment_id=appointment_id: (
+                        appointment_interval_index.remove(appointment_id)
+                    )
+                )
+        await publish(
+            *(
+                {
+                    "entity": "appointments",
+                    "op": "status",
+                    "id": appointment_id,
+                    "status": to_status,
+                }
+                for appointment_id in changed_ids
+            )
+        )
+        return changed_ids
+
     async def get_by_id(self, appointment_id: str) -> AppointmentEntity | None:
-        appointment = await Appointment.get(id=appointment_id)
+        if self.fast_reads:
+            row = (
+                await Appointment.filter(id=appointment_id)
+                .using_db(read_connection())
+                .first()
+                .values(*APPOINTMENT_FIELDS)
+            )
+            return appointment_row_to_entity(row) if row else None
+        appointment = await Appointment.get_or_none(
+            id=appointment_id, using_db=read_connection()
+        )
         return appointment_model_to_entity(appointment) if appointment else None
 
-    async def delete(self, appointment_id: str) -> None:
-        deleted = await Appointment.filter(id=appointment_id).delete()
+    async def delete(self, appointment_id: str, user_id: str | None = None) -> None:
+        """
+        Delete with a single statement; with user_id, rows of other users are
+        not matched, so ownership needs no prior read.
+        """
+        mark_write()
+        query = Appointment.filter(id=appointment_id)
+        if user_id is not None:
+            query = query.filter(user_id=user_id)
+        deleted = await query.delete()
         if not deleted:
             raise ValueError("Appointment not found")
+        after_commit(lambda: appointment_interval_index.remove(appointment_id))
+        await publish({"entity": "appointments", "op": "delete", "id": appointment_id})
         return None
 
     async def get_all(
@@ -69,8 +276,32 @@ class AppointmentRepository(metaclass=RepositoryMeta):
         end_date: datetime | None = None,
         page: int = 1,
         page_size: int = 10,
-    ) -> tuple[list[AppointmentEntity], int]:
-        query = Appointment.all()
+        cursor: str | None = None,
+        include_total: str = "exact",
+        fields: tuple[str, ...] | None = None,
+    ) -> tuple[list[AppointmentEntity] | list[dict], int | None, str | None]:
+        """
+        List appointments ordered by (scheduled_at, id).
+
+        Without a cursor the page is read with OFFSET. With a cursor, rows
+        after the (scheduled_at, id) it encodes are read instead (keyset
+        pagination), so deep pages cost the same as the first one and are
+        not shifted by concurrent inserts. The returned next_cursor is None
+        on the last page.
+
+        include_total selects how total_count is computed (see TOTAL_MODES);
+        it is None when include_total is "none".
+
+        fields selects a subset of APPOINTMENT_FIELDS: only those columns
+        are read, and the page is returned as dicts holding exactly them
+        (ids as strings) instead of entities.
+        """
+        if fields is not None:
+            unknown = set(fields).difference(APPOINTMENT_FIELDS)
+            if unknown:
+                raise ValueError(f"Unknown appointment fields: {sorted(unknown)}")
+
+        query = Appointment.all().using_db(read_connection())
 
         if user_id is not None:
             query = query.filter(user_id=user_id)
@@ -83,14 +314,66 @@ class AppointmentRepository(metaclass=RepositoryMeta):
         if end_date is not None:
             query = query.filter(scheduled_at__lte=end_date)
 
-        total_count = await query.count()
+        after = None
+        if cursor is not None:
+            last_scheduled_at, last_id = decode_cursor(
+                cursor, datetime.fromisoformat, UUID
+            )
+            after = Q(scheduled_at__gt=last_scheduled_at) | Q(
+                scheduled_at=last_scheduled_at, id__gt=last_id
+            )
 
-        offset = (page - 1) * page_size
-        appointments = (
-            await query.offset(offset).limit(page_size).order_by("scheduled_at")
-        )
+        order_by = ("scheduled_at", "id")
+        if fields is not None or self.fast_reads:
+            # The cursor is built from the last row's (scheduled_at, id)
+            values = (
+                tuple(dict.fromkeys((*fields, "scheduled_at", "id")))
+                if fields is not None
+                else APPOINTMENT_FIELDS
+            )
+            rows, total_count, has_next = await paginate_values(
+                query,
+                order_by,
+                page,
+                page_size,
+                values,
+                after=after,
+                include_total=include_total,
+            )
+            next_cursor = None
+            if has_next:
+                next_cursor = encode_cursor(
+                    rows[-1]["scheduled_at"].isoformat(), str(rows[-1]["id"])
+                )
+            if fields is not None:
+                return (
+                    [appointment_row_to_dict(row, fields) for row in rows],
+                    total_count,
+                    next_cursor,
+                )
+            return (
+                [appointment_row_to_entity(row) for row in rows],
+                total_count,
+                next_cursor,
+            )
 
-        return [appointment_model_to_entity(apt) for apt in appointments], total_count
+        appointments, total_count, has_next = await paginate(
+            query,
+            order_by,
+            page,
+            page_size,
+            after=after,
+            include_total=include_total,
+        )
+        next_cursor = None
+        if has_next:
+            last = appointments[-1]
+            next_cursor = encode_cursor(last.scheduled_at.isoformat(), str(last.id))
+        return (
+            [appointment_model_to_entity(apt) for apt in appointments],
+            total_count,
+            next_cursor,
+        )
 
     async def check_conflict(
         self,
@@ -99,51 +382,86 @@ class AppointmentRepository(metaclass=RepositoryMeta):
         duration_minutes: int,
         exclude_appointment_id: str | None = None,
     ) -> bool:
-        """Check if there's a scheduling conflict."""
-        service = await Service.get(id=service_id)
-        if not service:
-            return False
-
-        # Use service duration if not provided
-        if duration_minutes <= 0:
-            duration_minutes = service.duration_minutes
-
-        start_time = scheduled_at
-        end_time = scheduled_at + timedelta(minutes=duration_minutes)
-
-        # Get all appointments for this service that might conflict
-        # We check appointments that start within a reasonable window
-        query = Appointment.filter(
-            service_id=service_id,
-            status__in=["pending", "confirmed"],
+        """
+        Check if there's a scheduling conflict.
+
+        Overlap is computed by the database in a single query: an active
+        appointment of the same service conflicts when it starts before the
+        new slot ends and ends (using its service's duration) after the new
+        slot starts. A non-positive duration_minutes falls back to the
+        service's own duration.
+
+        When the interval index is loaded, conflicts it already knows about
+        are answered in memory without touching the database; a miss still
+        runs the query, so the database stays the authority on free slots.
+        The index only sees committed writes, and it is only loaded with the
+        invalidation bus enabled, which brings in other workers' writes.
+        """
+        if (
+            appointment_interval_index.loaded
+            and appointment_interval_index.has_conflict(
+                service_id, scheduled_at, duration_minutes, exclude_appointment_id
+            )
+        ):
+            return True
+
+        scheduled_at_field = Appointment._meta.fields_map["scheduled_at"]
+        rows = await connections.get("default").execute_query_dict(
+            _CONFLICT_QUERY,
+            [
+                service_id,
+                scheduled_at_field.to_db_value(scheduled_at, Appointment),
+                duration_minutes,
+                exclude_appointment_id,
+            ],
         )
+        return bool(rows and rows[0]["has_conflict"])
 
-        # Filter to appointments that might overlap (within 4 hours window for safety)
-        window_start = start_time - timedelta(hours=2)
-        window_end = end_time + timedelta(hours=2)
+    async def find_conflicts(self, slots: list[tuple[str, datetime, int]]) -> set[int]:
+        """
+        Check many (service_id, scheduled_at, duration_minutes) slots against
+        the stored active appointments in one query, with the same overlap
+        rule as check_conflict. Returns the indexes of conflicting slots.
+        Overlaps between the slots themselves are not considered.
+        """
+        if not slots:
+            return set()
 
-        conflicting_appointments = await query.filter(
-            scheduled_at__gte=window_start,
-            scheduled_at__lte=window_end,
+        scheduled_at_field = Appointment._meta.fields_map["scheduled_at"]
+        rows = await connections.get("default").execute_query_dict(
+            _BATCH_CONFLICT_QUERY,
+            [
+                [service_id for service_id, _, _ in slots],
+                [
+                    scheduled_at_field.to_db_value(scheduled_at, Appointment)
+                    for _, scheduled_at, _ in slots
+                ],
+                [duration_minutes for _, _, duration_minutes in slots],
+            ],
         )
+        return {row["position"] - 1 for row in rows}
+
+    async def load_interval_index(self) -> None:
+        """Fill the in-memory interval index with every active appointment."""
+        await load_interval_index()
+
+
+def _index_upsert(appointment: AppointmentEntity) -> None:
+    if appointment_interval_index.loaded:
+        appointment_interval_index.upsert(
+            appointment.id,
+            appointment.service_id,
+            appointment.scheduled_at,
+            appointment.status,
+        )
+
 
-        if exclude_appointment_id:
-            conflicting_appointments = [
-                apt
-                for apt in conflicting_appointments
-                if str(apt.id) != exclude_appointment_id
-            ]
-
-        # For each potentially conflicting appointment, check actual overlap
-        for apt in conflicting_appointments:
-            apt_service = await Service.get(id=apt.service_id)
-            if apt_service:
-                apt_start = apt.scheduled_at
-                apt_end = apt_start + timedelta(minutes=apt_service.duration_minutes)
-
-                # Check if there's actual overlap
-                # Overlap occurs if: apt_start < end_time AND apt_end > start_time
-                if apt_start < end_time and apt_end > start_time:
-                    return True
-
-        return False
+def _appointment_event(appointment: AppointmentEntity) -> dict:
+    return {
+        "entity": "appointments",
+        "op": "upsert",
+        "id": appointment.id,
+        "service_id": appointment.service_id,
+        "scheduled_at": appointment.scheduled_at.isoformat(),
+        "status": appointment.status,
+    }
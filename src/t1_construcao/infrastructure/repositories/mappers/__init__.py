@@ -1,7 +1,16 @@
 from t1_construcao.infrastructure.models.user import User
 from t1_construcao.domain.entities import UserEntity
-from .service_mapper import service_model_to_entity
-from .appointment_mapper import appointment_model_to_entity
+from .service_mapper import (
+    SERVICE_FIELDS,
+    service_model_to_entity,
+    service_row_to_entity,
+)
+from .appointment_mapper import (
+    APPOINTMENT_FIELDS,
+    appointment_model_to_entity,
+    appointment_row_to_dict,
+    appointment_row_to_entity,
+)
 
 
 def user_model_to_entity(user_model: User) -> UserEntity:
@@ -12,8 +21,23 @@ def user_model_to_entity(user_model: User) -> UserEntity:
     )
 
 
+USER_FIELDS = ("id", "name", "role")
+
+
+def user_row_to_entity(row: dict) -> UserEntity:
+    """Build the entity from a .values(*USER_FIELDS) row."""
+    return UserEntity(id=str(row["id"]), name=row["name"], role=row["role"])
+
+
 __all__ = [
+    "USER_FIELDS",
+    "SERVICE_FIELDS",
+    "APPOINTMENT_FIELDS",
     "user_model_to_entity",
+    "user_row_to_entity",
     "service_model_to_entity",
+    "service_row_to_entity",
     "appointment_model_to_entity",
+    "appointment_row_to_entity",
+    "appointment_row_to_dict",
 ]
@@ -13,3 +13,40 @@ def appointment_model_to_entity(appointment_model: Appointment) -> AppointmentEn
         created_at=appointment_model.created_at,
         updated_at=appointment_model.updated_at,
     )
+
+
+APPOINTMENT_FIELDS = (
+    "id",
+    "user_id",
+    "service_id",
+    "scheduled_at",
+    "status",
+    "notes",
+    "created_at",
+    "updated_at",
+)
+
+
+def appointment_row_to_entity(row: dict) -> AppointmentEntity:
+    """Build the entity from a .values(*APPOINTMENT_FIELDS) row."""
+    return AppointmentEntity(
+        id=str(row["id"]),
+        user_id=str(row["user_id"]),
+        service_id=str(row["service_id"]),
+        scheduled_at=row["scheduled_at"],
+        status=row["status"],
+        notes=row["notes"],
+        created_at=row["created_at"],
+        updated_at=row["updated_at"],
+    )
+
+
+_ID_FIELDS = frozenset({"id", "user_id", "service_id"})
+
+
+def appointment_row_to_dict(row: dict, fields: tuple[str, ...]) -> dict:
+    """Keep only the given fields of a .values() row, with ids as strings."""
+    return {
+        field: str(row[field]) if field in _ID_FIELDS else row[field]
+        for field in fields
+    }
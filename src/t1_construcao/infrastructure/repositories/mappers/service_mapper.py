@@ -13,3 +13,29 @@ def service_model_to_entity(service_model: Service) -> ServiceEntity:
         created_at=service_model.created_at,
         updated_at=service_model.updated_at,
     )
+
+
+SERVICE_FIELDS = (
+    "id",
+    "name",
+    "description",
+    "duration_minutes",
+    "price",
+    "is_active",
+    "created_at",
+    "updated_at",
+)
+
+
+def service_row_to_entity(row: dict) -> ServiceEntity:
+    """Build the entity from a .values(*SERVICE_FIELDS) row."""
+    return ServiceEntity(
+        id=str(row["id"]),
+        name=row["name"],
+        description=row["description"],
+        duration_minutes=row["duration_minutes"],
+        price=row["price"],
+        is_active=row["is_active"],
+        created_at=row["created_at"],
+        updated_at=row["updated_at"],
+    )
@@ -1,24 +1,53 @@
 from decimal import Decimal
-from t1_construcao.domain import ServiceEntity, ServiceRepository
+from uuid import UUID
+from tortoise.exceptions import IntegrityError
+from tortoise.expressions import Q
+from t1_construcao.domain import (
+    AppointmentConflictError,
+    InvalidCursorError,
+    ServiceEntity,
+    ServiceRepository,
+)
+from ._after_commit import after_commit
+from ._cursor import decode_cursor, encode_cursor
+from ._fast_reads import fast_reads_enabled
+from ._invalidation_bus import publish
+from ._local_caches import appointment_interval_index, service_cache
+from ._pagination import paginate, paginate_values
+from ._read_routing import mark_write, read_connection
 from ._repository_meta import RepositoryMeta
+from ._update_returning import update_returning
+from .._appointment_overlap import is_overlap_violation
+from .._trigram_search import Similarity, is_trigram_search_available
 from ..models import Service
-from .mappers import service_model_to_entity
+from .mappers import SERVICE_FIELDS, service_model_to_entity, service_row_to_entity
 
 __all__ = ["ServiceRepository"]
 
 
 class ServiceRepository(metaclass=RepositoryMeta):
 
+    fast_reads = fast_reads_enabled("services")
+
     async def create(
         self, name: str, description: str, duration_minutes: int, price: Decimal
     ) -> ServiceEntity:
+        mark_write()
         service = await Service.create(
             name=name,
             description=description,
             duration_minutes=duration_minutes,
             price=price,
         )
-        return service_model_to_entity(service)
+        service_entity = service_model_to_entity(service)
+        after_commit(
+            lambda: appointment_interval_index.set_service_duration(
+                service_entity.id, duration_minutes
+            )
+        )
+        await service_cache.set(service_entity)
+        await publish(_service_event(service_entity))
+        return service_entity
 
     async def update(
         self,
@@ -29,6 +58,7 @@ class ServiceRepository(metaclass=RepositoryMeta):
         price: Decimal | None = None,
         is_active: bool | None = None,
     ) -> ServiceEntity:
+        mark_write()
         update_data = {}
         if name is not None:
             update_data["name"] = name
@@ -41,24 +71,89 @@ class ServiceRepository(metaclass=RepositoryMeta):
         if is_active is not None:
             update_data["is_active"] = is_active
 
-        if update_data:
-            updated = await Service.filter(id=service_id).update(**update_data)
-            if not updated:
+        if not update_data:
+            service_entity = await self.get_by_id(service_id)
+            if service_entity is None:
                 raise ValueError("Service not found")
+            return service_entity
 
-        service_entity = await self.get_by_id(service_id)
-        if service_entity is None:
+        try:
+            service = await update_returning(
+                Service.filter(id=service_id), **update_data
+            )
+        except IntegrityError as e:
+            # A longer duration can make the service's active appointments
+            # overlap under the appointment exclusion constraint.
+            if is_overlap_violation(e):
+                raise AppointmentConflictError("Appointments would overlap") from e
+            raise
+        if service is None:
+            await service_cache.invalidate(service_id)
             raise ValueError("Service not found")
+        service_entity = service_model_to_entity(service)
+        after_commit(
+            lambda: appointment_interval_index.set_service_duration(
+                service_entity.id, service_entity.duration_minutes
+            )
+        )
+        await service_cache.set(service_entity)
+        await publish(_service_event(service_entity))
         return service_entity
 
     async def get_by_id(self, service_id: str) -> ServiceEntity | None:
-        service = await Service.get(id=service_id)
-        return service_model_to_entity(service) if service else None
+        """Read through service_cache: only misses reach the database."""
+        service_entity = await service_cache.get(service_id)
+        if service_entity is not None:
+            return service_entity
+
+        if self.fast_reads:
+            row = await (
+                Service.filter(id=service_id)
+                .using_db(read_connection())
+                .first()
+                .values(*SERVICE_FIELDS)
+            )
+            service_entity = service_row_to_entity(row) if row else None
+        else:
+            service = await Service.get(id=service_id, using_db=read_connection())
+            service_entity = service_model_to_entity(service) if service else None
+
+        if service_entity is not None:
+            await service_cache.set(service_entity)
+        return service_entity
+
+    async def get_many(self, service_ids: list[str]) -> dict[str, ServiceEntity]:
+        """
+        Fetch several services in one query, keyed by id. Unknown or
+        malformed ids are left out.
+        """
+        ids = set()
+        for service_id in service_ids:
+            try:
+                ids.add(UUID(service_id))
+            except ValueError:
+                continue
+        if not ids:
+            return {}
+
+        query = Service.filter(id__in=list(ids)).using_db(read_connection())
+        if self.fast_reads:
+            services = [
+                service_row_to_entity(row)
+                for row in await query.values(*SERVICE_FIELDS)
+            ]
+        else:
+            services = [service_model_to_entity(service) for service in await query]
+        return {service.id: service for service in services}
 
     async def delete(self, service_id: str) -> None:
+        mark_write()
+        await service_cache.invalidate(service_id)
         deleted = await Service.filter(id=service_id).delete()
         if not deleted:
             raise ValueError("Service not found")
+        after_commit(lambda: appointment_interval_index.remove_service(service_id))
+        await publish({"entity": "services", "op": "delete", "id": service_id})
         return None
 
     async def get_all(
@@ -67,17 +162,76 @@ class ServiceRepository(metaclass=RepositoryMeta):
         name: str | None = None,
         page: int = 1,
         page_size: int = 10,
-    ) -> tuple[list[ServiceEntity], int]:
-        query = Service.all()
+        cursor: str | None = None,
+        include_total: str = "exact",
+        rank_by_similarity: bool = False,
+    ) -> tuple[list[ServiceEntity], int | None, str | None]:
+        """
+        List services ordered by id, with OFFSET or, given a cursor, keyset
+        pagination. The returned next_cursor is None on the last page and
+        total_count follows include_total (see TOTAL_MODES).
+
+        With rank_by_similarity and pg_trgm installed, a name search is
+        ordered by trigram similarity instead, using OFFSET pagination only.
+        Without pg_trgm the flag is ignored.
+        """
+        query = Service.all().using_db(read_connection())
 
         if is_active is not None:
             query = query.filter(is_active=is_active)
         if name is not None:
             query = query.filter(name__icontains=name)
 
-        total_count = await query.count()
+        order_by: tuple[str, ...] = ("id",)
+        rank = rank_by_similarity and name is not None
+        if rank and is_trigram_search_available():
+            if cursor is not None:
+                raise InvalidCursorError(
+                    "Cursors are not supported when ranking by similarity"
+                )
+            query = query.annotate(similarity=Similarity("name", name))
+            order_by = ("-similarity", "id")
+        else:
+            rank = False
+
+        after = None
+        if cursor is not None:
+            (last_id,) = decode_cursor(cursor, UUID)
+            after = Q(id__gt=last_id)
+
+        if self.fast_reads:
+            rows, total_count, has_next = await paginate_values(
+                query,
+                order_by,
+                page,
+                page_size,
+                SERVICE_FIELDS,
+                after=after,
+                include_total=include_total,
+            )
+            entities = [service_row_to_entity(row) for row in rows]
+        else:
+            services, total_count, has_next = await paginate(
+                query,
+                order_by,
+                page,
+                page_size,
+                after=after,
+                include_total=include_total,
+            )
+            entities = [service_model_to_entity(service) for service in services]
+
+        next_cursor = None
+        if has_next and not rank:
+            next_cursor = encode_cursor(entities[-1].id)
+
+        return entities, total_count, next_cursor
 
-        offset = (page - 1) * page_size
-        services = await query.offset(offset).limit(page_size)
 
-        return [service_model_to_entity(service) for service in services], total_count
+def _service_event(service: ServiceEntity) -> dict:
+    return {
+        "entity": "services",
+        "op": "upsert",
+        "id": service.id,
+        "duration_minutes": service.duration_minutes,
+    }
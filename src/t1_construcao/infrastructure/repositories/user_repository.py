@@ -1,41 +1,86 @@
-from t1_construcao.domain import UserEntity
+from uuid import UUID
+from tortoise.expressions import Q
+from t1_construcao.domain import InvalidCursorError, UserEntity
+from ._cursor import decode_cursor, encode_cursor
+from ._fast_reads import fast_reads_enabled
+from ._pagination import paginate, paginate_values
+from ._read_routing import mark_write, read_connection
 from ._repository_meta import RepositoryMeta
+from ._update_returning import update_returning
+from .._trigram_search import Similarity, is_trigram_search_available
 from ..models import User
-from .mappers import user_model_to_entity
+from .mappers import USER_FIELDS, user_model_to_entity, user_row_to_entity
 
 __all__ = ["UserRepository"]
 
 
 class UserRepository(metaclass=RepositoryMeta):
 
+    fast_reads = fast_reads_enabled("users")
+
     async def create(self, name: str, role: str = "client") -> UserEntity:
+        mark_write()
         user = await User.create(name=name, role=role)
         return user_model_to_entity(user)
 
     async def update(
         self, user_id: str, name: str | None = None, role: str | None = None
     ) -> UserEntity:
+        mark_write()
         update_data = {}
         if name is not None:
             update_data["name"] = name
         if role is not None:
             update_data["role"] = role
 
-        if update_data:
-            user = await User.filter(id=user_id).update(**update_data)
-            if not user:
+        if not update_data:
+            user_entity = await self.get_by_id(user_id)
+            if user_entity is None:
                 raise ValueError("User not found")
+            return user_entity
 
-        user_entity = await self.get_by_id(user_id)
-        if user_entity is None:
+        user = await update_returning(User.filter(id=user_id), **update_data)
+        if user is None:
             raise ValueError("User not found")
-        return user_entity
+        return user_model_to_entity(user)
 
     async def get_by_id(self, user_id: str) -> UserEntity | None:
-        user = await User.get(id=user_id)
+        if self.fast_reads:
+            row = await (
+                User.filter(id=user_id)
+                .using_db(read_connection())
+                .first()
+                .values(*USER_FIELDS)
+            )
+            return user_row_to_entity(row) if row else None
+        user = await User.get(id=user_id, using_db=read_connection())
         return user_model_to_entity(user) if user else None
 
+    async def get_many(self, user_ids: list[str]) -> dict[str, UserEntity]:
+        """
+        Fetch several users in one query, keyed by id. Unknown or malformed
+        ids are left out.
+        """
+        ids = set()
+        for user_id in user_ids:
+            try:
+                ids.add(UUID(user_id))
+            except ValueError:
+                continue
+        if not ids:
+            return {}
+
+        query = User.filter(id__in=list(ids)).using_db(read_connection())
+        if self.fast_reads:
+            users = [
+                user_row_to_entity(row) for row in await query.values(*USER_FIELDS)
+            ]
+        else:
+            users = [user_model_to_entity(user) for user in await query]
+        return {user.id: user for user in users}
+
     async def delete(self, user_id: str) -> None:
+        mark_write()
         user = await User.filter(id=user_id).delete()
         if not user:
             raise ValueError("User not found")
@@ -47,17 +92,67 @@ class UserRepository(metaclass=RepositoryMeta):
         name: str | None = None,
         page: int = 1,
         page_size: int = 10,
-    ) -> tuple[list[UserEntity], int]:
-        query = User.all()
+        cursor: str | None = None,
+        include_total: str = "exact",
+        rank_by_similarity: bool = False,
+    ) -> tuple[list[UserEntity], int | None, str | None]:
+        """
+        List users ordered by id, with OFFSET or, given a cursor, keyset
+        pagination. The returned next_cursor is None on the last page and
+        total_count follows include_total (see TOTAL_MODES).
+
+        With rank_by_similarity and pg_trgm installed, a name search is
+        ordered by trigram similarity instead, using OFFSET pagination only.
+        Without pg_trgm the flag is ignored.
+        """
+        query = User.all().using_db(read_connection())
 
         if role is not None:
             query = query.filter(role=role)
         if name is not None:
             query = query.filter(name__icontains=name)
 
-        total_count = await query.count()
+        order_by: tuple[str, ...] = ("id",)
+        rank = rank_by_similarity and name is not None
+        if rank and is_trigram_search_available():
+            if cursor is not None:
+                raise InvalidCursorError(
+                    "Cursors are not supported when ranking by similarity"
+                )
+            query = query.annotate(similarity=Similarity("name", name))
+            order_by = ("-similarity", "id")
+        else:
+            rank = False
+
+        after = None
+        if cursor is not None:
+            (last_id,) = decode_cursor(cursor, UUID)
+            after = Q(id__gt=last_id)
+
+        if self.fast_reads:
+            rows, total_count, has_next = await paginate_values(
+                query,
+                order_by,
+                page,
+                page_size,
+                USER_FIELDS,
+                after=after,
+                include_total=include_total,
+            )
+            entities = [user_row_to_entity(row) for row in rows]
+        else:
+            users, total_count, has_next = await paginate(
+                query,
+                order_by,
+                page,
+                page_size,
+                after=after,
+                include_total=include_total,
+            )
+            entities = [user_model_to_entity(user) for user in users]
 
-        offset = (page - 1) * page_size
-        users = await query.offset(offset).limit(page_size)
+        next_cursor = None
+        if has_next and not rank:
+            next_cursor = encode_cursor(entities[-1].id)
 
-        return [user_model_to_entity(user) for user in users], total_count
+        return entities, total_count, next_cursor
@@ -0,0 +1,153 @@
+import inspect
+import logging
+from contextlib import AsyncExitStack
+from typing import Any, AsyncIterator
+from tortoise.transactions import in_transaction
+from t1_construcao import domain
+from t1_construcao.shared import get_env_var
+from .repositories import AppointmentRepository, ServiceRepository, UserRepository
+from .repositories._after_commit import deferred_until_commit
+from .repositories._local_caches import reset_local_caches
+from .repositories._read_routing import read_from_primary
+
+__all__ = [
+    "UNIT_OF_WORK_TRANSACTIONAL",
+    "IdentityMapRepository",
+    "UnitOfWork",
+    "get_unit_of_work",
+]
+
+logger = logging.getLogger(__name__)
+
+UNIT_OF_WORK_TRANSACTIONAL = (
+    get_env_var("UNIT_OF_WORK_TRANSACTIONAL", "false").lower() == "true"
+)
+
+# Repository methods that never write; every other method is treated as a
+# write and drops the identity maps of the whole unit of work.
+_READ_METHODS = frozenset(
+    {"get_by_id", "get_many", "get_all", "check_conflict", "find_conflicts"}
+)
+
+
+class IdentityMapRepository:
+    """
+    Wraps a repository for the duration of one unit of work. get_by_id and
+    get_many answer from the entities already loaded (or returned by a write)
+    in the same unit of work; any write clears what was loaded, since
+    cascades and bulk updates can change rows other than the one written.
+    Other attributes are forwarded to the wrapped repository.
+    """
+
+    def __init__(self, repository: Any, unit_of_work: "UnitOfWork") -> None:
+        self._repository = repository
+        self._unit_of_work = unit_of_work
+        self._identity_map: dict[str, Any] = {}
+
+    async def get_by_id(self, entity_id: str) -> Any | None:
+        if entity_id in self._identity_map:
+            return self._identity_map[entity_id]
+        entity = await self._repository.get_by_id(entity_id)
+        self._identity_map[entity_id] = entity
+        return entity
+
+    async def get_many(self, entity_ids: list[str]) -> dict[str, Any]:
+        missing = [
+            entity_id for entity_id in entity_ids if entity_id not in self._identity_map
+        ]
+        if missing:
+            loaded = await self._repository.get_many(missing)
+            for entity_id in missing:
+                self._identity_map[entity_id] = loaded.get(entity_id)
+        return {
+            entity_id: self._identity_map[entity_id]
+            for entity_id in entity_ids
+            if self._identity_map[entity_id] is not None
+        }
+
+    def clear(self) -> None:
+        self._identity_map.clear()
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._repository, name)
+        if name in _READ_METHODS or not inspect.iscoroutinefunction(attribute):
+            return attribute
+
+        async def write(*args, **kwargs):
+            self._unit_of_work.clear()
+            try:
+                result = await attribute(*args, **kwargs)
+            finally:
+                self._unit_of_work.has_writes = True
+            entity_id = getattr(result, "id", None)
+            if isinstance(entity_id, str):
+                self._identity_map[entity_id] = result
+            return result
+
+        return write
+
+
+class UnitOfWork:
+    """
+    Repositories scoped to one request. Entities read by id are loaded once
+    per request, whichever controller or use case asks for them. With
+    transactional=True the request also runs in a single transaction on the
+    primary: it commits when the request succeeds and rolls back on any
+    exception, including HTTPException. Changes to the conflict interval index
+    are applied only once the transaction commits; after a rollback, the
+    process caches that the rolled back writes had already updated are reset.
+    """
+
+    def __init__(
+        self,
+        transactional: bool = UNIT_OF_WORK_TRANSACTIONAL,
+        users: domain.UserRepository | None = None,
+        services: domain.ServiceRepository | None = None,
+        appointments: domain.AppointmentRepository | None = None,
+    ) -> None:
+        self.transactional = transactional
+        self.has_writes = False
+        self._identity_maps: list[IdentityMapRepository] = []
+        # The wrappers forward everything else to the repository, so they are
+        # exposed under the repository interfaces.
+        self.users: domain.UserRepository = self._identity_map(
+            users or UserRepository()
+        )
+        self.services: domain.ServiceRepository = self._identity_map(
+            services or ServiceRepository()
+        )
+        self.appointments: domain.AppointmentRepository = self._identity_map(
+            appointments or AppointmentRepository()
+        )
+        self._exit_stack = AsyncExitStack()
+
+    def _identity_map(self, repository: Any) -> Any:
+        wrapper = IdentityMapRepository(repository, self)
+        self._identity_maps.append(wrapper)
+        return wrapper
+
+    def clear(self) -> None:
+        """Drop every entity loaded so far."""
+        for identity_map in self._identity_maps:
+            identity_map.clear()
+
+    async def __aenter__(self) -> "UnitOfWork":
+        if self.transactional:
+            self._exit_stack.enter_context(read_from_primary())
+            # Entered before the transaction so it exits after the commit.
+            self._exit_stack.enter_context(deferred_until_commit())
+            await self._exit_stack.enter_async_context(in_transaction())
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self._exit_stack.__aexit__(exc_type, exc_value, traceback)
+        self.clear()
+        if self.transactional and exc_type is not None and self.has_writes:
+            logger.info("Request transaction rolled back; resetting local caches")
+            await reset_local_caches()
+
+
+async def get_unit_of_work() -> AsyncIterator[UnitOfWork]:
+    """FastAPI dependency: one UnitOfWork per request."""
+    async with UnitOfWork() as unit_of_work:
+        yield unit_of_work
@@ -2,18 +2,29 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI, APIRouter
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.openapi.utils import get_openapi
-from t1_construcao.infrastructure import DatabaseStarterService
+from t1_construcao.infrastructure import (
+    CacheInvalidationService,
+    DatabaseStarterService,
+)
 from t1_construcao.controllers.user_controller import user_router
 from t1_construcao.controllers.service_controller import service_router
 from t1_construcao.controllers.appointment_controller import appointment_router
+from t1_construcao.controllers.monitoring_controller import monitoring_router
+from t1_construcao.shared.auth import JwksRefreshService
 
 db_service = DatabaseStarterService()
+cache_invalidation_service = CacheInvalidationService()
+jwks_service = JwksRefreshService()
 
 
 @asynccontextmanager
 async def lifespan(_: FastAPI):
+    await jwks_service.startup()
     await db_service.startup()
+    await cache_invalidation_service.startup()
     yield
+    await cache_invalidation_service.shutdown()
+    await jwks_service.shutdown()
     await db_service.shutdown()
 
 
@@ -116,6 +127,7 @@ api_v1_router = APIRouter(prefix="/api/v1")
 api_v1_router.include_router(user_router)
 api_v1_router.include_router(service_router)
 api_v1_router.include_router(appointment_router)
+api_v1_router.include_router(monitoring_router)
 
 app.include_router(api_v1_router)
 
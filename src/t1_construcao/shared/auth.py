@@ -1,10 +1,23 @@
+import asyncio
+import contextlib
+import hashlib
+import json
+import logging
 import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
 import requests
-from jose import jwk, jwt
-from jose.exceptions import ExpiredSignatureError, JWTClaimsError
 from fastapi import HTTPException, Security, Depends, Path
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from starlette.status import HTTP_401_UNAUTHORIZED, HTTP_403_FORBIDDEN
+from .principal import Principal, Role
+from .token_verifiers import (
+    TokenClaimsError,
+    TokenExpiredError,
+    create_token_verifier,
+)
 
 try:
     COGNITO_ISSUER = os.environ["JWT_ISSUER"]
@@ -16,12 +29,220 @@ except KeyError as e:
     ) from e
 
 
-try:
+JWKS_REFRESH_MIN_INTERVAL_SECONDS = float(
+    os.environ.get("JWKS_REFRESH_MIN_INTERVAL_SECONDS", "60")
+)
+
+JWKS_REFRESH_INTERVAL_SECONDS = float(
+    os.environ.get("JWKS_REFRESH_INTERVAL_SECONDS", "3600")
+)
+JWKS_FILE = os.environ.get("JWKS_FILE")
+
+TOKEN_CACHE_MAX_SIZE = int(os.environ.get("TOKEN_CACHE_MAX_SIZE", "10000"))
+
+TOKEN_VERIFIER_BACKEND = os.environ.get("TOKEN_VERIFIER_BACKEND", "jose")
+
+logger = logging.getLogger(__name__)
+
+jwks: list[dict] = []
+_public_keys: dict[str, Any] = {}
+_jwks_last_refresh = 0.0
+_jwks_lock = threading.Lock()
+
+
+class TokenCache:
+    """
+    Cache LRU de payloads já validados, indexado pelo SHA-256 do token.
+    Cada entrada expira no 'exp' do próprio token e o número de entradas
+    é limitado por 'max_size'.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self._max_size = max_size
+        self._entries: OrderedDict[bytes, tuple[float, dict]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _digest(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token: str) -> dict | None:
+        digest = self._digest(token)
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            expires_at, payload = entry
+            if time.time() >= expires_at:
+                del self._entries[digest]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(digest)
+            self.hits += 1
+            return dict(payload)
+
+    def put(self, token: str, payload: dict) -> None:
+        expires_at = payload.get("exp")
+        if self._max_size <= 0 or not isinstance(expires_at, (int, float)):
+            return
+
+        digest = self._digest(token)
+        with self._lock:
+            self._entries[digest] = (float(expires_at), dict(payload))
+            self._entries.move_to_end(digest)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "max_size": self._max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+token_cache = TokenCache(TOKEN_CACHE_MAX_SIZE)
+
+token_verifier = create_token_verifier(
+    TOKEN_VERIFIER_BACKEND, COGNITO_ISSUER, COGNITO_AUDIENCE
+)
+
+
+def _fetch_jwks() -> list[dict]:
     jwks_response = requests.get(JWKS_URI, timeout=10)
     jwks_response.raise_for_status()
-    jwks = jwks_response.json()["keys"]
-except requests.exceptions.RequestException as e:
-    jwks = []
+    return jwks_response.json()["keys"]
+
+
+def _set_jwks(keys: list[dict]) -> None:
+    """
+    Substitui o conjunto de chaves e reconstrói o cache de chaves públicas
+    por 'kid'. Chaves malformadas são ignoradas.
+    """
+    global jwks, _public_keys  # pylint: disable=global-statement
+
+    public_keys: dict[str, Any] = {}
+    for key in keys:
+        try:
+            public_keys[key["kid"]] = token_verifier.construct_key(key)
+        except Exception:  # pylint: disable=broad-exception-caught
+            continue
+
+    jwks = keys
+    _public_keys = public_keys
+    token_cache.clear()
+
+
+def refresh_jwks(force: bool = False) -> bool:
+    """
+    Recarrega o JWKS do issuer. Sem 'force', no máximo uma tentativa é feita
+    a cada JWKS_REFRESH_MIN_INTERVAL_SECONDS, para que tokens com 'kid'
+    desconhecido não disparem um pedido ao issuer em cada request.
+    Retorna True se o conjunto de chaves foi atualizado.
+    """
+    global _jwks_last_refresh  # pylint: disable=global-statement
+
+    with _jwks_lock:
+        now = time.monotonic()
+        if (
+            not force
+            and _jwks_last_refresh
+            and now - _jwks_last_refresh < JWKS_REFRESH_MIN_INTERVAL_SECONDS
+        ):
+            return False
+        _jwks_last_refresh = now
+
+        try:
+            keys = _fetch_jwks()
+        except (requests.exceptions.RequestException, KeyError, ValueError) as e:
+            logger.warning("Falha ao obter o JWKS de %s: %s", JWKS_URI, e)
+            return False
+        if not keys:
+            logger.warning("JWKS de %s sem chaves, mantendo as atuais", JWKS_URI)
+            return False
+
+        _set_jwks(keys)
+        return True
+
+
+def get_public_key(kid: str) -> Any | None:
+    """
+    Retorna a chave pública já construída para o 'kid'. Um 'kid' desconhecido
+    (ex.: após rotação de chaves no Cognito) provoca um refresh do JWKS.
+    """
+    public_key = _public_keys.get(kid)
+    if public_key is None and refresh_jwks():
+        public_key = _public_keys.get(kid)
+    return public_key
+
+
+def load_jwks_file(path: str) -> bool:
+    """
+    Carrega o conjunto de chaves a partir de um ficheiro JWKS local
+    (útil para testes e execução offline). Retorna True se foi carregado.
+    """
+    try:
+        with open(path, encoding="utf-8") as jwks_file:
+            keys = json.load(jwks_file)["keys"]
+    except (OSError, KeyError, ValueError) as e:
+        logger.warning("Falha ao carregar o JWKS do ficheiro %s: %s", path, e)
+        return False
+
+    with _jwks_lock:
+        _set_jwks(keys)
+    return True
+
+
+class JwksRefreshService:
+    """
+    Carrega o JWKS no arranque da aplicação sem bloquear o event loop e
+    mantém-no atualizado com uma tarefa periódica em background.
+    """
+
+    def __init__(
+        self,
+        refresh_interval: float = JWKS_REFRESH_INTERVAL_SECONDS,
+        jwks_file: str | None = JWKS_FILE,
+    ) -> None:
+        self._refresh_interval = refresh_interval
+        self._jwks_file = jwks_file
+        self._task: asyncio.Task | None = None
+
+    async def startup(self) -> None:
+        """Load the local JWKS fallback and start the background refresh"""
+        if self._jwks_file:
+            await asyncio.to_thread(load_jwks_file, self._jwks_file)
+        self._task = asyncio.create_task(self._refresh_loop())
+
+    async def shutdown(self) -> None:
+        """Stop the background refresh"""
+        if self._task is None:
+            return
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    async def _refresh_loop(self) -> None:
+        while True:
+            try:
+                await asyncio.to_thread(refresh_jwks, True)
+            except Exception:  # pylint: disable=broad-except
+                # Mantém as chaves atuais e tenta de novo no próximo intervalo
+                logger.exception("Falha inesperada ao atualizar o JWKS")
+            await asyncio.sleep(self._refresh_interval)
+
 
 security_scheme = HTTPBearer(
     description="Insira o Access Token (JWT) fornecido pelo Cognito/Auth0."
@@ -29,50 +250,40 @@ security_scheme = HTTPBearer(
 
 
 def validate_token(token: str) -> dict:
-    if not jwks:
+    cached_payload = token_cache.get(token)
+    if cached_payload is not None:
+        return cached_payload
+
+    if not _public_keys:
+        refresh_jwks()
+    if not _public_keys:
         raise HTTPException(
             status_code=HTTP_401_UNAUTHORIZED,
             detail="JWKS não disponível, validação falhou",
         )
 
     try:
-        headers = jwt.get_unverified_headers(token)
+        headers = token_verifier.get_unverified_header(token)
         kid = headers["kid"]
     except Exception as e:
         raise HTTPException(
             status_code=HTTP_401_UNAUTHORIZED, detail="Cabeçalho do token inválido"
         ) from e
 
-    key = next((k for k in jwks if k["kid"] == kid), None)
-    if not key:
+    public_key = get_public_key(kid)
+    if public_key is None:
         raise HTTPException(
             status_code=HTTP_401_UNAUTHORIZED,
             detail="Chave pública (JWKS) não encontrada para o kid",
         )
 
     try:
-        public_key = jwk.construct(key)
-
-        payload = jwt.decode(
-            token,
-            public_key.to_pem(),
-            algorithms=["RS256"],
-            issuer=COGNITO_ISSUER,
-            audience=COGNITO_AUDIENCE,
-            options={
-                "verify_signature": True,
-                "verify_iss": True,
-                "verify_aud": True,
-                "verify_exp": True,
-                "verify_nbf": True,
-            },
-        )
-        return payload
-    except ExpiredSignatureError as e:
+        payload = token_verifier.verify(token, public_key)
+    except TokenExpiredError as e:
         raise HTTPException(
             status_code=HTTP_401_UNAUTHORIZED, detail="Token expirado"
         ) from e
-    except JWTClaimsError as e:
+    except TokenClaimsError as e:
         raise HTTPException(
             status_code=HTTP_401_UNAUTHORIZED, detail=f"Claims inválidas: {e}"
         ) from e
@@ -82,6 +293,9 @@ def validate_token(token: str) -> dict:
             detail=f"Erro desconhecido na validação do token: {e}",
         ) from e
 
+    token_cache.put(token, payload)
+    return payload
+
 
 def get_current_user_payload(
     creds: HTTPAuthorizationCredentials = Security(security_scheme),
@@ -95,62 +309,67 @@ def get_current_user_payload(
     return payload
 
 
-def get_admin_user(payload: dict = Depends(get_current_user_payload)) -> dict:
+def get_current_principal(
+    payload: dict = Depends(get_current_user_payload),
+) -> Principal:
+    """
+    Dependência básica de autorização: constrói o Principal (sub + roles)
+    uma única vez por request a partir do payload validado.
+    """
+    return Principal.from_claims(payload)
+
+
+def get_admin_user(principal: Principal = Depends(get_current_principal)) -> Principal:
     """
     Dependência de Admin: Exige um token válido e que o usuário
     esteja no grupo 'admin'.
     """
-    groups = payload.get("cognito:groups", [])
-    if "admin" not in groups:
+    if not principal.is_admin:
         raise HTTPException(
             status_code=HTTP_403_FORBIDDEN, detail="Acesso restrito a administradores"
         )
-    return payload
+    return principal
 
 
-def get_operator_user(payload: dict = Depends(get_current_user_payload)) -> dict:
+def get_operator_user(
+    principal: Principal = Depends(get_current_principal),
+) -> Principal:
     """
     Dependência de Operator: Exige um token válido e que o usuário
     esteja no grupo 'admin' ou 'operator'.
     """
-    groups = payload.get("cognito:groups", [])
-    if "admin" not in groups and "operator" not in groups:
+    if not principal.is_staff:
         raise HTTPException(
             status_code=HTTP_403_FORBIDDEN,
             detail="Acesso restrito a administradores ou operadores",
         )
-    return payload
+    return principal
 
 
-def get_client_user(payload: dict = Depends(get_current_user_payload)) -> dict:
+def get_client_user(principal: Principal = Depends(get_current_principal)) -> Principal:
     """
     Dependência de Client: Exige um token válido e que o usuário
     esteja no grupo 'admin', 'operator' ou 'client'.
     """
-    groups = payload.get("cognito:groups", [])
-    if "admin" not in groups and "operator" not in groups and "client" not in groups:
+    if not principal.has_any_role(Role.AUTHENTICATED):
         raise HTTPException(
             status_code=HTTP_403_FORBIDDEN,
             detail="Acesso restrito a usuários autenticados",
         )
-    return payload
+    return principal
 
 
 def check_admin_or_self(
     user_id: str = Path(..., description="ID do usuário a ser acedido"),
-    payload: dict = Depends(get_current_user_payload),
-) -> dict:
+    principal: Principal = Depends(get_current_principal),
+) -> Principal:
     """
     Dependência de Autorização (RBAC):
     Verifica se o user é 'admin' ou se é o próprio user (self).
     Compara o 'sub' (ID do user no token) com o 'user_id' da URL.
     """
-    user_groups = payload.get("cognito:groups", [])
-
-    user_sub_id = payload.get("sub")
-
-    if "admin" in user_groups or user_sub_id == user_id:
-        return payload
+    if principal.is_admin or principal.owns(user_id):
+        return principal
 
     raise HTTPException(
         status_code=HTTP_403_FORBIDDEN,
@@ -160,19 +379,12 @@ def check_admin_or_self(
 
 def check_appointment_ownership(
     appointment_id: str = Path(..., description="ID do agendamento a ser acedido"),
-    payload: dict = Depends(get_current_user_payload),
-) -> dict:
+    principal: Principal = Depends(get_current_principal),
+) -> Principal:
     """
     Dependência de Autorização (RBAC + Ownership):
     Verifica se o user é 'admin', 'operator' ou se é o dono do agendamento.
     """
-    user_groups = payload.get("cognito:groups", [])
-    user_sub_id = payload.get("sub")
-
-    # Admin e operator têm acesso total
-    if "admin" in user_groups or "operator" in user_groups:
-        return payload
-
-    # Para client, verificar ownership será feito no controller
-    # retornando o payload para uso posterior
-    return payload
+    # Admin e operator têm acesso total; para client, a verificação de
+    # ownership é feita no controller com o Principal retornado
+    return principal
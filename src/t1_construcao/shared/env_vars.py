@@ -5,10 +5,20 @@ from dotenv import load_dotenv
 
 __all__ = ["get_env_var", "get_list_env_var"]
 
+_dotenv_loaded = False
 
-def get_env_var(enviroment_variable: str) -> str:
-    load_dotenv()
-    env_var = os.getenv(enviroment_variable)
+
+def _load_dotenv_once() -> None:
+    """Read the .env file on the first lookup only; later calls just use os.environ."""
+    global _dotenv_loaded  # pylint: disable=global-statement
+    if not _dotenv_loaded:
+        load_dotenv()
+        _dotenv_loaded = True
+
+
+def get_env_var(enviroment_variable: str, default: str | None = None) -> str:
+    _load_dotenv_once()
+    env_var = os.getenv(enviroment_variable, default)
 
     if env_var is None:
         raise ValueError(f"Environment variable {enviroment_variable} not set.")
@@ -17,7 +27,7 @@ def get_env_var(enviroment_variable: str) -> str:
 
 
 def get_list_env_var(enviroment_variable: str) -> List[str]:
-    load_dotenv()
+    _load_dotenv_once()
     env_var = os.getenv(enviroment_variable)
 
     if env_var is None:
@@ -0,0 +1,31 @@
+from typing import Any
+import msgspec
+from fastapi.responses import JSONResponse
+from .env_vars import get_env_var
+
+__all__ = ["RESPONSE_SERIALIZERS", "MSGSPEC_RESPONSES", "MsgspecJSONResponse"]
+
+# pydantic: DTOs validados pelo response_model e serializados pelo FastAPI
+# msgspec: structs de application/dtos/response_structs.py codificados direto
+RESPONSE_SERIALIZERS = ("pydantic", "msgspec")
+
+_serializer = get_env_var("RESPONSE_SERIALIZER", "pydantic").lower()
+if _serializer not in RESPONSE_SERIALIZERS:
+    raise ValueError(
+        f"Unknown response serializer '{_serializer}'. "
+        f"Expected one of: {', '.join(RESPONSE_SERIALIZERS)}"
+    )
+MSGSPEC_RESPONSES = _serializer == "msgspec"
+
+_encoder = msgspec.json.Encoder()
+
+
+class MsgspecJSONResponse(JSONResponse):
+    """
+    Resposta JSON codificada pelo msgspec. Devolvida diretamente pelo
+    endpoint, dispensa a validação pelo response_model e o jsonable_encoder;
+    o response_model continua a documentar o schema no OpenAPI.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return _encoder.encode(content)
@@ -0,0 +1,56 @@
+from dataclasses import dataclass
+from enum import IntFlag
+
+__all__ = ["Role", "Principal"]
+
+
+class Role(IntFlag):
+    NONE = 0
+    ADMIN = 1
+    OPERATOR = 2
+    CLIENT = 4
+
+    STAFF = ADMIN | OPERATOR
+    AUTHENTICATED = ADMIN | OPERATOR | CLIENT
+
+
+_GROUP_ROLES = {
+    "admin": Role.ADMIN,
+    "operator": Role.OPERATOR,
+    "client": Role.CLIENT,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class Principal:
+    """
+    Identidade do autor do request, calculada uma única vez a partir das
+    claims do token: o 'sub', os grupos do Cognito como bitmask de Role e
+    as claims originais.
+    """
+
+    sub: str | None
+    roles: Role
+    claims: dict
+
+    @classmethod
+    def from_claims(cls, claims: dict) -> "Principal":
+        roles = Role.NONE
+        for group in claims.get("cognito:groups") or ():
+            roles |= _GROUP_ROLES.get(group, Role.NONE)
+        return cls(sub=claims.get("sub"), roles=roles, claims=claims)
+
+    def has_any_role(self, roles: Role) -> bool:
+        return bool(self.roles & roles)
+
+    @property
+    def is_admin(self) -> bool:
+        return bool(self.roles & Role.ADMIN)
+
+    @property
+    def is_staff(self) -> bool:
+        """Admin ou operator: acesso a recursos de qualquer usuário."""
+        return bool(self.roles & Role.STAFF)
+
+    def owns(self, user_id: str | None) -> bool:
+        return self.sub is not None and self.sub == user_id
@@ -0,0 +1,203 @@
+import base64
+import json
+import time
+from typing import Any, Protocol
+from cryptography.exceptions import InvalidSignature
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric import padding, rsa
+from jose import jwk, jwt
+from jose.exceptions import ExpiredSignatureError, JWTClaimsError
+
+__all__ = [
+    "TokenVerificationError",
+    "TokenExpiredError",
+    "TokenClaimsError",
+    "TokenVerifier",
+    "JoseTokenVerifier",
+    "CryptographyTokenVerifier",
+    "TOKEN_VERIFIERS",
+    "create_token_verifier",
+]
+
+
+class TokenVerificationError(Exception):
+    """Base error raised when a token fails verification."""
+
+
+class TokenExpiredError(TokenVerificationError):
+    """The token's 'exp' claim is in the past."""
+
+
+class TokenClaimsError(TokenVerificationError):
+    """A registered claim (iss, aud, nbf, ...) is invalid."""
+
+
+class TokenVerifier(Protocol):
+    """
+    Verifies RS256 tokens against public keys built from JWKS entries.
+    Keys returned by construct_key are cached by the caller per 'kid'.
+    """
+
+    def construct_key(self, jwk_data: dict) -> Any:
+        """Build the backend-specific public key for a JWKS entry."""
+        ...
+
+    def get_unverified_header(self, token: str) -> dict:
+        """Return the token header without verifying the signature."""
+        ...
+
+    def verify(self, token: str, key: Any) -> dict:
+        """Verify the signature and claims, returning the payload."""
+        ...
+
+
+class JoseTokenVerifier:
+    """Verifier backed by python-jose."""
+
+    def __init__(self, issuer: str, audience: str) -> None:
+        self._issuer = issuer
+        self._audience = audience
+
+    def construct_key(self, jwk_data: dict) -> Any:
+        return jwk.construct(jwk_data)
+
+    def get_unverified_header(self, token: str) -> dict:
+        return jwt.get_unverified_headers(token)
+
+    def verify(self, token: str, key: Any) -> dict:
+        try:
+            return jwt.decode(
+                token,
+                key,
+                algorithms=["RS256"],
+                issuer=self._issuer,
+                audience=self._audience,
+                options={
+                    "verify_signature": True,
+                    "verify_iss": True,
+                    "verify_aud": True,
+                    "verify_exp": True,
+                    "verify_nbf": True,
+                },
+            )
+        except ExpiredSignatureError as e:
+            raise TokenExpiredError(str(e)) from e
+        except JWTClaimsError as e:
+            raise TokenClaimsError(str(e)) from e
+        except Exception as e:
+            raise TokenVerificationError(str(e)) from e
+
+
+def _b64url_decode(segment: str) -> bytes:
+    return base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4))
+
+
+def _b64url_to_int(segment: str) -> int:
+    return int.from_bytes(_b64url_decode(segment), "big")
+
+
+class CryptographyTokenVerifier:
+    """
+    Verifier built directly on 'cryptography'. Claims are checked with the
+    same rules and messages as python-jose for the options used here.
+    """
+
+    def __init__(self, issuer: str, audience: str) -> None:
+        self._issuer = issuer
+        self._audience = audience
+
+    def construct_key(self, jwk_data: dict) -> rsa.RSAPublicKey:
+        if jwk_data.get("kty") != "RSA":
+            raise ValueError("Only RSA keys are supported")
+        return rsa.RSAPublicNumbers(
+            e=_b64url_to_int(jwk_data["e"]), n=_b64url_to_int(jwk_data["n"])
+        ).public_key()
+
+    def get_unverified_header(self, token: str) -> dict:
+        header = json.loads(_b64url_decode(token.split(".", 1)[0]))
+        if not isinstance(header, dict):
+            raise ValueError("Invalid header")
+        return header
+
+    def verify(self, token: str, key: rsa.RSAPublicKey) -> dict:
+        try:
+            signing_input, signature_segment = token.rsplit(".", 1)
+            header_segment, payload_segment = signing_input.split(".")
+            header = json.loads(_b64url_decode(header_segment))
+            if header.get("alg") != "RS256":
+                raise TokenVerificationError("The specified alg value is not allowed")
+            key.verify(
+                _b64url_decode(signature_segment),
+                signing_input.encode(),
+                padding.PKCS1v15(),
+                hashes.SHA256(),
+            )
+            claims = json.loads(_b64url_decode(payload_segment))
+        except TokenVerificationError:
+            raise
+        except InvalidSignature as e:
+            raise TokenVerificationError("Signature verification failed.") from e
+        except Exception as e:
+            raise TokenVerificationError(str(e)) from e
+
+        if not isinstance(claims, dict):
+            raise TokenVerificationError(
+                "Invalid payload string: must be a json object"
+            )
+
+        self._validate_claims(claims)
+        return claims
+
+    def _validate_claims(self, claims: dict) -> None:
+        now = time.time()
+
+        if "iat" in claims and not isinstance(claims["iat"], (int, float)):
+            raise TokenClaimsError("Issued At claim (iat) must be an integer.")
+
+        if "nbf" in claims:
+            if not isinstance(claims["nbf"], (int, float)):
+                raise TokenClaimsError("Not Before claim (nbf) must be an integer.")
+            if claims["nbf"] > now:
+                raise TokenClaimsError("The token is not yet valid (nbf)")
+
+        if "exp" in claims:
+            if not isinstance(claims["exp"], (int, float)):
+                raise TokenClaimsError(
+                    "Expiration Time claim (exp) must be an integer."
+                )
+            if claims["exp"] < now:
+                raise TokenExpiredError("Signature has expired.")
+
+        if "aud" in claims:
+            audience_claims = claims["aud"]
+            if isinstance(audience_claims, str):
+                audience_claims = [audience_claims]
+            if not isinstance(audience_claims, list) or any(
+                not isinstance(c, str) for c in audience_claims
+            ):
+                raise TokenClaimsError("Invalid claim format in token")
+            if self._audience not in audience_claims:
+                raise TokenClaimsError("Invalid audience")
+
+        if claims.get("iss") != self._issuer:
+            raise TokenClaimsError("Invalid issuer")
+
+        if "sub" in claims and not isinstance(claims["sub"], str):
+            raise TokenClaimsError("Subject must be a string.")
+
+
+TOKEN_VERIFIERS: dict[str, type[JoseTokenVerifier | CryptographyTokenVerifier]] = {
+    "jose": JoseTokenVerifier,
+    "cryptography": CryptographyTokenVerifier,
+}
+
+
+def create_token_verifier(backend: str, issuer: str, audience: str) -> TokenVerifier:
+    try:
+        verifier_class = TOKEN_VERIFIERS[backend]
+    except KeyError as e:
+        raise ValueError(
+            f"Unknown token verifier backend '{backend}'. "
+            f"Expected one of: {', '.join(TOKEN_VERIFIERS)}"
+        ) from e
+    return verifier_class(issuer, audience)
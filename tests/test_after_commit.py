@@ -0,0 +1,36 @@
+import pytest
+
+from t1_construcao.infrastructure.repositories._after_commit import (
+    after_commit,
+    deferred_until_commit,
+)
+
+
+class TestAfterCommit:
+
+    def test_runs_immediately_outside_a_transaction(self):
+        calls = []
+
+        after_commit(lambda: calls.append("applied"))
+
+        assert calls == ["applied"]
+
+    def test_runs_when_the_block_succeeds(self):
+        calls = []
+
+        with deferred_until_commit():
+            after_commit(lambda: calls.append("applied"))
+            assert calls == []
+
+        assert calls == ["applied"]
+
+    def test_is_dropped_when_the_block_raises(self):
+        calls = []
+
+        with pytest.raises(RuntimeError):
+            with deferred_until_commit():
+                after_commit(lambda: calls.append("applied"))
+                raise RuntimeError
+
+        after_commit(lambda: calls.append("outside"))
+        assert calls == ["outside"]
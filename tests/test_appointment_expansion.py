@@ -0,0 +1,370 @@
+from datetime import datetime, timedelta
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+import pytest
+from fastapi.testclient import TestClient
+from tortoise import connections
+
+from t1_construcao.main import app
+from t1_construcao.application.dtos import (
+    AppointmentExpandedResponseDto,
+    AppointmentListFilterDto,
+    AppointmentResponseDto,
+    AppointmentSparseResponseDto,
+    UserResponseDto,
+)
+from t1_construcao.application.usecases import (
+    GetAppointmentByIdUsecase,
+    GetAppointmentsListUsecase,
+)
+from t1_construcao.domain import AppointmentEntity, ServiceEntity, UserEntity
+from t1_construcao.infrastructure import (
+    AppointmentRepository,
+    ServiceRepository,
+    UserRepository,
+)
+from t1_construcao.shared.auth import get_current_user_payload
+
+NOW = datetime(2030, 1, 1, 10, 0)
+
+SERVICE = ServiceEntity(
+    id="service-1",
+    name="Haircut",
+    description="60 minute haircut",
+    duration_minutes=60,
+    price=Decimal("50.00"),
+    is_active=True,
+    created_at=NOW,
+    updated_at=NOW,
+)
+
+USERS = {
+    "user-1": UserEntity(id="user-1", name="Jane", role="client"),
+    "user-2": UserEntity(id="user-2", name="John", role="client"),
+}
+
+
+def _appointment(appointment_id: str, user_id: str) -> AppointmentEntity:
+    return AppointmentEntity(
+        id=appointment_id,
+        user_id=user_id,
+        service_id=SERVICE.id,
+        scheduled_at=NOW,
+        status="pending",
+        notes=None,
+        created_at=NOW,
+        updated_at=NOW,
+    )
+
+
+APPOINTMENTS = [
+    _appointment("appointment-1", "user-1"),
+    _appointment("appointment-2", "user-2"),
+    _appointment("appointment-3", "user-1"),
+]
+
+
+@pytest.fixture
+def appointment_repository():
+    repository = MagicMock()
+    repository.get_all = AsyncMock(return_value=(APPOINTMENTS, 3, None))
+    repository.get_by_id = AsyncMock(return_value=APPOINTMENTS[0])
+    return repository
+
+
+@pytest.fixture
+def service_repository():
+    repository = MagicMock()
+    repository.get_many = AsyncMock(return_value={SERVICE.id: SERVICE})
+    return repository
+
+
+@pytest.fixture
+def user_repository():
+    repository = MagicMock()
+    repository.get_many = AsyncMock(
+        side_effect=lambda ids: {i: USERS[i] for i in ids if i in USERS}
+    )
+    return repository
+
+
+def _expanded(items) -> list[AppointmentExpandedResponseDto]:
+    assert all(isinstance(item, AppointmentExpandedResponseDto) for item in items)
+    return [item for item in items if isinstance(item, AppointmentExpandedResponseDto)]
+
+
+class TestExpandUsecases:
+
+    async def test_list_loads_each_relation_once(
+        self, appointment_repository, service_repository, user_repository
+    ):
+        items, _, _ = await GetAppointmentsListUsecase(
+            AppointmentListFilterDto(expand={"service", "user"}),
+            appointment_repository,
+            service_repository,
+            user_repository,
+        ).execute()
+
+        expanded = _expanded(items)
+        assert [item.user and item.user.name for item in expanded] == [
+            "Jane",
+            "John",
+            "Jane",
+        ]
+        assert all(item.service and item.service.name == "Haircut" for item in expanded)
+        service_repository.get_many.assert_called_once_with([SERVICE.id])
+        user_repository.get_many.assert_called_once()
+        assert sorted(user_repository.get_many.call_args.args[0]) == [
+            "user-1",
+            "user-2",
+        ]
+
+    async def test_list_expands_only_what_was_asked(
+        self, appointment_repository, service_repository, user_repository
+    ):
+        items, _, _ = await GetAppointmentsListUsecase(
+            AppointmentListFilterDto(expand={"service"}),
+            appointment_repository,
+            service_repository,
+            user_repository,
+        ).execute()
+
+        assert all(item.user is None for item in _expanded(items))
+        user_repository.get_many.assert_not_called()
+
+    async def test_list_without_expand_is_unchanged(
+        self, appointment_repository, service_repository, user_repository
+    ):
+        items, _, _ = await GetAppointmentsListUsecase(
+            AppointmentListFilterDto(), appointment_repository
+        ).execute()
+
+        assert all(type(item) is AppointmentResponseDto for item in items)
+        service_repository.get_many.assert_not_called()
+
+    async def test_by_id_expands(
+        self, appointment_repository, service_repository, user_repository
+    ):
+        appointment = await GetAppointmentByIdUsecase(
+            "appointment-1",
+            appointment_repository,
+            expand={"user"},
+            service_repository=service_repository,
+            user_repository=user_repository,
+        ).execute()
+
+        assert isinstance(appointment, AppointmentExpandedResponseDto)
+        assert appointment.user is not None and appointment.user.name == "Jane"
+        assert appointment.service is None
+
+    async def test_expand_requires_the_relation_repository(
+        self, appointment_repository, user_repository
+    ):
+        with pytest.raises(ValueError, match="service_repository"):
+            await GetAppointmentByIdUsecase(
+                "appointment-1",
+                appointment_repository,
+                expand={"service"},
+                user_repository=user_repository,
+            ).execute()
+
+
+ADMIN_PAYLOAD = {"sub": "admin-uuid-12345", "cognito:groups": ["admin"]}
+
+
+@pytest.fixture
+def test_client():
+    with TestClient(app) as c:
+        yield c
+    app.dependency_overrides = {}
+
+
+def test_list_serializes_expanded_items(test_client, mocker):
+    app.dependency_overrides[get_current_user_payload] = lambda: ADMIN_PAYLOAD
+    execute = mocker.patch(
+        "t1_construcao.application.usecases.GetAppointmentsListUsecase.execute",
+        return_value=(
+            [
+                AppointmentExpandedResponseDto(
+                    **AppointmentResponseDto(
+                        id="appointment-1",
+                        user_id="user-1",
+                        service_id=SERVICE.id,
+                        scheduled_at=NOW,
+                        status="pending",
+                        notes=None,
+                        created_at=NOW,
+                        updated_at=NOW,
+                    ).model_dump(),
+                    service=None,
+                    user=UserResponseDto(id="user-1", name="Jane", role="client"),
+                )
+            ],
+            1,
+            None,
+        ),
+    )
+
+    response = test_client.get(
+        "/api/v1/appointments/?expand=user",
+        headers={"Authorization": "Bearer fake-admin-token"},
+    )
+
+    assert response.status_code == 200
+    item = response.json()["items"][0]
+    assert item["user"] == {"id": "user-1", "name": "Jane", "role": "client"}
+    assert item["service"] is None
+    execute.assert_called_once()
+
+
+def test_invalid_expand_is_rejected(test_client):
+    app.dependency_overrides[get_current_user_payload] = lambda: ADMIN_PAYLOAD
+
+    response = test_client.get(
+        "/api/v1/appointments/?expand=service,payments",
+        headers={"Authorization": "Bearer fake-admin-token"},
+    )
+
+    assert response.status_code == 400
+    assert "payments" in response.json()["detail"]
+
+
+def test_list_without_expand_keeps_the_plain_shape(test_client, mocker):
+    app.dependency_overrides[get_current_user_payload] = lambda: ADMIN_PAYLOAD
+    mocker.patch(
+        "t1_construcao.application.usecases.GetAppointmentsListUsecase.execute",
+        return_value=(
+            [
+                AppointmentResponseDto(
+                    id="appointment-1",
+                    user_id="user-1",
+                    service_id=SERVICE.id,
+                    scheduled_at=NOW,
+                    status="pending",
+                    notes=None,
+                    created_at=NOW,
+                    updated_at=NOW,
+                )
+            ],
+            1,
+            None,
+        ),
+    )
+
+    response = test_client.get(
+        "/api/v1/appointments/",
+        headers={"Authorization": "Bearer fake-admin-token"},
+    )
+
+    assert response.status_code == 200
+    assert "user" not in response.json()["items"][0]
+
+
+def test_list_serializes_only_requested_fields(test_client, mocker):
+    app.dependency_overrides[get_current_user_payload] = lambda: ADMIN_PAYLOAD
+    execute = mocker.patch(
+        "t1_construcao.application.usecases.GetAppointmentsListUsecase.execute",
+        return_value=(
+            [AppointmentSparseResponseDto(id="appointment-1", status="pending")],
+            None,
+            None,
+        ),
+    )
+
+    response = test_client.get(
+        "/api/v1/appointments/?fields=id,status&include_total=none",
+        headers={"Authorization": "Bearer fake-admin-token"},
+    )
+
+    assert response.status_code == 200
+    assert response.json()["items"] == [{"id": "appointment-1", "status": "pending"}]
+    assert response.json()["total"] is None
+    execute.assert_called_once()
+
+
+def test_invalid_field_is_rejected(test_client):
+    app.dependency_overrides[get_current_user_payload] = lambda: ADMIN_PAYLOAD
+
+    response = test_client.get(
+        "/api/v1/appointments/?fields=id,password",
+        headers={"Authorization": "Bearer fake-admin-token"},
+    )
+
+    assert response.status_code == 400
+    assert "password" in response.json()["detail"]
+
+
+@pytest.mark.integration
+async def test_user_repository_get_many(clean_db):
+    repository = UserRepository()
+    jane = await repository.create("Jane")
+    john = await repository.create("John")
+
+    found = await repository.get_many([jane.id, john.id, "not-a-uuid"])
+
+    assert found == {jane.id: jane, john.id: john}
+
+
+@pytest.mark.integration
+class TestSparseFieldsets:
+
+    @pytest.fixture
+    async def appointments(self, clean_db):
+        user = await UserRepository().create("Jane")
+        service = await ServiceRepository().create(
+            name="Haircut",
+            description="60 minute haircut",
+            duration_minutes=60,
+            price=Decimal("50.00"),
+        )
+        return [
+            await AppointmentRepository().create(
+                user_id=user.id,
+                service_id=service.id,
+                scheduled_at=NOW + timedelta(hours=hours),
+                notes="A long note",
+            )
+            for hours in range(3)
+        ]
+
+    async def test_only_requested_columns_are_selected(self, appointments, mocker):
+        client = connections.get("default")
+        spies = [
+            mocker.spy(client, "execute_query"),
+            mocker.spy(client, "execute_query_dict"),
+        ]
+
+        rows, total, next_cursor = await AppointmentRepository().get_all(
+            page_size=2, include_total="none", fields=("id", "status")
+        )
+
+        assert rows == [
+            {"id": appointment.id, "status": "pending"}
+            for appointment in appointments[:2]
+        ]
+        assert total is None
+        [sql] = [call.args[0] for spy in spies for call in spy.call_args_list]
+        assert '"notes"' not in sql and '"status"' in sql
+
+        rest, _, _ = await AppointmentRepository().get_all(
+            page_size=2, cursor=next_cursor, fields=("id",)
+        )
+        assert rest == [{"id": appointments[2].id}]
+
+    async def test_unknown_column_is_rejected(self, clean_db):
+        with pytest.raises(ValueError):
+            await AppointmentRepository().get_all(fields=("id", "password"))
+
+    async def test_usecase_combines_fields_and_expand(self, appointments):
+        items, _, _ = await GetAppointmentsListUsecase(
+            AppointmentListFilterDto(fields=("scheduled_at",), expand={"user"}),
+            AppointmentRepository(),
+            ServiceRepository(),
+            UserRepository(),
+        ).execute()
+
+        assert isinstance(items[0], AppointmentSparseResponseDto)
+        assert items[0].model_dump(exclude_unset=True) == {
+            "scheduled_at": appointments[0].scheduled_at,
+            "user": {"id": appointments[0].user_id, "name": "Jane", "role": "client"},
+        }
@@ -0,0 +1,126 @@
+from datetime import datetime, timezone
+import json
+import pytest
+from tortoise import Tortoise
+
+from t1_construcao.infrastructure.models import Appointment, Service, User
+from t1_construcao.infrastructure.repositories.appointment_repository import (
+    _CONFLICT_QUERY,
+)
+
+pytestmark = pytest.mark.integration
+
+SERVICES = 20
+USERS = 200
+APPOINTMENTS = 20000
+
+
+@pytest.fixture
+async def seeded_db(clean_db):
+    """A few thousand appointments, mostly inactive, spread over a year."""
+    services = [
+        Service(
+            name=f"Service {i}",
+            description="Seeded",
+            duration_minutes=30,
+            price=10,
+        )
+        for i in range(SERVICES)
+    ]
+    users = [User(name=f"User {i}") for i in range(USERS)]
+    await Service.bulk_create(services)
+    await User.bulk_create(users)
+
+    connection = Tortoise.get_connection("default")
+    await connection.execute_query(
+        """
+        INSERT INTO appointments (id, user_id, service_id, scheduled_at, status)
+        SELECT
+            gen_random_uuid(),
+            ($1::uuid[])[1 + n % cardinality($1::uuid[])],
+            ($2::uuid[])[1 + n % cardinality($2::uuid[])],
+            $3::timestamptz + n * INTERVAL '30 minutes',
+            (ARRAY['completed', 'cancelled', 'completed', 'pending', 'confirmed'])[1 + n % 5]
+        FROM generate_series(1, $4::int) AS n
+        """,
+        [
+            [u.id for u in users],
+            [s.id for s in services],
+            datetime(2030, 1, 1, tzinfo=timezone.utc),
+            APPOINTMENTS,
+        ],
+    )
+    await connection.execute_script("ANALYZE appointments")
+    return services, users
+
+
+def _index_names(plan: dict) -> set[str]:
+    names = {plan["Index Name"]} if "Index Name" in plan else set()
+    for child in plan.get("Plans", []):
+        names |= _index_names(child)
+    return names
+
+
+async def _explain(sql: str, params: list | None = None) -> set[str]:
+    rows = await Tortoise.get_connection("default").execute_query_dict(
+        "EXPLAIN (FORMAT JSON) " + sql, params
+    )
+    plan = rows[0]["QUERY PLAN"]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return _index_names(plan[0]["Plan"])
+
+
+class TestAppointmentIndexes:
+
+    async def test_conflict_check_uses_partial_index(self, seeded_db):
+        services, _ = seeded_db
+
+        indexes = await _explain(
+            _CONFLICT_QUERY,
+            [
+                services[0].id,
+                datetime(2030, 3, 1, 10, tzinfo=timezone.utc),
+                30,
+                None,
+            ],
+        )
+
+        assert "idx_appointments_active_service_scheduled" in indexes
+
+    async def test_client_list_uses_user_index(self, seeded_db):
+        _, users = seeded_db
+        query = (
+            Appointment.filter(user_id=users[0].id)
+            .order_by("scheduled_at", "id")
+            .limit(11)
+        )
+
+        indexes = await _explain(query.sql(params_inline=True))
+
+        assert "idx_appointments_user_scheduled" in indexes
+
+    async def test_keyset_page_uses_scheduled_index(self, seeded_db):
+        query = (
+            Appointment.filter(
+                scheduled_at__gt=datetime(2030, 6, 1, tzinfo=timezone.utc)
+            )
+            .order_by("scheduled_at", "id")
+            .limit(11)
+        )
+
+        indexes = await _explain(query.sql(params_inline=True))
+
+        assert "idx_appointments_scheduled" in indexes
+
+    async def test_service_status_list_uses_composite_index(self, seeded_db):
+        services, _ = seeded_db
+        query = (
+            Appointment.filter(service_id=services[0].id, status="cancelled")
+            .order_by("scheduled_at", "id")
+            .limit(11)
+        )
+
+        indexes = await _explain(query.sql(params_inline=True))
+
+        assert "idx_appointments_service_status_scheduled" in indexes
@@ -0,0 +1,89 @@
+from datetime import datetime, timedelta, timezone
+import pytest
+
+from t1_construcao.infrastructure.repositories._appointment_interval_index import (
+    AppointmentIntervalIndex,
+)
+
+START = datetime(2030, 1, 1, 10, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def index():
+    index = AppointmentIntervalIndex()
+    index.load(
+        [("apt-1", "svc-1", START), ("apt-2", "svc-1", START + timedelta(hours=3))],
+        {"svc-1": 60, "svc-2": 30},
+    )
+    return index
+
+
+class TestHasConflict:
+
+    @pytest.mark.parametrize(
+        "offset_minutes, expected",
+        [
+            (-90, False),  # 08:30-09:30 ends before 10:00
+            (-60, False),  # 09:00-10:00 touches the start
+            (-30, True),  # 09:30-10:30 overlaps the start
+            (0, True),  # same slot
+            (30, True),  # 10:30-11:30 overlaps the end
+            (60, False),  # 11:00-12:00 starts when the booking ends
+            (150, True),  # 12:30-13:30 overlaps the second booking
+        ],
+    )
+    def test_overlap(self, index, offset_minutes, expected):
+        scheduled_at = START + timedelta(minutes=offset_minutes)
+
+        assert index.has_conflict("svc-1", scheduled_at, 60) is expected
+
+    def test_naive_datetimes_are_treated_as_utc(self, index):
+        naive = START.replace(tzinfo=None) + timedelta(minutes=30)
+
+        assert index.has_conflict("svc-1", naive, 60) is True
+
+    def test_uses_service_duration_when_not_provided(self, index):
+        assert index.has_conflict("svc-1", START - timedelta(minutes=30), 0) is True
+
+    def test_excluded_appointment_does_not_conflict(self, index):
+        assert index.has_conflict("svc-1", START, 60, "apt-1") is False
+
+    def test_unknown_service_does_not_conflict(self, index):
+        assert index.has_conflict("svc-2", START, 60) is False
+        assert index.has_conflict("svc-3", START, 60) is False
+
+
+class TestMaintenance:
+
+    def test_upsert_adds_active_appointment(self, index):
+        index.upsert("apt-3", "svc-2", START, "pending")
+
+        assert index.has_conflict("svc-2", START + timedelta(minutes=15), 15) is True
+
+    def test_upsert_moves_rescheduled_appointment(self, index):
+        index.upsert("apt-1", "svc-1", START + timedelta(days=1), "confirmed")
+
+        assert index.has_conflict("svc-1", START, 60) is False
+        assert index.has_conflict("svc-1", START + timedelta(days=1), 60) is True
+
+    @pytest.mark.parametrize("status", ["cancelled", "completed"])
+    def test_inactive_status_removes_appointment(self, index, status):
+        index.upsert("apt-1", "svc-1", START, status)
+
+        assert index.has_conflict("svc-1", START, 60) is False
+
+    def test_remove(self, index):
+        index.remove("apt-1")
+        index.remove("missing")
+
+        assert index.has_conflict("svc-1", START, 60) is False
+
+    def test_longer_service_duration_extends_existing_bookings(self, index):
+        index.set_service_duration("svc-1", 120)
+
+        assert index.has_conflict("svc-1", START + timedelta(minutes=90), 15) is True
+
+    def test_remove_service(self, index):
+        index.remove_service("svc-1")
+
+        assert index.has_conflict("svc-1", START, 60) is False
@@ -0,0 +1,127 @@
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+import pytest
+from fastapi import HTTPException
+
+from t1_construcao.application.dtos import CancelAppointmentDto, UpdateAppointmentDto
+from t1_construcao.application.usecases import (
+    CancelAppointmentUsecase,
+    DeleteAppointmentUsecase,
+    UpdateAppointmentUsecase,
+)
+from t1_construcao.domain import AppointmentEntity
+
+
+@pytest.fixture
+def appointment():
+    now = datetime.now()
+    return AppointmentEntity(
+        id="appointment-1",
+        user_id="owner",
+        service_id="service-1",
+        scheduled_at=now,
+        status="pending",
+        notes=None,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+@pytest.fixture
+def appointment_repository(appointment):
+    repository = MagicMock()
+    repository.enforces_no_overlap = False
+    repository.get_by_id = AsyncMock(return_value=appointment)
+    repository.update = AsyncMock(return_value=appointment)
+    repository.delete = AsyncMock(return_value=None)
+    return repository
+
+
+def _update(repository, owner_id):
+    return UpdateAppointmentUsecase(
+        appointment_id="appointment-1",
+        update_appointment_dto=UpdateAppointmentDto(notes="Moved"),
+        appointment_repository=repository,
+        service_repository=MagicMock(),
+        owner_id=owner_id,
+    )
+
+
+def _cancel(repository, owner_id):
+    return CancelAppointmentUsecase(
+        appointment_id="appointment-1",
+        cancel_appointment_dto=CancelAppointmentDto(),
+        appointment_repository=repository,
+        owner_id=owner_id,
+    )
+
+
+class TestOwnerScopedMutations:
+
+    @pytest.mark.parametrize("usecase", [_update, _cancel], ids=["update", "cancel"])
+    async def test_owner_reads_the_appointment_once(
+        self, usecase, appointment_repository
+    ):
+        await usecase(appointment_repository, "owner").execute()
+
+        appointment_repository.get_by_id.assert_called_once_with("appointment-1")
+        appointment_repository.update.assert_called_once()
+
+    @pytest.mark.parametrize(
+        "usecase, verb", [(_update, "update"), (_cancel, "cancel")]
+    )
+    async def test_other_user_is_forbidden(self, usecase, verb, appointment_repository):
+        with pytest.raises(HTTPException) as exc_info:
+            await usecase(appointment_repository, "someone-else").execute()
+
+        assert exc_info.value.status_code == 403
+        assert exc_info.value.detail == f"You can only {verb} your own appointments"
+        appointment_repository.update.assert_not_called()
+
+    @pytest.mark.parametrize("usecase", [_update, _cancel], ids=["update", "cancel"])
+    async def test_missing_appointment_is_not_found(
+        self, usecase, appointment_repository
+    ):
+        appointment_repository.get_by_id.return_value = None
+
+        with pytest.raises(HTTPException) as exc_info:
+            await usecase(appointment_repository, "owner").execute()
+
+        assert exc_info.value.status_code == 404
+
+
+class TestOwnerScopedDelete:
+
+    async def test_owner_deletes_without_reading(self, appointment_repository):
+        await DeleteAppointmentUsecase(
+            "appointment-1", appointment_repository, owner_id="owner"
+        ).execute()
+
+        appointment_repository.delete.assert_called_once_with(
+            "appointment-1", user_id="owner"
+        )
+        appointment_repository.get_by_id.assert_not_called()
+
+    async def test_other_users_appointment_is_forbidden(self, appointment_repository):
+        appointment_repository.delete.side_effect = ValueError("Appointment not found")
+
+        with pytest.raises(HTTPException) as exc_info:
+            await DeleteAppointmentUsecase(
+                "appointment-1", appointment_repository, owner_id="someone-else"
+            ).execute()
+
+        assert exc_info.value.status_code == 403
+
+    @pytest.mark.parametrize("owner_id", ["owner", None], ids=["client", "staff"])
+    async def test_missing_appointment_is_not_found(
+        self, owner_id, appointment_repository
+    ):
+        appointment_repository.delete.side_effect = ValueError("Appointment not found")
+        appointment_repository.get_by_id.return_value = None
+
+        with pytest.raises(HTTPException) as exc_info:
+            await DeleteAppointmentUsecase(
+                "appointment-1", appointment_repository, owner_id=owner_id
+            ).execute()
+
+        assert exc_info.value.status_code == 404
@@ -0,0 +1,649 @@
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import cast
+import pytest
+from tortoise import Tortoise
+
+from t1_construcao.domain import (
+    AppointmentConflictError,
+    AppointmentEntity,
+    InvalidCursorError,
+)
+from t1_construcao.infrastructure import UnitOfWork
+from t1_construcao.infrastructure._appointment_overlap import (
+    is_overlap_constraint_installed,
+)
+from t1_construcao.infrastructure.models import Appointment
+from t1_construcao.infrastructure.repositories import (
+    AppointmentRepository,
+    ServiceRepository,
+    UserRepository,
+)
+from t1_construcao.infrastructure.repositories._local_caches import (
+    appointment_interval_index,
+)
+
+pytestmark = pytest.mark.integration
+
+
+@pytest.fixture
+async def booking_context(clean_db):
+    user = await UserRepository().create("Booking User")
+    service = await ServiceRepository().create(
+        name="Haircut",
+        description="60 minute haircut",
+        duration_minutes=60,
+        price=Decimal("50.00"),
+    )
+    start = (datetime.now() + timedelta(days=1)).replace(
+        hour=10, minute=0, second=0, microsecond=0
+    )
+    appointment = await AppointmentRepository().create(
+        user_id=user.id, service_id=service.id, scheduled_at=start
+    )
+    return user, service, appointment, start
+
+
+class TestCheckConflict:
+
+    @pytest.mark.parametrize(
+        "offset_minutes, expected",
+        [
+            (-90, False),  # 08:30-09:30 ends before 10:00
+            (-60, False),  # 09:00-10:00 touches the start
+            (-30, True),  # 09:30-10:30 overlaps the start
+            (0, True),  # same slot
+            (30, True),  # 10:30-11:30 overlaps the end
+            (60, False),  # 11:00-12:00 starts when the booking ends
+        ],
+    )
+    async def test_overlap(self, booking_context, offset_minutes, expected):
+        _, service, _, start = booking_context
+
+        has_conflict = await AppointmentRepository().check_conflict(
+            service_id=service.id,
+            scheduled_at=start + timedelta(minutes=offset_minutes),
+            duration_minutes=60,
+        )
+
+        assert has_conflict is expected
+
+    async def test_uses_service_duration_when_not_provided(self, booking_context):
+        _, service, _, start = booking_context
+
+        has_conflict = await AppointmentRepository().check_conflict(
+            service_id=service.id,
+            scheduled_at=start - timedelta(minutes=30),
+            duration_minutes=0,
+        )
+
+        assert has_conflict is True
+
+    async def test_excluded_appointment_does_not_conflict(self, booking_context):
+        _, service, appointment, start = booking_context
+
+        has_conflict = await AppointmentRepository().check_conflict(
+            service_id=service.id,
+            scheduled_at=start + timedelta(minutes=15),
+            duration_minutes=60,
+            exclude_appointment_id=appointment.id,
+        )
+
+        assert has_conflict is False
+
+    async def test_cancelled_appointment_does_not_conflict(self, booking_context):
+        _, service, appointment, start = booking_context
+        await AppointmentRepository().update(appointment.id, status="cancelled")
+
+        has_conflict = await AppointmentRepository().check_conflict(
+            service_id=service.id, scheduled_at=start, duration_minutes=60
+        )
+
+        assert has_conflict is False
+
+    async def test_other_service_does_not_conflict(self, booking_context):
+        _, _, _, start = booking_context
+        other_service = await ServiceRepository().create(
+            name="Massage",
+            description="Massage",
+            duration_minutes=60,
+            price=Decimal("80.00"),
+        )
+
+        has_conflict = await AppointmentRepository().check_conflict(
+            service_id=other_service.id, scheduled_at=start, duration_minutes=60
+        )
+
+        assert has_conflict is False
+
+
+async def _btree_gist_available() -> bool:
+    rows = await Tortoise.get_connection("default").execute_query_dict(
+        "SELECT 1 FROM pg_available_extensions WHERE name = 'btree_gist'"
+    )
+    return bool(rows)
+
+
+@pytest.fixture
+async def overlap_migration(booking_context, run_migration):
+    await run_migration("appointment_overlap_constraint")
+    yield booking_context
+    await run_migration("appointment_overlap_constraint", downgrade=True)
+
+
+@pytest.fixture
+async def overlap_constraint(overlap_migration):
+    # CI's postgres image ships btree_gist; minimal local servers may not
+    if not await _btree_gist_available():
+        pytest.skip("btree_gist extension is not available")
+    return overlap_migration
+
+
+class TestOverlapMigration:
+
+    async def test_installs_constraint_when_btree_gist_is_available(
+        self, overlap_migration
+    ):
+        installed = await is_overlap_constraint_installed(
+            Tortoise.get_connection("default")
+        )
+
+        assert installed is await _btree_gist_available()
+
+    async def test_downgrade_removes_constraint(self, overlap_migration, run_migration):
+        await run_migration("appointment_overlap_constraint", downgrade=True)
+
+        assert not await is_overlap_constraint_installed(
+            Tortoise.get_connection("default")
+        )
+
+
+class TestOverlapConstraint:
+
+    async def test_overlapping_insert_raises_conflict(self, overlap_constraint):
+        user, service, _, start = overlap_constraint
+
+        with pytest.raises(AppointmentConflictError):
+            await AppointmentRepository().create(
+                user_id=user.id,
+                service_id=service.id,
+                scheduled_at=start + timedelta(minutes=30),
+            )
+
+    async def test_adjacent_insert_is_accepted(self, overlap_constraint):
+        user, service, _, start = overlap_constraint
+
+        appointment = await AppointmentRepository().create(
+            user_id=user.id,
+            service_id=service.id,
+            scheduled_at=start + timedelta(minutes=60),
+        )
+
+        assert appointment.status == "pending"
+
+    async def test_overlapping_reschedule_raises_conflict(self, overlap_constraint):
+        user, service, _, start = overlap_constraint
+        later = await AppointmentRepository().create(
+            user_id=user.id,
+            service_id=service.id,
+            scheduled_at=start + timedelta(hours=3),
+        )
+
+        with pytest.raises(AppointmentConflictError):
+            await AppointmentRepository().update(
+                later.id, scheduled_at=start + timedelta(minutes=15)
+            )
+
+    async def test_duration_change_recomputes_time_ranges(self, overlap_constraint):
+        user, service, _, start = overlap_constraint
+        await AppointmentRepository().create(
+            user_id=user.id,
+            service_id=service.id,
+            scheduled_at=start + timedelta(minutes=90),
+        )
+
+        await ServiceRepository().update(service.id, duration_minutes=30)
+        # 10:00-10:30, so 10:45 no longer overlaps
+        await AppointmentRepository().create(
+            user_id=user.id,
+            service_id=service.id,
+            scheduled_at=start + timedelta(minutes=45),
+        )
+
+        with pytest.raises(AppointmentConflictError):
+            # 10:00-11:00 would overlap the 10:45 appointment
+            await ServiceRepository().update(service.id, duration_minutes=60)
+
+
+@pytest.fixture
+async def interval_index(booking_context):
+    await AppointmentRepository().load_interval_index()
+    yield booking_context
+    appointment_interval_index.load([], {})
+    appointment_interval_index.loaded = False
+
+
+class TestIntervalIndex:
+
+    async def test_known_conflict_is_answered_without_query(
+        self, interval_index, mocker
+    ):
+        _, service, _, start = interval_index
+        get_connection = mocker.patch(
+            "t1_construcao.infrastructure.repositories."
+            "appointment_repository.connections.get"
+        )
+
+        has_conflict = await AppointmentRepository().check_conflict(
+            service_id=service.id,
+            scheduled_at=start + timedelta(minutes=30),
+            duration_minutes=60,
+        )
+
+        assert has_conflict is True
+        get_connection.assert_not_called()
+
+    async def test_free_slot_is_confirmed_by_database(self, interval_index):
+        user, service, _, start = interval_index
+        # Booked behind the index's back, e.g. by another worker
+        await Appointment.create(
+            user_id=user.id,
+            service_id=service.id,
+            scheduled_at=start + timedelta(hours=2),
+        )
+
+        has_conflict = await AppointmentRepository().check_conflict(
+            service_id=service.id,
+            scheduled_at=start + timedelta(hours=2),
+            duration_minutes=60,
+        )
+
+        assert has_conflict is True
+
+    async def test_writes_keep_the_index_in_sync(self, interval_index):
+        user, service, appointment, start = interval_index
+        repository = AppointmentRepository()
+
+        created = await repository.create(
+            user_id=user.id,
+            service_id=service.id,
+            scheduled_at=start + timedelta(hours=3),
+        )
+        assert appointment_interval_index.has_conflict(
+            service.id, start + timedelta(hours=3), 60
+        )
+
+        await repository.update(created.id, scheduled_at=start + timedelta(hours=5))
+        assert not appointment_interval_index.has_conflict(
+            service.id, start + timedelta(hours=3), 60
+        )
+        assert appointment_interval_index.has_conflict(
+            service.id, start + timedelta(hours=5), 60
+        )
+
+        await repository.update(appointment.id, status="cancelled")
+        assert not appointment_interval_index.has_conflict(service.id, start, 60)
+
+        await repository.delete(created.id)
+        assert not appointment_interval_index.has_conflict(
+            service.id, start + timedelta(hours=5), 60
+        )
+
+    async def test_rolled_back_writes_never_reach_the_index(self, interval_index):
+        user, service, _, start = interval_index
+
+        with pytest.raises(RuntimeError):
+            async with UnitOfWork(transactional=True) as unit_of_work:
+                await unit_of_work.appointments.create(
+                    user_id=user.id,
+                    service_id=service.id,
+                    scheduled_at=start + timedelta(hours=3),
+                )
+                # Not applied while the transaction is still open
+                assert not appointment_interval_index.has_conflict(
+                    service.id, start + timedelta(hours=3), 60
+                )
+                raise RuntimeError
+
+        assert not appointment_interval_index.has_conflict(
+            service.id, start + timedelta(hours=3), 60
+        )
+
+    async def test_committed_writes_reach_the_index(self, interval_index):
+        user, service, _, start = interval_index
+
+        async with UnitOfWork(transactional=True) as unit_of_work:
+            await unit_of_work.appointments.create(
+                user_id=user.id,
+                service_id=service.id,
+                scheduled_at=start + timedelta(hours=3),
+            )
+
+        assert appointment_interval_index.has_conflict(
+            service.id, start + timedelta(hours=3), 60
+        )
+
+
+@pytest.fixture(params=[False, True], ids=["hydrated", "fast_reads"])
+def read_path(request, monkeypatch):
+    for repository in (AppointmentRepository, ServiceRepository, UserRepository):
+        monkeypatch.setattr(repository, "fast_reads", request.param)
+    return request.param
+
+
+class TestReadPaths:
+
+    async def test_get_by_id_matches(self, booking_context, read_path):
+        _, _, appointment, _ = booking_context
+
+        assert await AppointmentRepository().get_by_id(appointment.id) == appointment
+
+    async def test_get_all_matches(self, booking_context, read_path):
+        _, service, appointment, _ = booking_context
+
+        appointments, total, _ = await AppointmentRepository().get_all(
+            service_id=service.id, include_total="window"
+        )
+        services, _, _ = await ServiceRepository().get_all()
+
+        assert appointments == [appointment]
+        assert total == 1
+        assert services == [service]
+
+
+@pytest.mark.usefixtures("read_path")
+async def _entity_page(**kwargs):
+    """get_all without 'fields', whose rows are always entities."""
+    appointments, total, cursor = await AppointmentRepository().get_all(**kwargs)
+    return cast(list[AppointmentEntity], appointments), total, cursor
+
+
+class TestCursorPagination:
+
+    @pytest.fixture
+    async def appointments(self, booking_context):
+        user, service, first, start = booking_context
+        repository = AppointmentRepository()
+        # Two appointments share a start time to exercise the id tie-breaker
+        later = [
+            await repository.create(
+                user_id=user.id,
+                service_id=service.id,
+                scheduled_at=start + timedelta(hours=hours),
+            )
+            for hours in (1, 1, 2, 3)
+        ]
+        return [first, *later]
+
+    async def test_walks_all_pages_in_order(self, appointments):
+        repository = AppointmentRepository()
+        expected = sorted(appointments, key=lambda a: (a.scheduled_at, a.id))
+
+        seen = []
+        page, total, cursor = await repository.get_all(page_size=2)
+        seen.extend(page)
+        while cursor is not None:
+            page, total, cursor = await repository.get_all(page_size=2, cursor=cursor)
+            seen.extend(page)
+
+        assert total == len(appointments)
+        assert [a.id for a in seen] == [a.id for a in expected]
+
+    async def test_cursor_is_not_shifted_by_inserts(self, appointments):
+        user, service = appointments[0].user_id, appointments[0].service_id
+        first_page, _, cursor = await _entity_page(page_size=2)
+
+        await AppointmentRepository().create(
+            user_id=user,
+            service_id=service,
+            scheduled_at=first_page[0].scheduled_at - timedelta(hours=1),
+        )
+        second_page, _, _ = await _entity_page(page_size=2, cursor=cursor)
+        offset_page, _, _ = await _entity_page(page=2, page_size=2)
+
+        assert second_page[0].scheduled_at >= first_page[-1].scheduled_at
+        assert second_page[0].id not in {a.id for a in first_page}
+        assert offset_page[0].id == first_page[-1].id
+
+    async def test_last_page_has_no_cursor(self, appointments):
+        _, _, cursor = await AppointmentRepository().get_all(
+            page_size=len(appointments)
+        )
+
+        assert cursor is None
+
+    @pytest.mark.parametrize("cursor", ["garbage", "WyJ4Il0", "WyJ4IiwieSJd"])
+    async def test_invalid_cursor(self, appointments, cursor):
+        with pytest.raises(InvalidCursorError):
+            await AppointmentRepository().get_all(cursor=cursor)
+
+
+@pytest.mark.usefixtures("read_path")
+class TestIncludeTotal:
+
+    @pytest.fixture
+    async def appointments(self, booking_context):
+        user, service, first, start = booking_context
+        repository = AppointmentRepository()
+        later = [
+            await repository.create(
+                user_id=user.id,
+                service_id=service.id,
+                scheduled_at=start + timedelta(hours=hours),
+            )
+            for hours in range(1, 5)
+        ]
+        return [first, *later]
+
+    @pytest.mark.parametrize("page", [1, 2, 3])
+    async def test_window_total_matches_exact(self, appointments, page):
+        repository = AppointmentRepository()
+
+        exact = await repository.get_all(page=page, page_size=2)
+        window = await repository.get_all(
+            page=page, page_size=2, include_total="window"
+        )
+
+        assert window == exact
+        assert window[1] == len(appointments)
+
+    async def test_window_total_past_last_page(self, appointments):
+        _, total, _ = await AppointmentRepository().get_all(
+            page=10, page_size=2, include_total="window"
+        )
+
+        assert total == len(appointments)
+
+    async def test_window_total_with_cursor(self, appointments):
+        repository = AppointmentRepository()
+        _, _, cursor = await repository.get_all(page_size=2)
+
+        _, total, _ = await repository.get_all(
+            page_size=2, cursor=cursor, include_total="window"
+        )
+
+        assert total == len(appointments)
+
+    async def test_estimated_total(self, appointments):
+        await Tortoise.get_connection("default").execute_script("ANALYZE appointments")
+
+        _, total, _ = await AppointmentRepository().get_all(include_total="estimated")
+
+        assert isinstance(total, int)
+        assert total >= 1
+
+    async def test_no_total(self, appointments):
+        page, total, cursor = await AppointmentRepository().get_all(
+            page_size=2, include_total="none"
+        )
+
+        assert len(page) == 2
+        assert total is None
+        assert cursor is not None
+
+    async def test_unknown_mode(self, appointments):
+        with pytest.raises(ValueError):
+            await AppointmentRepository().get_all(include_total="approximate")
+
+
+class TestUpdate:
+
+    async def test_returns_updated_row_without_reading_it_back(
+        self, booking_context, mocker
+    ):
+        _, _, appointment, start = booking_context
+        repository = AppointmentRepository()
+        get_by_id = mocker.spy(repository, "get_by_id")
+
+        updated = await repository.update(
+            appointment.id,
+            scheduled_at=start + timedelta(hours=2),
+            notes="Moved",
+            status="confirmed",
+        )
+
+        assert updated.id == appointment.id
+        assert updated.status == "confirmed"
+        assert updated.notes == "Moved"
+        assert updated.scheduled_at == appointment.scheduled_at + timedelta(hours=2)
+        get_by_id.assert_not_called()
+        assert updated == await repository.get_by_id(appointment.id)
+
+    async def test_missing_appointment(self, booking_context):
+        with pytest.raises(ValueError, match="Appointment not found"):
+            await AppointmentRepository().update(
+                "00000000-0000-0000-0000-000000000000", status="confirmed"
+            )
+
+
+class TestBulkCreate:
+
+    async def test_find_conflicts_checks_every_slot_in_one_query(self, booking_context):
+        _, service, _, start = booking_context
+        offsets = [-90, -60, -30, 0, 30, 60]
+
+        conflicts = await AppointmentRepository().find_conflicts(
+            [(service.id, start + timedelta(minutes=offset), 60) for offset in offsets]
+        )
+
+        assert conflicts == {2, 3, 4}
+
+    async def test_find_conflicts_without_slots(self, clean_db):
+        assert await AppointmentRepository().find_conflicts([]) == set()
+
+    async def test_inserts_all_appointments(self, booking_context):
+        user, service, _, start = booking_context
+
+        created = await AppointmentRepository().bulk_create(
+            user.id,
+            [
+                (service.id, start + timedelta(hours=1), "first"),
+                (service.id, start + timedelta(hours=2), None),
+            ],
+        )
+
+        assert [appointment.notes for appointment in created] == ["first", None]
+        assert all(appointment.status == "pending" for appointment in created)
+        for appointment in created:
+            assert appointment == await AppointmentRepository().get_by_id(
+                appointment.id
+            )
+
+    async def test_overlap_rolls_back_the_whole_batch(self, overlap_constraint):
+        user, service, _, start = overlap_constraint
+
+        with pytest.raises(AppointmentConflictError):
+            await AppointmentRepository().bulk_create(
+                user.id,
+                [
+                    (service.id, start + timedelta(hours=1), None),
+                    (service.id, start + timedelta(minutes=30), None),
+                ],
+            )
+
+        assert await Appointment.filter(service_id=service.id).count() == 1
+
+
+async def _reload(appointment_id):
+    appointment = await AppointmentRepository().get_by_id(appointment_id)
+    assert appointment is not None
+    return appointment
+
+
+class TestTransitionStatus:
+
+    async def test_updates_only_rows_in_the_source_status(self, booking_context):
+        user, service, appointment, start = booking_context
+        repository = AppointmentRepository()
+        cancelled = await repository.create(
+            user_id=user.id,
+            service_id=service.id,
+            scheduled_at=start + timedelta(hours=2),
+        )
+        await repository.update(cancelled.id, status="cancelled")
+
+        changed = await repository.transition_status(
+            ("pending",),
+            "confirmed",
+            appointment_ids=[appointment.id, cancelled.id, "not-a-uuid"],
+        )
+
+        assert changed == [appointment.id]
+        assert (await _reload(appointment.id)).status == "confirmed"
+        assert (await _reload(cancelled.id)).status == "cancelled"
+
+    async def test_selects_by_filter(self, booking_context):
+        user, service, appointment, start = booking_context
+        repository = AppointmentRepository()
+        next_day = await repository.create(
+            user_id=user.id,
+            service_id=service.id,
+            scheduled_at=start + timedelta(days=1),
+        )
+
+        changed = await repository.transition_status(
+            ("pending",),
+            "confirmed",
+            service_id=service.id,
+            end_date=start + timedelta(hours=12),
+        )
+
+        assert changed == [appointment.id]
+        assert (await _reload(next_day.id)).status == "pending"
+
+    async def test_appends_note(self, booking_context):
+        user, service, appointment, start = booking_context
+        repository = AppointmentRepository()
+        with_notes = await repository.create(
+            user_id=user.id,
+            service_id=service.id,
+            scheduled_at=start + timedelta(hours=2),
+            notes="Bring ID",
+        )
+
+        changed = await repository.transition_status(
+            ("pending", "confirmed"),
+            "cancelled",
+            appointment_ids=[appointment.id, with_notes.id],
+            note="[Cancellation reason: closed]",
+        )
+
+        assert set(changed) == {appointment.id, with_notes.id}
+        assert (await _reload(appointment.id)).notes == "[Cancellation reason: closed]"
+        assert (
+            await _reload(with_notes.id)
+        ).notes == "Bring ID\n[Cancellation reason: closed]"
+
+
+class TestDelete:
+
+    async def test_owner_scoped_delete(self, booking_context):
+        user, _, appointment, _ = booking_context
+        other = await UserRepository().create("Other User")
+
+        with pytest.raises(ValueError, match="Appointment not found"):
+            await AppointmentRepository().delete(appointment.id, user_id=other.id)
+        assert await AppointmentRepository().get_by_id(appointment.id) is not None
+
+        await AppointmentRepository().delete(appointment.id, user_id=user.id)
+        assert await AppointmentRepository().get_by_id(appointment.id) is None
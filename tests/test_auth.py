@@ -0,0 +1,190 @@
+import asyncio
+import json
+import time
+import pytest
+from fastapi import HTTPException
+
+from t1_construcao.shared import auth
+
+
+@pytest.fixture
+def jwks_source(mocker, signing_key):
+    """Substitui o endpoint do issuer por um JWKS local mutável."""
+    keys = [signing_key[1]]
+    fetch = mocker.patch.object(auth, "_fetch_jwks", side_effect=lambda: list(keys))
+    auth.refresh_jwks(force=True)
+    mocker.patch.object(auth, "_jwks_last_refresh", 0.0)
+    auth.token_cache.clear()
+    yield keys, fetch
+    auth._set_jwks([])  # pylint: disable=protected-access
+
+
+class TestValidateToken:
+
+    def test_valid_token_returns_payload(self, mint_token, jwks_source, signing_key):
+        token = mint_token(signing_key[0], "kid-1")
+
+        payload = auth.validate_token(token)
+
+        assert payload["sub"] == "user-uuid-67890"
+
+    def test_public_key_is_constructed_once_per_kid(
+        self, mint_token, jwks_source, signing_key, mocker
+    ):
+        tokens = [mint_token(signing_key[0], "kid-1", jti=str(i)) for i in range(5)]
+        construct = mocker.spy(auth.token_verifier, "construct_key")
+
+        for token in tokens:
+            auth.validate_token(token)
+
+        construct.assert_not_called()
+
+    def test_unknown_kid_triggers_single_refresh(
+        self, mint_token, jwks_source, rotated_signing_key
+    ):
+        keys, fetch = jwks_source
+        keys.append(rotated_signing_key[1])
+        fetch.reset_mock()
+        token = mint_token(rotated_signing_key[0], "kid-2")
+
+        payload = auth.validate_token(token)
+
+        assert payload["sub"] == "user-uuid-67890"
+        fetch.assert_called_once()
+
+    def test_unknown_kid_refresh_is_rate_limited(
+        self, mint_token, jwks_source, signing_key
+    ):
+        _, fetch = jwks_source
+        fetch.reset_mock()
+        token = mint_token(signing_key[0], "kid-missing")
+
+        for _ in range(3):
+            with pytest.raises(HTTPException) as exc_info:
+                auth.validate_token(token)
+            assert exc_info.value.status_code == 401
+
+        fetch.assert_called_once()
+
+    def test_expired_token_is_rejected(self, mint_token, jwks_source, signing_key):
+        token = mint_token(signing_key[0], "kid-1", exp=int(time.time()) - 10)
+
+        with pytest.raises(HTTPException) as exc_info:
+            auth.validate_token(token)
+
+        assert exc_info.value.detail == "Token expirado"
+
+    def test_wrong_audience_is_rejected(self, mint_token, jwks_source, signing_key):
+        token = mint_token(signing_key[0], "kid-1", aud="other-audience")
+
+        with pytest.raises(HTTPException) as exc_info:
+            auth.validate_token(token)
+
+        assert exc_info.value.status_code == 401
+
+
+class TestTokenCache:
+
+    def test_repeated_token_skips_signature_verification(
+        self, mint_token, jwks_source, signing_key, mocker
+    ):
+        token = mint_token(signing_key[0], "kid-1")
+        decode = mocker.spy(auth.token_verifier, "verify")
+        hits_before = auth.token_cache.hits
+
+        payloads = [auth.validate_token(token) for _ in range(5)]
+
+        assert payloads[-1]["sub"] == "user-uuid-67890"
+        assert decode.call_count == 1
+        assert auth.token_cache.hits - hits_before == 4
+
+    def test_entry_expires_at_token_exp(self, mocker):
+        cache = auth.TokenCache(max_size=10)
+        cache.put("token", {"sub": "1", "exp": 1000})
+
+        mocker.patch.object(auth.time, "time", return_value=999.0)
+        assert cache.get("token") == {"sub": "1", "exp": 1000}
+
+        mocker.patch.object(auth.time, "time", return_value=1000.0)
+        assert cache.get("token") is None
+        assert cache.stats()["size"] == 0
+
+    def test_least_recently_used_entry_is_evicted(self):
+        exp = int(time.time()) + 300
+        cache = auth.TokenCache(max_size=2)
+        cache.put("a", {"exp": exp})
+        cache.put("b", {"exp": exp})
+        cache.get("a")
+        cache.put("c", {"exp": exp})
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+
+    def test_token_without_exp_is_not_cached(self):
+        cache = auth.TokenCache(max_size=10)
+        cache.put("token", {"sub": "1"})
+
+        assert cache.get("token") is None
+        assert cache.stats() == {"size": 0, "max_size": 10, "hits": 0, "misses": 1}
+
+    def test_cached_payload_is_a_copy(self):
+        cache = auth.TokenCache(max_size=10)
+        cache.put("token", {"sub": "1", "exp": int(time.time()) + 300})
+
+        cached = cache.get("token")
+        assert cached is not None
+        cached["sub"] = "tampered"
+
+        cached_again = cache.get("token")
+        assert cached_again is not None and cached_again["sub"] == "1"
+
+
+class TestJwksBootstrap:
+
+    def test_load_jwks_file(self, mint_token, tmp_path, signing_key, mocker):
+        mocker.patch.object(auth, "_fetch_jwks", side_effect=AssertionError)
+        jwks_path = tmp_path / "jwks.json"
+        jwks_path.write_text(json.dumps({"keys": [signing_key[1]]}))
+
+        assert auth.load_jwks_file(str(jwks_path)) is True
+
+        payload = auth.validate_token(mint_token(signing_key[0], "kid-1"))
+        assert payload["sub"] == "user-uuid-67890"
+        auth._set_jwks([])  # pylint: disable=protected-access
+
+    def test_load_missing_jwks_file_keeps_current_keys(self, tmp_path):
+        assert auth.load_jwks_file(str(tmp_path / "missing.json")) is False
+
+    async def test_refresh_service_fetches_in_background(
+        self, tmp_path, signing_key, mocker
+    ):
+        fetch = mocker.patch.object(auth, "_fetch_jwks", return_value=[])
+        jwks_path = tmp_path / "jwks.json"
+        jwks_path.write_text(json.dumps({"keys": [signing_key[1]]}))
+        service = auth.JwksRefreshService(
+            refresh_interval=0.01, jwks_file=str(jwks_path)
+        )
+
+        await service.startup()
+        assert "kid-1" in auth._public_keys  # pylint: disable=protected-access
+        await asyncio.sleep(0.05)
+        await service.shutdown()
+
+        assert fetch.call_count >= 2
+        auth._set_jwks([])  # pylint: disable=protected-access
+
+    async def test_refresh_service_survives_refresh_errors(self, mocker):
+        def fail_once(_force):
+            if refresh.call_count == 1:
+                raise RuntimeError("boom")
+            return True
+
+        refresh = mocker.patch.object(auth, "refresh_jwks", side_effect=fail_once)
+        service = auth.JwksRefreshService(refresh_interval=0.01, jwks_file=None)
+
+        await service.startup()
+        await asyncio.sleep(0.05)
+        await service.shutdown()
+
+        assert refresh.call_count >= 2
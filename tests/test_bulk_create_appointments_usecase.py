@@ -0,0 +1,213 @@
+from datetime import datetime, timedelta
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+import pytest
+from fastapi import HTTPException
+
+from t1_construcao.application.dtos import (
+    BulkCreateAppointmentsDto,
+    CreateAppointmentDto,
+)
+from t1_construcao.application.usecases.bulk_create_appointments_usecase import (
+    BulkCreateAppointmentsUsecase,
+)
+from t1_construcao.controllers.appointment_controller import (
+    bulk_create_appointments,
+)
+from t1_construcao.domain import (
+    AppointmentConflictError,
+    AppointmentEntity,
+    ServiceEntity,
+)
+from t1_construcao.shared.principal import Principal, Role
+
+TOMORROW = (datetime.now() + timedelta(days=1)).replace(
+    hour=10, minute=0, second=0, microsecond=0
+)
+
+
+def _service(service_id, is_active=True):
+    now = datetime.now()
+    return ServiceEntity(
+        id=service_id,
+        name=service_id,
+        description=service_id,
+        duration_minutes=60,
+        price=Decimal("50.00"),
+        is_active=is_active,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+@pytest.fixture
+def service_repository():
+    services = {
+        "service-1": _service("service-1"),
+        "service-2": _service("service-2"),
+        "inactive": _service("inactive", is_active=False),
+    }
+    repository = MagicMock()
+    repository.get_many = AsyncMock(
+        side_effect=lambda ids: {i: services[i] for i in ids if i in services}
+    )
+    return repository
+
+
+@pytest.fixture
+def appointment_repository():
+    async def _bulk_create(user_id, appointments):
+        now = datetime.now()
+        return [
+            AppointmentEntity(
+                id=f"appointment-{i}",
+                user_id=user_id,
+                service_id=service_id,
+                scheduled_at=scheduled_at,
+                status="pending",
+                notes=notes,
+                created_at=now,
+                updated_at=now,
+            )
+            for i, (service_id, scheduled_at, notes) in enumerate(appointments)
+        ]
+
+    repository = MagicMock()
+    repository.find_conflicts = AsyncMock(return_value=set())
+    repository.bulk_create = AsyncMock(side_effect=_bulk_create)
+    return repository
+
+
+def _execute(items, appointment_repository, service_repository):
+    dto = BulkCreateAppointmentsDto(
+        items=[
+            CreateAppointmentDto(service_id=service_id, scheduled_at=scheduled_at)
+            for service_id, scheduled_at in items
+        ]
+    )
+    return BulkCreateAppointmentsUsecase(
+        user_id="user-1",
+        bulk_create_appointments_dto=dto,
+        appointment_repository=appointment_repository,
+        service_repository=service_repository,
+    ).execute()
+
+
+class TestBulkCreateAppointmentsUsecase:
+
+    async def test_creates_all_items_in_one_insert(
+        self, appointment_repository, service_repository
+    ):
+        items = [
+            ("service-1", TOMORROW),
+            ("service-1", TOMORROW + timedelta(hours=1)),
+            ("service-2", TOMORROW),
+        ]
+
+        result = await _execute(items, appointment_repository, service_repository)
+
+        assert (result.created, result.failed) == (3, 0)
+        assert [r.status_code for r in result.results] == [201, 201, 201]
+        created = result.results[2].appointment
+        assert created is not None and created.service_id == "service-2"
+        service_repository.get_many.assert_called_once()
+        appointment_repository.find_conflicts.assert_called_once()
+        appointment_repository.bulk_create.assert_called_once()
+
+    async def test_reports_invalid_items_per_index(
+        self, appointment_repository, service_repository
+    ):
+        items = [
+            ("missing", TOMORROW),
+            ("inactive", TOMORROW),
+            ("service-1", datetime.now() - timedelta(days=1)),
+            ("service-1", TOMORROW),
+        ]
+
+        result = await _execute(items, appointment_repository, service_repository)
+
+        assert [(r.index, r.status_code) for r in result.results] == [
+            (0, 404),
+            (1, 400),
+            (2, 400),
+            (3, 201),
+        ]
+        assert result.results[0].detail == "Service not found"
+        assert (result.created, result.failed) == (1, 3)
+
+    async def test_rejects_items_conflicting_with_stored_appointments(
+        self, appointment_repository, service_repository
+    ):
+        appointment_repository.find_conflicts.return_value = {0}
+        items = [("service-1", TOMORROW), ("service-1", TOMORROW + timedelta(hours=2))]
+
+        result = await _execute(items, appointment_repository, service_repository)
+
+        assert [r.status_code for r in result.results] == [409, 201]
+        appointment_repository.find_conflicts.assert_called_once_with(
+            [
+                ("service-1", TOMORROW, 60),
+                ("service-1", TOMORROW + timedelta(hours=2), 60),
+            ]
+        )
+
+    async def test_rejects_later_items_overlapping_within_the_batch(
+        self, appointment_repository, service_repository
+    ):
+        items = [
+            ("service-1", TOMORROW + timedelta(minutes=30)),
+            ("service-1", TOMORROW),
+            ("service-1", TOMORROW + timedelta(minutes=80)),
+            ("service-1", TOMORROW + timedelta(minutes=90)),
+            ("service-2", TOMORROW),
+        ]
+
+        result = await _execute(items, appointment_repository, service_repository)
+
+        assert [r.status_code for r in result.results] == [201, 409, 409, 201, 201]
+
+    async def test_stored_conflict_does_not_block_overlapping_batch_items(
+        self, appointment_repository, service_repository
+    ):
+        appointment_repository.find_conflicts.return_value = {0}
+        items = [
+            ("service-1", TOMORROW),
+            ("service-1", TOMORROW + timedelta(minutes=30)),
+        ]
+
+        result = await _execute(items, appointment_repository, service_repository)
+
+        assert [r.status_code for r in result.results] == [409, 201]
+
+    async def test_conflict_on_insert_fails_every_accepted_item(
+        self, appointment_repository, service_repository
+    ):
+        appointment_repository.bulk_create.side_effect = AppointmentConflictError()
+        items = [
+            ("missing", TOMORROW),
+            ("service-1", TOMORROW),
+            ("service-2", TOMORROW),
+        ]
+
+        result = await _execute(items, appointment_repository, service_repository)
+
+        assert [r.status_code for r in result.results] == [404, 409, 409]
+        assert result.created == 0
+
+    async def test_token_without_sub_is_forbidden(
+        self, appointment_repository, service_repository
+    ):
+        dto = BulkCreateAppointmentsDto(
+            items=[CreateAppointmentDto(service_id="service-1", scheduled_at=TOMORROW)]
+        )
+
+        with pytest.raises(HTTPException) as exc_info:
+            await bulk_create_appointments(
+                dto,
+                principal=Principal(sub=None, roles=Role.CLIENT, claims={}),
+                appointment_repository=appointment_repository,
+                service_repository=service_repository,
+            )
+
+        assert exc_info.value.status_code == 403
+        appointment_repository.bulk_create.assert_not_called()
@@ -0,0 +1,61 @@
+from unittest.mock import AsyncMock, MagicMock
+import pytest
+from pydantic import ValidationError
+
+from t1_construcao.application.dtos import (
+    BulkCancelAppointmentsDto,
+    BulkConfirmAppointmentsDto,
+)
+from t1_construcao.application.usecases import (
+    BulkCancelAppointmentsUsecase,
+    BulkConfirmAppointmentsUsecase,
+)
+
+
+@pytest.fixture
+def appointment_repository():
+    repository = MagicMock()
+    repository.transition_status = AsyncMock(return_value=["a-1", "a-3"])
+    return repository
+
+
+class TestBulkStatusUsecases:
+
+    async def test_confirm_reports_updated_and_rejected_ids(
+        self, appointment_repository
+    ):
+        dto = BulkConfirmAppointmentsDto(appointment_ids=["a-1", "a-2", "a-3", "a-2"])
+
+        result = await BulkConfirmAppointmentsUsecase(
+            dto, appointment_repository
+        ).execute()
+
+        assert result.updated_ids == ["a-1", "a-3"]
+        assert result.rejected_ids == ["a-2"]
+        appointment_repository.transition_status.assert_called_once_with(
+            from_statuses=("pending",),
+            to_status="confirmed",
+            appointment_ids=["a-1", "a-2", "a-3", "a-2"],
+            user_id=None,
+            service_id=None,
+            start_date=None,
+            end_date=None,
+        )
+
+    async def test_cancel_by_filter_appends_reason(self, appointment_repository):
+        dto = BulkCancelAppointmentsDto(service_id="service-1", reason="Closed")
+
+        result = await BulkCancelAppointmentsUsecase(
+            dto, appointment_repository
+        ).execute()
+
+        assert result.updated_ids == ["a-1", "a-3"]
+        assert result.rejected_ids == []
+        kwargs = appointment_repository.transition_status.call_args.kwargs
+        assert kwargs["from_statuses"] == ("pending", "confirmed")
+        assert kwargs["to_status"] == "cancelled"
+        assert kwargs["note"] == "[Cancellation reason: Closed]"
+
+    def test_selection_is_required(self):
+        with pytest.raises(ValidationError):
+            BulkConfirmAppointmentsDto()
@@ -0,0 +1,167 @@
+from datetime import datetime, timedelta
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+import pytest
+from fastapi import HTTPException
+
+from t1_construcao.application.dtos import AppointmentResponseDto, CreateAppointmentDto
+from t1_construcao.application.usecases.create_appointment_usecase import (
+    CreateAppointmentUsecase,
+)
+from t1_construcao.domain import (
+    AppointmentConflictError,
+    AppointmentEntity,
+    ServiceEntity,
+)
+
+
+@pytest.fixture
+def service_entity():
+    now = datetime.now()
+    return ServiceEntity(
+        id="service-1",
+        name="Haircut",
+        description="Haircut",
+        duration_minutes=60,
+        price=Decimal("50.00"),
+        is_active=True,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+@pytest.fixture
+def create_appointment_dto():
+    return CreateAppointmentDto(
+        service_id="service-1", scheduled_at=datetime.now() + timedelta(days=1)
+    )
+
+
+@pytest.fixture
+def service_repository(service_entity):
+    repository = MagicMock()
+    repository.get_by_id = AsyncMock(return_value=service_entity)
+    return repository
+
+
+@pytest.fixture
+def appointment_repository(create_appointment_dto):
+    async def _create(user_id, service_id, scheduled_at, notes=None):
+        now = datetime.now()
+        return AppointmentEntity(
+            id="appointment-1",
+            user_id=user_id,
+            service_id=service_id,
+            scheduled_at=scheduled_at,
+            status="pending",
+            notes=notes,
+            created_at=now,
+            updated_at=now,
+        )
+
+    repository = MagicMock()
+    repository.enforces_no_overlap = False
+    repository.check_conflict = AsyncMock(return_value=False)
+    repository.create = AsyncMock(side_effect=_create)
+    return repository
+
+
+def _usecase(dto, appointment_repository, service_repository):
+    return CreateAppointmentUsecase(
+        user_id="user-1",
+        create_appointment_dto=dto,
+        appointment_repository=appointment_repository,
+        service_repository=service_repository,
+    )
+
+
+class TestCreateAppointmentUsecase:
+
+    async def test_execute_success(
+        self, create_appointment_dto, appointment_repository, service_repository
+    ):
+        usecase = _usecase(
+            create_appointment_dto, appointment_repository, service_repository
+        )
+
+        result = await usecase.execute()
+
+        assert isinstance(result, AppointmentResponseDto)
+        assert result.user_id == "user-1"
+        assert result.status == "pending"
+        appointment_repository.check_conflict.assert_awaited_once_with(
+            service_id="service-1",
+            scheduled_at=create_appointment_dto.scheduled_at,
+            duration_minutes=60,
+        )
+
+    async def test_execute_service_not_found(
+        self, create_appointment_dto, appointment_repository, service_repository
+    ):
+        service_repository.get_by_id.return_value = None
+        usecase = _usecase(
+            create_appointment_dto, appointment_repository, service_repository
+        )
+
+        with pytest.raises(HTTPException) as exc_info:
+            await usecase.execute()
+
+        assert exc_info.value.status_code == 404
+        appointment_repository.create.assert_not_called()
+
+    async def test_execute_in_the_past(
+        self, appointment_repository, service_repository
+    ):
+        dto = CreateAppointmentDto(
+            service_id="service-1", scheduled_at=datetime.now() - timedelta(hours=1)
+        )
+        usecase = _usecase(dto, appointment_repository, service_repository)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await usecase.execute()
+
+        assert exc_info.value.status_code == 400
+
+    async def test_execute_conflict_from_pre_check(
+        self, create_appointment_dto, appointment_repository, service_repository
+    ):
+        appointment_repository.check_conflict.return_value = True
+        usecase = _usecase(
+            create_appointment_dto, appointment_repository, service_repository
+        )
+
+        with pytest.raises(HTTPException) as exc_info:
+            await usecase.execute()
+
+        assert exc_info.value.status_code == 409
+        appointment_repository.create.assert_not_called()
+
+    async def test_execute_with_enforced_overlap_skips_pre_check(
+        self, create_appointment_dto, appointment_repository, service_repository
+    ):
+        appointment_repository.enforces_no_overlap = True
+        usecase = _usecase(
+            create_appointment_dto, appointment_repository, service_repository
+        )
+
+        await usecase.execute()
+
+        appointment_repository.check_conflict.assert_not_called()
+        appointment_repository.create.assert_awaited_once()
+
+    async def test_execute_with_enforced_overlap_maps_violation_to_409(
+        self, create_appointment_dto, appointment_repository, service_repository
+    ):
+        appointment_repository.enforces_no_overlap = True
+        appointment_repository.create.side_effect = AppointmentConflictError()
+        usecase = _usecase(
+            create_appointment_dto, appointment_repository, service_repository
+        )
+
+        with pytest.raises(HTTPException) as exc_info:
+            await usecase.execute()
+
+        assert exc_info.value.status_code == 409
+        assert (
+            exc_info.value.detail == "There is a scheduling conflict for this time slot"
+        )
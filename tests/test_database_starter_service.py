@@ -0,0 +1,56 @@
+from unittest.mock import AsyncMock, MagicMock
+import pytest
+
+from t1_construcao.infrastructure import database_starter_service
+from t1_construcao.infrastructure.database_starter_service import (
+    DatabaseStarterService,
+)
+
+
+@pytest.fixture
+def starter(mocker):
+    tortoise = mocker.patch.object(database_starter_service, "Tortoise")
+    tortoise.init = AsyncMock()
+    tortoise.generate_schemas = AsyncMock()
+    tortoise.get_connection = MagicMock()
+    mocker.patch.object(database_starter_service, "detect_trigram_search", AsyncMock())
+    return DatabaseStarterService()
+
+
+class TestOverlapConstraintCheck:
+
+    async def test_constraint_mode_requires_the_migrated_constraint(
+        self, starter, mocker
+    ):
+        mocker.patch.object(
+            database_starter_service, "OVERLAP_ENFORCEMENT", "constraint"
+        )
+        mocker.patch.object(
+            database_starter_service,
+            "is_overlap_constraint_installed",
+            AsyncMock(return_value=False),
+        )
+
+        with pytest.raises(RuntimeError, match="aerich upgrade"):
+            await starter.startup()
+
+    async def test_constraint_mode_starts_with_the_constraint(self, starter, mocker):
+        mocker.patch.object(
+            database_starter_service, "OVERLAP_ENFORCEMENT", "constraint"
+        )
+        mocker.patch.object(
+            database_starter_service,
+            "is_overlap_constraint_installed",
+            AsyncMock(return_value=True),
+        )
+
+        await starter.startup()
+
+    async def test_query_mode_does_not_look_for_the_constraint(self, starter, mocker):
+        installed = mocker.patch.object(
+            database_starter_service, "is_overlap_constraint_installed", AsyncMock()
+        )
+
+        await starter.startup()
+
+        installed.assert_not_called()
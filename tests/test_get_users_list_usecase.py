@@ -0,0 +1,71 @@
+import pytest
+from fastapi import HTTPException
+
+from t1_construcao.application.dtos.user_dtos import UserListFilterDto
+from t1_construcao.application.usecases.get_users_list import GetUsersListUsecase
+
+
+class TestGetUsersListUsecase:
+
+    @pytest.fixture
+    async def repository(self, mock_user_repository):
+        for i in range(5):
+            await mock_user_repository.create(f"User {i}")
+        return mock_user_repository
+
+    @pytest.mark.asyncio
+    async def test_offset_page_returns_next_cursor(self, repository):
+        usecase = GetUsersListUsecase(
+            UserListFilterDto(page=1, page_size=2), repository
+        )
+
+        users, total, next_cursor = await usecase.execute()
+
+        assert [u.id for u in users] == ["1", "2"]
+        assert total == 5
+        assert next_cursor == "2"
+
+    @pytest.mark.asyncio
+    async def test_cursor_is_passed_to_repository(self, repository):
+        usecase = GetUsersListUsecase(
+            UserListFilterDto(page_size=2, cursor="4"), repository
+        )
+
+        users, total, next_cursor = await usecase.execute()
+
+        assert [u.id for u in users] == ["5"]
+        assert total == 5
+        assert next_cursor is None
+        repository.get_all.assert_called_once_with(
+            role=None,
+            name=None,
+            page=1,
+            page_size=2,
+            cursor="4",
+            include_total="exact",
+            rank_by_similarity=False,
+        )
+
+    @pytest.mark.asyncio
+    async def test_total_can_be_skipped(self, repository):
+        usecase = GetUsersListUsecase(
+            UserListFilterDto(page_size=2, include_total="none"), repository
+        )
+
+        users, total, next_cursor = await usecase.execute()
+
+        assert len(users) == 2
+        assert total is None
+        assert next_cursor == "2"
+
+    @pytest.mark.asyncio
+    async def test_invalid_cursor_raises_400(self, repository):
+        usecase = GetUsersListUsecase(
+            UserListFilterDto(cursor="not-a-cursor"), repository
+        )
+
+        with pytest.raises(HTTPException) as exc_info:
+            await usecase.execute()
+
+        assert exc_info.value.status_code == 400
+        assert exc_info.value.detail == "Invalid cursor"
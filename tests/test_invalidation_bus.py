@@ -0,0 +1,242 @@
+import asyncio
+import json
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+import asyncpg
+import pytest
+from tortoise import connections
+from tortoise.exceptions import OperationalError
+
+from t1_construcao.infrastructure import CacheInvalidationService
+from t1_construcao.infrastructure import cache_invalidation_service
+from t1_construcao.infrastructure.repositories import ServiceRepository
+from t1_construcao.infrastructure.repositories import _invalidation_bus
+from t1_construcao.infrastructure.repositories._invalidation_bus import (
+    INVALIDATION_CHANNEL,
+    apply_payload,
+)
+from t1_construcao.infrastructure.repositories._local_caches import (
+    appointment_interval_index,
+    service_cache,
+)
+
+
+def _message(*events, origin="other-worker"):
+    return json.dumps({"origin": origin, "events": list(events)})
+
+
+@pytest.fixture
+def interval_index():
+    appointment_interval_index.load([], {"service-1": 60})
+    yield appointment_interval_index
+    appointment_interval_index.load([], {})
+    appointment_interval_index.loaded = False
+
+
+async def _eventually(predicate, timeout=2.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        assert asyncio.get_running_loop().time() < deadline, "event not applied"
+        await asyncio.sleep(0.02)
+
+
+class _DroppedConnection:
+    """An asyncpg connection that is terminated as soon as it subscribes."""
+
+    def add_termination_listener(self, callback):
+        self._on_terminate = callback
+
+    async def add_listener(self, _channel, _callback):
+        self._on_terminate(self)
+
+    def is_closed(self):
+        return True
+
+    async def close(self):
+        pass
+
+
+@pytest.fixture
+def postgres_dialect(mocker):
+    mocker.patch.object(
+        cache_invalidation_service.connections, "get"
+    ).return_value.capabilities.dialect = "postgres"
+
+
+class TestCacheInvalidationService:
+
+    async def test_keeps_listening_when_the_cache_reset_fails(
+        self, postgres_dialect, mocker
+    ):
+        mocker.patch.object(
+            cache_invalidation_service.asyncpg,
+            "connect",
+            side_effect=lambda **_: _DroppedConnection(),
+        )
+
+        def fail_once():
+            if reset.call_count == 1:
+                raise OperationalError("connection refused")
+
+        reset = mocker.patch.object(
+            cache_invalidation_service, "reset_local_caches", side_effect=fail_once
+        )
+        service = CacheInvalidationService(enabled=True, retry_interval=0.01)
+
+        await service.startup()
+        await _eventually(lambda: reset.call_count >= 2)
+        await service.shutdown()
+
+    async def test_startup_returns_when_the_first_connect_fails(
+        self, postgres_dialect, mocker
+    ):
+        connect = mocker.patch.object(
+            cache_invalidation_service.asyncpg,
+            "connect",
+            side_effect=asyncpg.InterfaceError("pool is closing"),
+        )
+        service = CacheInvalidationService(enabled=True, retry_interval=0.01)
+
+        await asyncio.wait_for(service.startup(), timeout=2)
+        await _eventually(lambda: connect.call_count >= 2)
+        await service.shutdown()
+
+
+class TestPayloads:
+
+    def test_large_batches_are_split_under_the_notify_limit(self):
+        events = [
+            {"entity": "appointments", "op": "status", "id": f"{i:036d}"}
+            for i in range(500)
+        ]
+
+        payloads = _invalidation_bus._payloads(events)
+
+        assert len(payloads) > 1
+        assert all(len(payload) < 8000 for payload in payloads)
+        decoded = [e for p in payloads for e in json.loads(p)["events"]]
+        assert decoded == events
+
+
+class TestApplyPayload:
+
+    async def test_appointment_events_update_the_interval_index(self, interval_index):
+        start = datetime(2030, 1, 1, 10, tzinfo=timezone.utc)
+        await apply_payload(
+            _message(
+                {
+                    "entity": "appointments",
+                    "op": "upsert",
+                    "id": "a-1",
+                    "service_id": "service-1",
+                    "scheduled_at": start.isoformat(),
+                    "status": "pending",
+                }
+            )
+        )
+        assert interval_index.has_conflict("service-1", start, 60)
+
+        await apply_payload(
+            _message(
+                {
+                    "entity": "appointments",
+                    "op": "status",
+                    "id": "a-1",
+                    "status": "cancelled",
+                }
+            )
+        )
+        assert not interval_index.has_conflict("service-1", start, 60)
+
+    async def test_service_events_update_durations(self, interval_index):
+        start = datetime(2030, 1, 1, 10, tzinfo=timezone.utc)
+        interval_index.upsert("a-1", "service-1", start, "pending")
+
+        await apply_payload(
+            _message(
+                {
+                    "entity": "services",
+                    "op": "upsert",
+                    "id": "service-1",
+                    "duration_minutes": 120,
+                }
+            )
+        )
+
+        assert interval_index.has_conflict("service-1", start + timedelta(hours=1), 30)
+
+    async def test_own_events_are_ignored(self, interval_index):
+        await apply_payload(
+            _message(
+                {"entity": "services", "op": "delete", "id": "service-1"},
+                origin=_invalidation_bus.PROCESS_ID,
+            )
+        )
+
+        interval_index.upsert("a-1", "service-1", datetime(2030, 1, 1), "pending")
+        assert interval_index.has_conflict("service-1", datetime(2030, 1, 1), 60)
+
+
+@pytest.mark.integration
+class TestInvalidationBus:
+
+    @pytest.fixture
+    async def service(self, clean_db, memory_service_cache):
+        return await ServiceRepository().create(
+            name="Haircut",
+            description="Haircut",
+            duration_minutes=60,
+            price=Decimal("50.00"),
+        )
+
+    async def test_repository_writes_are_published(
+        self, service, test_db_url, monkeypatch
+    ):
+        monkeypatch.setattr(_invalidation_bus, "INVALIDATION_BUS_ENABLED", True)
+        listener = await asyncpg.connect(test_db_url)
+        received = []
+        await listener.add_listener(
+            INVALIDATION_CHANNEL, lambda *args: received.append(json.loads(args[3]))
+        )
+        try:
+            await ServiceRepository().update(service.id, duration_minutes=90)
+            await _eventually(lambda: received)
+        finally:
+            await listener.close()
+
+        assert received[0]["origin"] == _invalidation_bus.PROCESS_ID
+        assert received[0]["events"] == [
+            {
+                "entity": "services",
+                "op": "upsert",
+                "id": service.id,
+                "duration_minutes": 90,
+            }
+        ]
+
+    async def test_listener_applies_events_from_other_workers(
+        self, service, test_db_url
+    ):
+        invalidation_service = CacheInvalidationService(
+            enabled=True, database_url=test_db_url
+        )
+        await invalidation_service.startup()
+        try:
+            assert await service_cache.get(service.id) == service
+
+            await connections.get("default").execute_query(
+                "SELECT pg_notify($1, $2)",
+                [
+                    INVALIDATION_CHANNEL,
+                    _message({"entity": "services", "op": "delete", "id": service.id}),
+                ],
+            )
+
+            for _ in range(100):
+                if await service_cache.get(service.id) is None:
+                    break
+                await asyncio.sleep(0.02)
+            else:
+                pytest.fail("event not applied")
+        finally:
+            await invalidation_service.shutdown()
@@ -0,0 +1,162 @@
+from datetime import datetime, timezone
+from decimal import Decimal
+import msgspec
+import pytest
+from fastapi.testclient import TestClient
+
+from t1_construcao.main import app
+from t1_construcao.controllers import (
+    appointment_controller,
+    service_controller,
+    user_controller,
+)
+from t1_construcao.application.dtos import (
+    AppointmentExpandedResponseDto,
+    AppointmentExpandedResponseStruct,
+    AppointmentResponseDto,
+    AppointmentResponseStruct,
+    PaginatedResponse,
+    PaginatedResponseStruct,
+    ServiceResponseDto,
+    ServiceResponseStruct,
+    UserResponseDto,
+    UserResponseStruct,
+)
+from t1_construcao.domain import AppointmentEntity, ServiceEntity, UserEntity
+from t1_construcao.infrastructure import (
+    AppointmentRepository,
+    ServiceRepository,
+    UserRepository,
+)
+from t1_construcao.shared.auth import get_current_user_payload
+
+ADMIN_PAYLOAD = {"sub": "admin-uuid-12345", "cognito:groups": ["admin"]}
+HEADERS = {"Authorization": "Bearer fake-admin-token"}
+
+CREATED_AT = datetime(2030, 1, 1, 9, 30, 15, 123456, tzinfo=timezone.utc)
+
+SERVICE = ServiceEntity(
+    id="service-1",
+    name="Corte de cabelo",
+    description="Corte clássico",
+    duration_minutes=60,
+    price=Decimal("50.00"),
+    is_active=True,
+    created_at=CREATED_AT,
+    updated_at=CREATED_AT,
+)
+USER = UserEntity(id="user-1", name="João", role="client")
+APPOINTMENTS = [
+    AppointmentEntity(
+        id=f"appointment-{i}",
+        user_id=USER.id,
+        service_id=SERVICE.id,
+        scheduled_at=datetime(2030, 1, 2, 10 + i, 0),
+        status="pending",
+        notes="Chegar 10 minutos antes" if i % 2 else None,
+        created_at=CREATED_AT,
+        updated_at=CREATED_AT,
+    )
+    for i in range(3)
+]
+
+
+@pytest.mark.parametrize(
+    "struct, dto",
+    [
+        (UserResponseStruct, UserResponseDto),
+        (ServiceResponseStruct, ServiceResponseDto),
+        (AppointmentResponseStruct, AppointmentResponseDto),
+        (AppointmentExpandedResponseStruct, AppointmentExpandedResponseDto),
+        (PaginatedResponseStruct, PaginatedResponse),
+    ],
+)
+def test_structs_mirror_the_dtos(struct, dto):
+    assert struct.__struct_fields__ == tuple(dto.model_fields)
+
+
+@pytest.fixture
+def test_client(mocker):
+    mocker.patch.object(
+        AppointmentRepository,
+        "get_all",
+        side_effect=_get_all,
+    )
+    mocker.patch.object(
+        AppointmentRepository, "get_by_id", return_value=APPOINTMENTS[1]
+    )
+    mocker.patch.object(
+        ServiceRepository, "get_many", return_value={SERVICE.id: SERVICE}
+    )
+    mocker.patch.object(UserRepository, "get_many", return_value={USER.id: USER})
+    mocker.patch.object(ServiceRepository, "get_all", return_value=([SERVICE], 1, None))
+    mocker.patch.object(ServiceRepository, "get_by_id", return_value=SERVICE)
+    mocker.patch.object(UserRepository, "get_all", return_value=([USER], 1, None))
+    mocker.patch.object(UserRepository, "get_by_id", return_value=USER)
+    app.dependency_overrides[get_current_user_payload] = lambda: ADMIN_PAYLOAD
+    with TestClient(app) as c:
+        yield c
+    app.dependency_overrides = {}
+
+
+async def _get_all(fields=None, **_):
+    if fields is None:
+        return APPOINTMENTS, 3, "next"
+    rows = [
+        {field: getattr(appointment, field) for field in fields}
+        for appointment in APPOINTMENTS
+    ]
+    return rows, None, None
+
+
+@pytest.mark.parametrize(
+    "controller, url",
+    [
+        (appointment_controller, "/api/v1/appointments/"),
+        (appointment_controller, "/api/v1/appointments/?expand=service,user"),
+        (
+            appointment_controller,
+            "/api/v1/appointments/?fields=id,scheduled_at,notes&expand=user",
+        ),
+        (appointment_controller, "/api/v1/appointments/appointment-1"),
+        (appointment_controller, "/api/v1/appointments/appointment-1?expand=service"),
+        (service_controller, "/api/v1/services/"),
+        (service_controller, "/api/v1/services/service-1"),
+        (user_controller, "/api/v1/users/"),
+        (user_controller, "/api/v1/users/user-1"),
+    ],
+)
+def test_msgspec_body_matches_pydantic(test_client, monkeypatch, controller, url):
+    pydantic_response = test_client.get(url, headers=HEADERS)
+    monkeypatch.setattr(controller, "MSGSPEC_RESPONSES", True)
+    msgspec_response = test_client.get(url, headers=HEADERS)
+
+    assert pydantic_response.status_code == msgspec_response.status_code == 200
+    assert msgspec_response.headers["content-type"] == "application/json"
+    assert msgspec_response.content == pydantic_response.content
+
+
+def test_msgspec_path_keeps_the_openapi_schema(monkeypatch):
+    schema = app.openapi()
+    for controller in (appointment_controller, service_controller, user_controller):
+        monkeypatch.setattr(controller, "MSGSPEC_RESPONSES", True)
+    app.openapi_schema = None
+    try:
+        assert app.openapi() == schema
+    finally:
+        app.openapi_schema = None
+
+
+def test_structs_encode_to_json():
+    page = PaginatedResponseStruct(
+        items=[AppointmentResponseStruct(**APPOINTMENTS[0].__dict__)],
+        total=1,
+        page=1,
+        page_size=10,
+        total_pages=1,
+    )
+
+    decoded = msgspec.json.decode(msgspec.json.encode(page))
+
+    assert decoded["items"][0]["scheduled_at"] == "2030-01-02T10:00:00"
+    assert decoded["next_cursor"] is None
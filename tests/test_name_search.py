@@ -0,0 +1,99 @@
+import pytest
+from tortoise import Tortoise
+
+from t1_construcao.domain import InvalidCursorError
+from t1_construcao.infrastructure import _trigram_search
+from t1_construcao.infrastructure.repositories import UserRepository
+
+pytestmark = pytest.mark.integration
+
+
+async def _pg_trgm_available() -> bool:
+    rows = await Tortoise.get_connection("default").execute_query_dict(
+        "SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'"
+    )
+    return bool(rows)
+
+
+@pytest.fixture
+async def users(clean_db):
+    repository = UserRepository()
+    names = ["Maria Silva", "Mariana Souza", "Ana Maria", "João Pedro", "Mario"]
+    created = [await repository.create(name) for name in names]
+    yield created
+    _trigram_search._available = False
+
+
+@pytest.fixture
+async def trigram_migration(users, run_migration):
+    await run_migration("trigram_name_search")
+    yield users
+    await run_migration("trigram_name_search", downgrade=True)
+
+
+class TestDetectTrigramSearch:
+
+    async def test_reports_whether_pg_trgm_is_installed(self, trigram_migration):
+        expected = await _pg_trgm_available()
+
+        available = await _trigram_search.detect_trigram_search(
+            Tortoise.get_connection("default")
+        )
+
+        assert available is expected
+        assert _trigram_search.is_trigram_search_available() is expected
+
+    async def test_does_not_change_the_schema(self, users, mocker):
+        connection = Tortoise.get_connection("default")
+        execute_script = mocker.spy(connection, "execute_script")
+
+        await _trigram_search.detect_trigram_search(connection)
+
+        execute_script.assert_not_called()
+
+    async def test_search_works_with_or_without_indexes(self, trigram_migration):
+        await _trigram_search.detect_trigram_search(Tortoise.get_connection("default"))
+
+        found, total, _ = await UserRepository().get_all(name="mari")
+
+        assert total == 4
+        assert {u.name for u in found} == {
+            "Maria Silva",
+            "Mariana Souza",
+            "Ana Maria",
+            "Mario",
+        }
+
+
+class TestRankBySimilarity:
+
+    async def test_ranks_closest_names_first(self, trigram_migration):
+        if not await _pg_trgm_available():
+            pytest.skip("pg_trgm extension is not available")
+        await _trigram_search.detect_trigram_search(Tortoise.get_connection("default"))
+
+        found, _, next_cursor = await UserRepository().get_all(
+            name="maria", page_size=2, rank_by_similarity=True
+        )
+
+        assert [u.name for u in found][0] in {"Maria Silva", "Ana Maria"}
+        assert next_cursor is None
+
+    async def test_ignored_without_pg_trgm(self, users):
+        _trigram_search._available = False
+
+        found, total, next_cursor = await UserRepository().get_all(
+            name="mari", page_size=2, rank_by_similarity=True
+        )
+
+        assert [u.id for u in found] == sorted(u.id for u in found)
+        assert total == 4
+        assert next_cursor is not None
+
+    async def test_cursor_is_rejected_when_ranking(self, users):
+        _trigram_search._available = True
+
+        with pytest.raises(InvalidCursorError):
+            await UserRepository().get_all(
+                name="mari", cursor="anything", rank_by_similarity=True
+            )
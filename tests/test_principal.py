@@ -0,0 +1,75 @@
+import pytest
+from fastapi import HTTPException
+
+from t1_construcao.shared.auth import (
+    check_admin_or_self,
+    get_admin_user,
+    get_client_user,
+    get_operator_user,
+)
+from t1_construcao.shared.principal import Principal, Role
+
+
+class TestPrincipal:
+
+    def test_from_claims_builds_role_bitmask(self):
+        claims = {"sub": "user-1", "cognito:groups": ["operator", "client"]}
+
+        principal = Principal.from_claims(claims)
+
+        assert principal.sub == "user-1"
+        assert principal.roles == Role.OPERATOR | Role.CLIENT
+        assert principal.claims is claims
+        assert principal.is_staff
+        assert not principal.is_admin
+
+    def test_unknown_and_missing_groups_have_no_roles(self):
+        assert Principal.from_claims({"cognito:groups": ["user"]}).roles == Role.NONE
+        assert Principal.from_claims({"sub": "user-1"}).roles == Role.NONE
+
+    def test_owns(self):
+        principal = Principal.from_claims({"sub": "user-1"})
+
+        assert principal.owns("user-1")
+        assert not principal.owns("user-2")
+        assert not Principal.from_claims({}).owns(None)
+
+    def test_is_slotted_and_immutable(self):
+        principal = Principal.from_claims({"sub": "user-1"})
+
+        assert not hasattr(principal, "__dict__")
+        with pytest.raises(AttributeError):
+            principal.sub = "user-2"  # type: ignore[misc]
+
+
+class TestRbacDependencies:
+
+    @pytest.mark.parametrize(
+        "dependency, groups, allowed",
+        [
+            (get_admin_user, ["admin"], True),
+            (get_admin_user, ["operator"], False),
+            (get_operator_user, ["operator"], True),
+            (get_operator_user, ["client"], False),
+            (get_client_user, ["client"], True),
+            (get_client_user, ["user"], False),
+        ],
+    )
+    def test_role_dependencies(self, dependency, groups, allowed):
+        principal = Principal.from_claims({"sub": "user-1", "cognito:groups": groups})
+
+        if allowed:
+            assert dependency(principal) is principal
+        else:
+            with pytest.raises(HTTPException) as exc_info:
+                dependency(principal)
+            assert exc_info.value.status_code == 403
+
+    def test_check_admin_or_self(self):
+        client = Principal.from_claims({"sub": "user-1", "cognito:groups": ["client"]})
+        admin = Principal.from_claims({"sub": "admin-1", "cognito:groups": ["admin"]})
+
+        assert check_admin_or_self("user-1", client) is client
+        assert check_admin_or_self("user-1", admin) is admin
+        with pytest.raises(HTTPException):
+            check_admin_or_self("user-2", client)
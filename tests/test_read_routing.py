@@ -0,0 +1,152 @@
+import asyncio
+from datetime import datetime, timedelta
+from decimal import Decimal
+import pytest
+from tortoise import connections
+
+from t1_construcao.application.dtos import ConfirmAppointmentDto
+from t1_construcao.controllers.appointment_controller import confirm_appointment
+from t1_construcao.infrastructure.repositories import (
+    AppointmentRepository,
+    ServiceRepository,
+    UserRepository,
+)
+from t1_construcao.infrastructure.repositories._local_caches import service_cache
+from t1_construcao.infrastructure.repositories._read_routing import (
+    REPLICA_CONNECTION,
+    read_connection,
+    read_from_primary,
+)
+
+pytestmark = pytest.mark.integration
+
+
+def _spy_queries(mocker, client):
+    return [
+        mocker.spy(client, "execute_query"),
+        mocker.spy(client, "execute_query_dict"),
+    ]
+
+
+def _query_count(spies):
+    return sum(spy.call_count for spy in spies)
+
+
+@pytest.fixture
+async def replica(clean_db):
+    """A 'replica' alias pointing at the test database, with its own pool."""
+    connections.db_config[REPLICA_CONNECTION] = connections.db_config["default"]
+    client = connections.get(REPLICA_CONNECTION)
+    yield client
+    await client.close()
+    connections._get_storage().pop(REPLICA_CONNECTION, None)
+    del connections.db_config[REPLICA_CONNECTION]
+
+
+async def _in_new_request(coroutine):
+    """Run in a fresh task, the way each request gets its own context."""
+    return await asyncio.create_task(coroutine)
+
+
+class TestReadRouting:
+
+    async def test_primary_without_replica(self, clean_db):
+        assert read_connection() is connections.get("default")
+
+    async def test_list_and_detail_reads_use_the_replica(self, replica, mocker):
+        async def seed():
+            return await UserRepository().create("Replica User")
+
+        user = await _in_new_request(seed())
+        replica_spies = _spy_queries(mocker, replica)
+        primary_spies = _spy_queries(mocker, connections.get("default"))
+
+        async def read():
+            assert await UserRepository().get_by_id(user.id) == user
+            users, total, _ = await UserRepository().get_all()
+            assert users == [user] and total == 1
+
+        await _in_new_request(read())
+
+        assert _query_count(replica_spies) == 3
+        assert _query_count(primary_spies) == 0
+
+    async def test_batch_reads_use_the_replica(self, replica, mocker):
+        async def seed():
+            user = await UserRepository().create("Replica User")
+            service = await ServiceRepository().create(
+                name="Haircut",
+                description="Haircut",
+                duration_minutes=60,
+                price=Decimal("50.00"),
+            )
+            return user, service
+
+        user, service = await _in_new_request(seed())
+        replica_spies = _spy_queries(mocker, replica)
+        primary_spies = _spy_queries(mocker, connections.get("default"))
+
+        async def read():
+            assert await UserRepository().get_many([user.id]) == {user.id: user}
+            assert await ServiceRepository().get_many([service.id]) == {
+                service.id: service
+            }
+
+        await _in_new_request(read())
+
+        assert _query_count(replica_spies) == 2
+        assert _query_count(primary_spies) == 0
+
+    async def test_reads_after_a_write_use_the_primary(self, replica, mocker):
+        replica_spies = _spy_queries(mocker, replica)
+
+        async def write_then_read():
+            service = await ServiceRepository().create(
+                name="Haircut",
+                description="Haircut",
+                duration_minutes=60,
+                price=Decimal("50.00"),
+            )
+            await service_cache.clear()
+            assert await ServiceRepository().get_by_id(service.id) == service
+            _, total, _ = await AppointmentRepository().get_all()
+            assert total == 0
+
+        await _in_new_request(write_then_read())
+
+        assert _query_count(replica_spies) == 0
+
+    async def test_read_from_primary_block(self, replica):
+        with read_from_primary():
+            assert read_connection() is connections.get("default")
+        assert read_connection() is replica
+
+    async def test_status_change_reads_the_row_from_the_primary(self, replica, mocker):
+        async def seed():
+            user = await UserRepository().create("Replica User")
+            service = await ServiceRepository().create(
+                name="Haircut",
+                description="Haircut",
+                duration_minutes=60,
+                price=Decimal("50.00"),
+            )
+            return await AppointmentRepository().create(
+                user_id=user.id,
+                service_id=service.id,
+                scheduled_at=datetime.now() + timedelta(days=1),
+            )
+
+        appointment = await _in_new_request(seed())
+        replica_spies = _spy_queries(mocker, replica)
+
+        confirmed = await _in_new_request(
+            confirm_appointment(
+                appointment.id,
+                ConfirmAppointmentDto(),
+                _operator=mocker.Mock(),
+                appointment_repository=AppointmentRepository(),
+            )
+        )
+
+        assert confirmed.status == "confirmed"
+        assert _query_count(replica_spies) == 0
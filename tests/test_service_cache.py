@@ -0,0 +1,156 @@
+from datetime import datetime
+from decimal import Decimal
+import pytest
+
+from t1_construcao.domain import ServiceEntity
+from t1_construcao.infrastructure.models import Service
+from t1_construcao.infrastructure.repositories import ServiceRepository
+from t1_construcao.infrastructure.repositories import _service_cache
+from t1_construcao.infrastructure.repositories._service_cache import (
+    InMemoryCacheBackend,
+    RedisCacheBackend,
+    create_cache_backend,
+)
+from t1_construcao.infrastructure.repositories._local_caches import service_cache
+
+
+def _service(service_id="service-1", name="Haircut"):
+    now = datetime.now()
+    return ServiceEntity(
+        id=service_id,
+        name=name,
+        description="Haircut",
+        duration_minutes=60,
+        price=Decimal("50.00"),
+        is_active=True,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+class FakeRedis:
+    """Local stand-in for the redis.asyncio.Redis subset used by the backend."""
+
+    def __init__(self):
+        self.data: dict[str, tuple[bytes, int | None]] = {}
+
+    async def get(self, key):
+        entry = self.data.get(key)
+        return entry[0] if entry else None
+
+    async def set(self, key, value, ex=None):
+        self.data[key] = (value, ex)
+
+    async def delete(self, key):
+        self.data.pop(key, None)
+
+    async def scan_iter(self, match):
+        for key in list(self.data):
+            if key.startswith(match.rstrip("*")):
+                yield key
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(_service_cache.time, "monotonic", lambda: now[0])
+    return now
+
+
+class TestInMemoryCacheBackend:
+
+    async def test_entries_expire_after_ttl(self, clock):
+        backend = InMemoryCacheBackend()
+        service = _service()
+        await backend.set("service-1", service, ttl=60)
+
+        clock[0] += 59
+        assert await backend.get("service-1") is service
+        clock[0] += 1
+        assert await backend.get("service-1") is None
+        assert len(backend) == 0
+
+    async def test_evicts_least_recently_used(self, clock):
+        backend = InMemoryCacheBackend(max_size=2)
+        for key in ("a", "b"):
+            await backend.set(key, _service(key), ttl=60)
+        await backend.get("a")
+
+        await backend.set("c", _service("c"), ttl=60)
+
+        assert await backend.get("b") is None
+        for key in ("a", "c"):
+            cached = await backend.get(key)
+            assert cached is not None and cached.id == key
+
+
+class TestRedisCacheBackend:
+
+    async def test_round_trips_entities_as_json(self):
+        client = FakeRedis()
+        backend = RedisCacheBackend(client)
+        service = _service()
+
+        await backend.set("service-1", service, ttl=30)
+
+        assert client.data["t1:services:service-1"][1] == 30
+        assert await backend.get("service-1") == service
+
+    async def test_delete_and_clear(self):
+        client = FakeRedis()
+        client.data["other"] = (b"1", None)
+        backend = RedisCacheBackend(client)
+        await backend.set("a", _service("a"), ttl=30)
+        await backend.set("b", _service("b"), ttl=30)
+
+        await backend.delete("a")
+        assert await backend.get("a") is None
+
+        await backend.clear()
+        assert list(client.data) == ["other"]
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError, match="Unknown cache backend"):
+        create_cache_backend("memcached")
+
+
+@pytest.mark.integration
+class TestServiceRepositoryCache:
+
+    @pytest.fixture
+    async def service(self, clean_db, memory_service_cache):
+        return await ServiceRepository().create(
+            name="Haircut",
+            description="Haircut",
+            duration_minutes=60,
+            price=Decimal("50.00"),
+        )
+
+    async def test_get_by_id_is_served_from_cache(self, service, mocker):
+        filter_spy = mocker.spy(Service, "filter")
+        get_spy = mocker.spy(Service, "get")
+
+        assert await ServiceRepository().get_by_id(service.id) == service
+
+        filter_spy.assert_not_called()
+        get_spy.assert_not_called()
+
+    async def test_miss_reads_through(self, service):
+        await service_cache.clear()
+
+        assert await ServiceRepository().get_by_id(service.id) == service
+        assert await service_cache.get(service.id) == service
+
+    async def test_update_refreshes_entry(self, service):
+        await ServiceRepository().update(service.id, is_active=False)
+
+        cached = await service_cache.get(service.id)
+        assert cached is not None and cached.is_active is False
+        loaded = await ServiceRepository().get_by_id(service.id)
+        assert loaded is not None and loaded.is_active is False
+
+    async def test_delete_invalidates_entry(self, service):
+        await ServiceRepository().delete(service.id)
+
+        assert await service_cache.get(service.id) is None
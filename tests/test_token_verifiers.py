@@ -0,0 +1,96 @@
+import os
+import re
+import time
+import pytest
+
+from t1_construcao.shared.token_verifiers import (
+    TOKEN_VERIFIERS,
+    TokenClaimsError,
+    TokenExpiredError,
+    TokenVerificationError,
+    create_token_verifier,
+)
+
+
+@pytest.fixture(params=sorted(TOKEN_VERIFIERS))
+def verifier(request):
+    return create_token_verifier(
+        request.param, os.environ["JWT_ISSUER"], os.environ["JWT_AUDIENCE"]
+    )
+
+
+@pytest.fixture
+def public_key(verifier, signing_key):
+    return verifier.construct_key(signing_key[1])
+
+
+class TestTokenVerifiers:
+
+    def test_valid_token(self, verifier, public_key, signing_key, mint_token):
+        token = mint_token(signing_key[0], "kid-1", **{"cognito:groups": ["admin"]})
+
+        payload = verifier.verify(token, public_key)
+
+        assert payload["sub"] == "user-uuid-67890"
+        assert payload["cognito:groups"] == ["admin"]
+
+    def test_unverified_header(self, verifier, signing_key, mint_token):
+        token = mint_token(signing_key[0], "kid-1")
+
+        header = verifier.get_unverified_header(token)
+
+        assert header["kid"] == "kid-1"
+        assert header["alg"] == "RS256"
+
+    def test_token_without_audience_is_accepted(
+        self, verifier, public_key, signing_key, mint_token
+    ):
+        token = mint_token(signing_key[0], "kid-1", aud=None)
+
+        assert "aud" not in verifier.verify(token, public_key)
+
+    def test_expired_token(self, verifier, public_key, signing_key, mint_token):
+        token = mint_token(signing_key[0], "kid-1", exp=int(time.time()) - 10)
+
+        with pytest.raises(TokenExpiredError):
+            verifier.verify(token, public_key)
+
+    @pytest.mark.parametrize(
+        "claims, message",
+        [
+            ({"aud": "other-audience"}, "Invalid audience"),
+            ({"iss": "https://other-issuer.com"}, "Invalid issuer"),
+            ({"nbf": int(time.time()) + 3600}, "The token is not yet valid (nbf)"),
+        ],
+    )
+    def test_invalid_claims(
+        self, verifier, public_key, signing_key, mint_token, claims, message
+    ):
+        token = mint_token(signing_key[0], "kid-1", **claims)
+
+        with pytest.raises(TokenClaimsError, match=re.escape(message)):
+            verifier.verify(token, public_key)
+
+    def test_signature_from_other_key_is_rejected(
+        self, verifier, public_key, rotated_signing_key, mint_token
+    ):
+        token = mint_token(rotated_signing_key[0], "kid-1")
+
+        with pytest.raises(TokenVerificationError):
+            verifier.verify(token, public_key)
+
+    def test_tampered_payload_is_rejected(
+        self, verifier, public_key, signing_key, mint_token
+    ):
+        header, _, signature = mint_token(signing_key[0], "kid-1").split(".")
+        _, other_payload, _ = mint_token(
+            signing_key[0], "kid-1", sub="someone-else"
+        ).split(".")
+
+        with pytest.raises(TokenVerificationError):
+            verifier.verify(f"{header}.{other_payload}.{signature}", public_key)
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError, match="Unknown token verifier backend"):
+        create_token_verifier("unknown", "issuer", "audience")
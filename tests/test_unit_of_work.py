@@ -0,0 +1,119 @@
+import uuid
+from decimal import Decimal
+import pytest
+from fastapi import HTTPException
+
+from t1_construcao.infrastructure import ServiceRepository, UnitOfWork
+from t1_construcao.infrastructure.models import Service
+
+
+@pytest.fixture
+def unit_of_work(mock_user_repository):
+    return UnitOfWork(transactional=False, users=mock_user_repository)
+
+
+@pytest.fixture
+def users(unit_of_work):
+    return unit_of_work.users
+
+
+class TestIdentityMap:
+
+    async def test_get_by_id_loads_once(self, users, mock_user_repository):
+        user = await mock_user_repository.create("Jane")
+
+        assert await users.get_by_id(user.id) == user
+        assert await users.get_by_id(user.id) is await users.get_by_id(user.id)
+        mock_user_repository.get_by_id.assert_called_once_with(user.id)
+
+    async def test_missing_entity_is_remembered(self, users, mock_user_repository):
+        assert await users.get_by_id("missing") is None
+        assert await users.get_by_id("missing") is None
+        mock_user_repository.get_by_id.assert_called_once()
+
+    async def test_write_result_is_served_without_reading(
+        self, users, mock_user_repository
+    ):
+        user = await users.create("Jane")
+        updated = await users.update(user.id, name="Janet")
+
+        assert await users.get_by_id(user.id) == updated
+        mock_user_repository.get_by_id.assert_not_called()
+
+    async def test_write_clears_every_repository(
+        self, users, unit_of_work, mock_user_repository
+    ):
+        user = await mock_user_repository.create("Jane")
+        await users.get_by_id(user.id)
+        unit_of_work.services._identity_map["service-1"] = None
+
+        await users.delete(user.id)
+
+        assert await users.get_by_id(user.id) is None
+        assert mock_user_repository.get_by_id.call_count == 2
+        assert "service-1" not in unit_of_work.services._identity_map
+        assert unit_of_work.has_writes
+
+    async def test_reads_are_forwarded(self, users, mock_user_repository):
+        await users.get_all()
+        await users.get_all()
+        assert mock_user_repository.get_all.call_count == 2
+
+
+@pytest.mark.integration
+class TestUnitOfWork:
+
+    async def _create_service(self, repository):
+        return await repository.create(
+            name="Haircut",
+            description="60 minute haircut",
+            duration_minutes=60,
+            price=Decimal("50.00"),
+        )
+
+    async def test_get_many_reuses_loaded_entities(self, clean_db, mocker):
+        service = await self._create_service(ServiceRepository())
+        get_many = mocker.spy(ServiceRepository(), "get_many")
+
+        missing_id = str(uuid.uuid4())
+
+        async with UnitOfWork(transactional=False) as unit_of_work:
+            loaded = await unit_of_work.services.get_by_id(service.id)
+            found = await unit_of_work.services.get_many([service.id, missing_id])
+
+        assert found == {service.id: loaded}
+        get_many.assert_called_once_with([missing_id])
+
+    async def test_transaction_commits(self, clean_db):
+        async with UnitOfWork(transactional=True) as unit_of_work:
+            service = await self._create_service(unit_of_work.services)
+
+        assert await ServiceRepository().get_by_id(service.id) is not None
+
+    async def test_transaction_rolls_back_and_resets_caches(self, clean_db, mocker):
+        reset = mocker.patch(
+            "t1_construcao.infrastructure.unit_of_work.reset_local_caches"
+        )
+
+        service = None
+        with pytest.raises(HTTPException):
+            async with UnitOfWork(transactional=True) as unit_of_work:
+                service = await self._create_service(unit_of_work.services)
+                raise HTTPException(status_code=409)
+
+        assert service is not None
+        assert not await Service.exists(id=service.id)
+        reset.assert_called_once()
+
+    async def test_rollback_without_writes_keeps_caches(self, clean_db, mocker):
+        service = await self._create_service(ServiceRepository())
+        reset = mocker.patch(
+            "t1_construcao.infrastructure.unit_of_work.reset_local_caches"
+        )
+
+        with pytest.raises(HTTPException):
+            async with UnitOfWork(transactional=True) as unit_of_work:
+                await unit_of_work.services.get_by_id(service.id)
+                raise HTTPException(status_code=404)
+
+        reset.assert_not_called()